@@ -10,5 +10,11 @@ while ! pg_isready -h "${DB_HOST:-postgres}" -p "${DB_PORT:-5432}" -U "${DB_USER
 done
 echo "PostgreSQL is ready!"
 
+# Файлы метрик прошлых процессов искажают счётчики — каталог очищается
+if [ -n "${PROMETHEUS_MULTIPROC_DIR}" ]; then
+    rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+    mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+fi
+
 echo "Starting Celery worker..."
 exec "$@"
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Composite ticker/timestamp covering index
+
+Revision ID: a3c91e7d4b20
+Revises: 5bf0a5d0ef9c
+Create Date: 2026-10-17 10:12:41.518334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e7d4b20'
+down_revision: Union[str, Sequence[str], None] = '5bf0a5d0ef9c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_pricerecords_ticker_timestamp',
+        'pricerecords',
+        ['ticker', sa.text('timestamp DESC')],
+        unique=False,
+        postgresql_include=['price', 'created_at']
+    )
+    # Покрываются составным индексом / первичным ключом
+    op.drop_index(
+        op.f('ix_pricerecords_timestamp'),
+        table_name='pricerecords'
+    )
+    op.drop_index(
+        op.f('ix_pricerecords_ticker'),
+        table_name='pricerecords'
+    )
+    op.drop_index(
+        op.f('ix_pricerecords_id'),
+        table_name='pricerecords'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f('ix_pricerecords_id'),
+        'pricerecords',
+        ['id'],
+        unique=False
+    )
+    op.create_index(
+        op.f('ix_pricerecords_ticker'),
+        'pricerecords',
+        ['ticker'],
+        unique=False
+    )
+    op.create_index(
+        op.f('ix_pricerecords_timestamp'),
+        'pricerecords',
+        ['timestamp'],
+        unique=False
+    )
+    op.drop_index(
+        'ix_pricerecords_ticker_timestamp',
+        table_name='pricerecords'
+    )
@@ -0,0 +1,43 @@
+"""Default partition for pricerecords
+
+Revision ID: a9d3e6f1c270
+Revises: f2b8d5e1a639
+Create Date: 2026-10-18 10:14:05.528113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e6f1c270'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d5e1a639'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Записи вне созданных месячных партиций (поздние тики, сбой beat,
+    # импорт старой истории) попадают сюда, а не роняют INSERT.
+    # Обслуживание партиций переносит их в месячные партиции.
+    op.execute(
+        'CREATE TABLE pricerecords_default '
+        'PARTITION OF pricerecords DEFAULT'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pricerecords_default) THEN
+                RAISE EXCEPTION
+                    'pricerecords_default is not empty: run partition '
+                    'maintenance before downgrading';
+            END IF;
+        END $$;
+    """)
+    op.execute('DROP TABLE pricerecords_default')
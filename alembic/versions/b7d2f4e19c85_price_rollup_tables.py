@@ -0,0 +1,50 @@
+"""Price rollup tables
+
+Revision ID: b7d2f4e19c85
+Revises: a3c91e7d4b20
+Create Date: 2026-10-17 14:03:27.904112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f4e19c85'
+down_revision: Union[str, Sequence[str], None] = 'a3c91e7d4b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ROLLUP_TABLES = ['pricerollups_1m', 'pricerollups_1h', 'pricerollups_1d']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in ROLLUP_TABLES:
+        op.create_table(
+            table_name,
+            sa.Column('ticker', sa.String(length=20), nullable=False),
+            sa.Column(
+                'bucket',
+                sa.BigInteger(),
+                nullable=False,
+                comment='Начало интервала (UNIX timestamp)'
+            ),
+            sa.Column('open', sa.DECIMAL(precision=20, scale=8), nullable=False),
+            sa.Column('high', sa.DECIMAL(precision=20, scale=8), nullable=False),
+            sa.Column('low', sa.DECIMAL(precision=20, scale=8), nullable=False),
+            sa.Column('close', sa.DECIMAL(precision=20, scale=8), nullable=False),
+            sa.Column('count', sa.Integer(), nullable=False),
+            sa.Column('open_ts', sa.BigInteger(), nullable=False),
+            sa.Column('close_ts', sa.BigInteger(), nullable=False),
+            sa.PrimaryKeyConstraint('ticker', 'bucket')
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in reversed(ROLLUP_TABLES):
+        op.drop_table(table_name)
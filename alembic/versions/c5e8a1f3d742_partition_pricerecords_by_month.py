@@ -0,0 +1,153 @@
+"""Partition pricerecords by month
+
+Revision ID: c5e8a1f3d742
+Revises: b7d2f4e19c85
+Create Date: 2026-10-17 16:21:09.337581
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8a1f3d742'
+down_revision: Union[str, Sequence[str], None] = 'b7d2f4e19c85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Сколько месяцев вперёд создать партиций сразу
+PRECREATE_MONTHS = 3
+
+
+def create_parent(table_name: str, partitioned: bool) -> None:
+    """Создать таблицу pricerecords (секционированную или обычную)."""
+    op.create_table(
+        table_name,
+        sa.Column('ticker', sa.String(length=20), nullable=False),
+        sa.Column(
+            'price',
+            sa.DECIMAL(precision=20, scale=8),
+            nullable=False
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+            comment='Время создания записи'
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=True,
+            comment='Время последнего обновления'
+        ),
+        sa.Column(
+            'id',
+            sa.UUID(as_uuid=True),
+            nullable=False,
+            comment='Уникальный идентификатор'
+        ),
+        sa.Column(
+            'timestamp',
+            sa.BigInteger(),
+            nullable=False,
+            comment='UNIX timestamp цены'
+        ),
+        # Ключ секционирования обязан входить в первичный ключ
+        sa.PrimaryKeyConstraint(
+            'id', 'timestamp', name=f'{table_name}_pkey'
+        ) if partitioned else sa.PrimaryKeyConstraint(
+            'id', name=f'{table_name}_pkey'
+        ),
+        postgresql_partition_by='RANGE (timestamp)' if partitioned else None
+    )
+    op.create_index(
+        'ix_pricerecords_ticker_timestamp',
+        table_name,
+        ['ticker', sa.text('timestamp DESC')],
+        unique=False,
+        postgresql_include=['price', 'created_at']
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.rename_table('pricerecords', 'pricerecords_legacy')
+    op.execute(
+        'ALTER TABLE pricerecords_legacy '
+        'RENAME CONSTRAINT pricerecords_pkey TO pricerecords_legacy_pkey'
+    )
+    op.execute(
+        'ALTER INDEX ix_pricerecords_ticker_timestamp '
+        'RENAME TO ix_pricerecords_legacy_ticker_timestamp'
+    )
+
+    create_parent('pricerecords', partitioned=True)
+
+    # Месячные партиции pricerecords_pYYYYMM от самых старых данных
+    # до текущего месяца + PRECREATE_MONTHS
+    op.execute(f"""
+        DO $$
+        DECLARE
+            -- Границы месяцев считаются в UTC
+            month_start timestamp;
+            last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{PRECREATE_MONTHS} months';
+        BEGIN
+            SELECT date_trunc(
+                'month', to_timestamp(min(timestamp)) AT TIME ZONE 'UTC'
+            )
+            INTO month_start FROM pricerecords_legacy;
+            month_start := coalesce(
+                month_start, date_trunc('month', now() AT TIME ZONE 'UTC')
+            );
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF pricerecords '
+                    'FOR VALUES FROM (%s) TO (%s)',
+                    'pricerecords_p' || to_char(month_start, 'YYYYMM'),
+                    extract(epoch FROM month_start)::bigint,
+                    extract(epoch FROM month_start + interval '1 month')::bigint
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$;
+    """)
+
+    op.execute(
+        'INSERT INTO pricerecords '
+        '(ticker, price, created_at, updated_at, id, timestamp) '
+        'SELECT ticker, price, created_at, updated_at, id, timestamp '
+        'FROM pricerecords_legacy'
+    )
+    op.drop_table('pricerecords_legacy')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table('pricerecords', 'pricerecords_partitioned')
+    op.execute(
+        'ALTER TABLE pricerecords_partitioned RENAME CONSTRAINT '
+        'pricerecords_pkey TO pricerecords_partitioned_pkey'
+    )
+    op.execute(
+        'ALTER INDEX ix_pricerecords_ticker_timestamp '
+        'RENAME TO ix_pricerecords_partitioned_ticker_timestamp'
+    )
+
+    create_parent('pricerecords', partitioned=False)
+
+    op.execute(
+        'INSERT INTO pricerecords '
+        '(ticker, price, created_at, updated_at, id, timestamp) '
+        'SELECT ticker, price, created_at, updated_at, id, timestamp '
+        'FROM pricerecords_partitioned'
+    )
+    # Удаляет и все партиции
+    op.drop_table('pricerecords_partitioned')
@@ -0,0 +1,63 @@
+"""Compact price storage
+
+Revision ID: d1f6b9a2e417
+Revises: c5e8a1f3d742
+Create Date: 2026-10-17 18:40:52.116907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f6b9a2e417'
+down_revision: Union[str, Sequence[str], None] = 'c5e8a1f3d742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'tickers',
+        sa.Column(
+            'id',
+            sa.SmallInteger(),
+            sa.Identity(),
+            nullable=False
+        ),
+        sa.Column('name', sa.String(length=20), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+    # Колонки 8-байтовые первыми — без выравнивающих отступов
+    op.create_table(
+        'pricerecords_compact',
+        sa.Column(
+            'timestamp',
+            sa.BigInteger(),
+            nullable=False,
+            comment='UNIX timestamp цены'
+        ),
+        sa.Column(
+            'price',
+            sa.BigInteger(),
+            nullable=False,
+            comment='Цена * 10^8'
+        ),
+        sa.Column('ticker_id', sa.SmallInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['ticker_id'], ['tickers.id']),
+        sa.PrimaryKeyConstraint('ticker_id', 'timestamp')
+    )
+    op.execute(
+        'INSERT INTO tickers (name) '
+        'SELECT DISTINCT ticker FROM pricerecords ORDER BY ticker'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('pricerecords_compact')
+    op.drop_table('tickers')
@@ -0,0 +1,53 @@
+"""Unique ticker/timestamp
+
+Revision ID: e4a7c2d8f513
+Revises: d1f6b9a2e417
+Create Date: 2026-10-17 20:15:33.680241
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c2d8f513'
+down_revision: Union[str, Sequence[str], None] = 'd1f6b9a2e417'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def create_ticker_timestamp_index(unique: bool) -> None:
+    """Создать покрывающий индекс (ticker, timestamp DESC)."""
+    op.create_index(
+        'ix_pricerecords_ticker_timestamp',
+        'pricerecords',
+        ['ticker', sa.text('timestamp DESC')],
+        unique=unique,
+        postgresql_include=['price', 'created_at']
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Удаляем дубликаты от повторов задачи, оставляя самую раннюю запись
+    op.execute(
+        'DELETE FROM pricerecords a USING pricerecords b '
+        'WHERE a.ticker = b.ticker AND a.timestamp = b.timestamp '
+        'AND (a.created_at, a.id) > (b.created_at, b.id)'
+    )
+    op.drop_index(
+        'ix_pricerecords_ticker_timestamp',
+        table_name='pricerecords'
+    )
+    create_ticker_timestamp_index(unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_pricerecords_ticker_timestamp',
+        table_name='pricerecords'
+    )
+    create_ticker_timestamp_index(unique=False)
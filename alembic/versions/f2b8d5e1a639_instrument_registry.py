@@ -0,0 +1,42 @@
+"""Instrument registry
+
+Revision ID: f2b8d5e1a639
+Revises: e4a7c2d8f513
+Create Date: 2026-10-17 21:02:47.315902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d5e1a639'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c2d8f513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'tickers',
+        sa.Column(
+            'active',
+            sa.Boolean(),
+            server_default=sa.true(),
+            nullable=False,
+            comment='Собирать цены индекса'
+        )
+    )
+    # Тикеры, которые раньше были заданы в коде
+    op.execute(
+        "INSERT INTO tickers (name) VALUES ('BTC_USD'), ('ETH_USD') "
+        "ON CONFLICT (name) DO NOTHING"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tickers', 'active')
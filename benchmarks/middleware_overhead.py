@@ -0,0 +1,221 @@
+"""
+Нагрузочное сравнение middleware обработки исключений: прежний
+BaseHTTPMiddleware против чистого ASGI ExceptionHandlerMiddleware.
+
+Запросы подаются прямо в ASGI-приложение (без сети и сервера), поэтому
+разница в req/s и p99 — накладные расходы самого middleware.
+Варианты:
+    none       — без middleware
+    base_http  — прежняя реализация на BaseHTTPMiddleware
+    asgi       — ExceptionHandlerMiddleware без журнала запросов
+    asgi_log   — ExceptionHandlerMiddleware с журналом (--sample-rate)
+Эндпоинты: /json — небольшой JSON, /stream — StreamingResponse из
+--chunks чанков.
+
+Использование:
+    python benchmarks/middleware_overhead.py --requests 20000 \\
+        --concurrency 64 --sample-rate 0.1
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.responses import (  # noqa: E402
+    JSONResponse,
+    StreamingResponse
+)
+from starlette.routing import Route  # noqa: E402
+
+from exceptions import PriceNotFoundError, ErrorResponse  # noqa: E402
+from middleware import ExceptionHandlerMiddleware  # noqa: E402
+
+PAYLOAD = {
+    "ticker": "BTC_USD",
+    "id": "0b8e5f5e-6d0a-4a57-9d0b-6f1f0e6c1c11",
+    "price": "42000.12345678",
+    "timestamp": 1_704_067_200,
+}
+
+
+class LegacyExceptionHandlerMiddleware(BaseHTTPMiddleware):
+    """Прежняя реализация (до перехода на чистый ASGI)."""
+
+    def __init__(self, app, logger: logging.Logger):
+        super().__init__(app)
+        self.logger = logger
+
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except PriceNotFoundError as e:
+            self.logger.warning(f"Price not found: {e.ticker}")
+            return JSONResponse(
+                status_code=404, content={"detail": str(e)}
+            )
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {str(e)}")
+            return JSONResponse(
+                status_code=500,
+                content=ErrorResponse(
+                    detail="Internal server error").model_dump()
+            )
+
+
+def build_app(chunks: int) -> Starlette:
+    """Приложение с эндпоинтами /json, /stream и /missing."""
+
+    async def json_endpoint(request):
+        return JSONResponse(PAYLOAD)
+
+    async def stream_endpoint(request):
+        async def body():
+            for _ in range(chunks):
+                yield b'{"price":"42000.12345678"}\n'
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    async def missing_endpoint(request):
+        raise PriceNotFoundError("BTC_USD")
+
+    return Starlette(routes=[
+        Route("/json", json_endpoint),
+        Route("/stream", stream_endpoint),
+        Route("/missing", missing_endpoint),
+    ])
+
+
+def build_variants(chunks: int, sample_rate: float) -> dict:
+    """Варианты стека middleware поверх одного приложения."""
+
+    logger = logging.getLogger("benchmarks.middleware")
+    logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    app = build_app(chunks)
+
+    asgi = ExceptionHandlerMiddleware(app, logger=logger)
+    asgi.handle_exceptions, asgi.log_requests = True, False
+
+    asgi_log = ExceptionHandlerMiddleware(
+        app, logger=logger, sample_rate=sample_rate
+    )
+    asgi_log.handle_exceptions, asgi_log.log_requests = True, True
+
+    return {
+        "none": app,
+        "base_http": LegacyExceptionHandlerMiddleware(app, logger=logger),
+        "asgi": asgi,
+        "asgi_log": asgi_log,
+    }
+
+
+async def request(app, path: str) -> int:
+    """Выполнить один GET и вернуть статус (тело читается полностью)."""
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    body_sent = False
+    response_complete = asyncio.Event()
+    status = 0
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif not message.get("more_body", False):
+            response_complete.set()
+
+    await app(scope, receive, send)
+    response_complete.set()
+    return status
+
+
+async def load(app, path: str, total: int, concurrency: int) -> tuple:
+    """
+    Прогнать total запросов в concurrency параллельных потоков.
+
+    Returns:
+        (req/s, p50 мс, p99 мс)
+    """
+    latencies: list[float] = []
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            await request(app, path)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+    return total / elapsed, p50, p99 * 1000
+
+
+async def run(args: argparse.Namespace) -> None:
+    variants = build_variants(args.chunks, args.sample_rate)
+
+    # Обработка ошибок должна совпадать
+    for name in ("base_http", "asgi"):
+        assert await request(variants[name], "/missing") == 404, name
+
+    print(f"{'variant':<12}{'endpoint':<10}{'req/s':>12}"
+          f"{'p50 ms':>10}{'p99 ms':>10}")
+    for path in ("/json", "/stream"):
+        for name, app in variants.items():
+            # Прогрев
+            await load(app, path, args.concurrency * 10, args.concurrency)
+            rps, p50, p99 = await load(
+                app, path, args.requests, args.concurrency
+            )
+            print(f"{name:<12}{path:<10}{rps:>12,.0f}"
+                  f"{p50:>10.3f}{p99:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--chunks", type=int, default=50)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Микро-бенчмарк сериализации ответа /date-range: прежний путь через
+pydantic и response_model против строк колонок и orjson.
+
+База данных не нужна: строки генерируются в памяти.
+
+Прежний путь:
+    ORM-объект -> PriceRecordResponse.model_validate -> повторная
+    валидация по response_model -> dump_python(mode="json") -> json.dumps
+Быстрый путь:
+    строка колонок (dict) -> utils.dumps (orjson)
+
+Использование:
+    python benchmarks/response_serialization.py --rows 10000
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from schemas import PriceDateRangeResponse, PriceRecordResponse  # noqa: E402
+from utils import dumps  # noqa: E402
+
+START = 1_704_067_200  # 2024-01-01
+
+_response_adapter = TypeAdapter(PriceDateRangeResponse)
+
+
+def make_rows(count: int) -> list[dict]:
+    """Строки в том виде, в каком их возвращает PriceRepository."""
+    created_at = datetime.now(timezone.utc)
+    return [
+        {
+            "ticker": "BTC_USD",
+            "id": uuid4(),
+            "price": Decimal("42000.12345678") + i,
+            "timestamp": START + i * 60,
+            "created_at": created_at,
+        }
+        for i in range(count)
+    ]
+
+
+def pydantic_path(records: list[SimpleNamespace]) -> bytes:
+    prices = [PriceRecordResponse.model_validate(r) for r in records]
+    response = PriceDateRangeResponse(
+        ticker="BTC_USD",
+        start_date=START,
+        end_date=START + len(prices) * 60,
+        count=len(prices),
+        prices=prices
+    )
+    # То же, что делает FastAPI для response_model и JSONResponse
+    validated = _response_adapter.validate_python(response)
+    content = _response_adapter.dump_python(validated, mode="json")
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def orjson_path(rows: list[dict]) -> bytes:
+    return dumps({
+        "ticker": "BTC_USD",
+        "start_date": START,
+        "end_date": START + len(rows) * 60,
+        "resolution": None,
+        "count": len(rows),
+        "prices": rows
+    })
+
+
+def measure(func, payload, repeat: int) -> float:
+    """Лучшее время одного вызова (сек)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    records = [SimpleNamespace(**row) for row in rows]
+
+    # Оба пути должны давать один и тот же документ
+    assert json.loads(pydantic_path(records)) == json.loads(orjson_path(rows))
+
+    print(f"{'path':<12}{'ms/response':>14}{'responses/s':>14}{'rows/s':>16}")
+    for name, func, payload in (
+        ("pydantic", pydantic_path, records),
+        ("orjson", orjson_path, rows),
+    ):
+        elapsed = measure(func, payload, args.repeat)
+        print(f"{name:<12}{elapsed * 1000:>14.2f}{1 / elapsed:>14,.1f}"
+              f"{args.rows / elapsed:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
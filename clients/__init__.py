@@ -1,5 +1,21 @@
 """Клиент API Deribit."""
 
-from .deribit_client import DeribitClient, PriceData, default_client
+from .deribit_client import (
+    DeribitClient,
+    FetchResult,
+    PriceData,
+    default_client
+)
+from .session_pool import SessionPool, default_session_pool
+from .deribit_stream import DeribitStreamClient, index_channels
 
-__all__ = ["DeribitClient", "PriceData", "default_client"]
+__all__ = [
+    "DeribitClient",
+    "FetchResult",
+    "PriceData",
+    "default_client",
+    "SessionPool",
+    "default_session_pool",
+    "DeribitStreamClient",
+    "index_channels"
+]
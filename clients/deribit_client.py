@@ -3,16 +3,20 @@
 """
 
 from __future__ import annotations
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Dict
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
 from urllib.parse import urlencode
 
 import aiohttp
 
 from src.config.settings import settings
 from src.exceptions.exceptions import DeribitClientError
-from src.utils.types import VALID_TICKERS
+from src.tracing import span
+from .metrics import DERIBIT_REQUEST_DURATION, DERIBIT_REQUEST_ERRORS
+from .session_pool import SessionPool, default_session_pool
 
 logger = logging.getLogger(__name__)
 
@@ -25,49 +29,74 @@ class PriceData:
     timestamp: int
 
 
+@dataclass
+class FetchResult:
+    """Результат параллельного получения цен по нескольким тикерам"""
+    prices: Dict[str, PriceData] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_partial(self) -> bool:
+        """Часть тикеров получить не удалось"""
+        return bool(self.errors)
+
+
 class DeribitClient:
     """
     Минимальный клиент для API Deribit
     """
 
-    def __init__(self) -> None:
-        """Инициализация клиента."""
+    def __init__(self, session_pool: SessionPool | None = None) -> None:
+        """
+        Инициализация клиента.
+
+        Args:
+            session_pool: Пул сессий. По умолчанию — общий пул процесса.
+        """
+        self._session_pool = session_pool or default_session_pool
         self._session: aiohttp.ClientSession | None = None
 
     async def __aenter__(self) -> "DeribitClient":
         """
         Контекстный менеджер - вход.
-        Создаёт сессию для текущего event loop.
+        Берёт сессию текущего event loop из пула.
         """
-        self._session = aiohttp.ClientSession()
+        self._session = await self._session_pool.get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Контекстный менеджер - выход. Закрывает сессию."""
+        """Контекстный менеджер - выход. Возвращает сессию в пул."""
         await self.close()
 
     async def close(self) -> None:
-        """Закрыть сессию."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """
+        Отпустить сессию.
+
+        Сессия принадлежит пулу и не закрывается, чтобы соединения
+        переиспользовались следующими вызовами.
+        """
+        self._session = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """
-        Получить существующую сессию или создать новую.
+        Получить сессию из пула для текущего event loop.
         """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = await self._session_pool.get_session()
         return self._session
 
     async def _request(
         self,
         endpoint: str,
-        params: dict | None = None
+        params: dict | None = None,
+        ticker: str = ""
     ) -> dict:
         """
         Выполнить запрос к Deribit API v2 REST.
 
+        Запрос выполняется в спане трассировки; длительность и ошибки
+        учитываются в метриках по endpoint и тикеру
+        (ticker — только для метрик и спана).
         """
         base_url = settings.deribit.DERIBIT_API_URL
         url = f"{base_url}{endpoint}"
@@ -78,70 +107,163 @@ class DeribitClient:
 
         session = await self._get_session()
 
-        async with session.get(url) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise DeribitClientError(
-                    f"API error: status={response.status}, body={error_text}"
-                )
+        with span(
+            "DeribitClient._request",
+            **{"deribit.endpoint": endpoint, "deribit.ticker": ticker}
+        ):
+            started = time.perf_counter()
+            reason = None
+            try:
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        reason = f"http_{response.status}"
+                        error_text = await response.text()
+                        raise DeribitClientError(
+                            f"API error: status={response.status}, "
+                            f"body={error_text}"
+                        )
 
-            json_response = await response.json()
-            if "error" in json_response:
-                error = json_response["error"]
-                raise DeribitClientError(
-                    f"API error: {error.get('message', error)}"
-                )
+                    json_response = await response.json()
+                    if "error" in json_response:
+                        reason = "api_error"
+                        error = json_response["error"]
+                        raise DeribitClientError(
+                            f"API error: {error.get('message', error)}"
+                        )
 
-            return json_response
+                    return json_response
+            except asyncio.CancelledError:
+                reason = "cancelled"
+                raise
+            except aiohttp.ClientError:
+                reason = "client_error"
+                raise
+            finally:
+                DERIBIT_REQUEST_DURATION.labels(endpoint, ticker).observe(
+                    time.perf_counter() - started
+                )
+                if reason is not None:
+                    DERIBIT_REQUEST_ERRORS.labels(
+                        endpoint, ticker, reason
+                    ).inc()
 
     async def fetch_price(self, ticker: str) -> PriceData:
         """
-        Получить цену для тикера.
+        Получить цену индекса для тикера (BTC_USD -> индекс btc_usd).
+
+        Время цены — момент ответа сервера (usOut).
         """
         ticker = ticker.upper()
 
-        if ticker not in VALID_TICKERS:
-            raise DeribitClientError(f"Unsupported ticker: {ticker}")
-
-        # Преобразуем BTC_USD -> BTC, ETH_USD -> ETH
-        currency_map = {"BTC_USD": "BTC", "ETH_USD": "ETH"}
-        currency = currency_map[ticker]
-
         result = await self._request(
-            endpoint="/ticker",
-            params={"instrument_name": f"{currency}-PERPETUAL"}
+            endpoint="/get_index_price",
+            params={"index_name": ticker.lower()},
+            ticker=ticker
         )
 
-        if "result" in result:
-            index_price = result["result"].get("index_price")
-            timestamp = result["result"].get("timestamp")
-            if index_price is None:
-                raise DeribitClientError(f"Missing index_price for {ticker}")
-            timestamp = timestamp // 1000
-        else:
+        index_price = result.get("result", {}).get("index_price")
+        timestamp = result.get("usOut")
+        if index_price is None or timestamp is None:
             raise DeribitClientError(f"Missing index_price for {ticker}")
 
         return PriceData(
             ticker=ticker,
             price=float(index_price),
-            timestamp=int(timestamp)
+            timestamp=int(timestamp) // 1_000_000
         )
 
-    async def fetch_all_prices(self) -> Dict[str, PriceData]:
+    async def fetch_index_names(self) -> List[str]:
         """
-        Получить цены для всех поддерживаемых валют
+        Получить тикеры всех индексов Deribit (btc_usd -> BTC_USD).
         """
-        prices = {}
+        result = await self._request(endpoint="/get_index_price_names")
+        names = result.get("result")
+        if not isinstance(names, list):
+            raise DeribitClientError("Missing index price names")
+        return [name.upper() for name in names]
 
-        for ticker in VALID_TICKERS:
+    async def _fetch_price_limited(
+        self,
+        ticker: str,
+        semaphore: asyncio.Semaphore,
+        timeout: float
+    ) -> PriceData:
+        """
+        Получить цену для тикера с ограничением параллелизма и таймаутом.
+        """
+        async with semaphore:
             try:
-                price_data = await self.fetch_price(ticker)
-                prices[ticker] = price_data
-                logger.info(f"Fetched {ticker}: {price_data.price}")
-            except DeribitClientError as e:
-                logger.error(f"Failed to fetch {ticker}: {e}")
+                return await asyncio.wait_for(
+                    self.fetch_price(ticker),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                DERIBIT_REQUEST_ERRORS.labels(
+                    "/get_index_price", ticker.upper(), "timeout"
+                ).inc()
+                raise DeribitClientError(
+                    f"Timeout after {timeout}s for {ticker}"
+                )
+
+    async def fetch_prices(
+        self,
+        tickers: Iterable[str],
+        max_concurrency: int | None = None,
+        timeout: float | None = None
+    ) -> FetchResult:
+        """
+        Параллельно получить цены для набора тикеров.
+
+        Любые ошибки по отдельным тикерам (в том числе неожиданный
+        формат ответа) не прерывают остальные запросы, а попадают
+        в FetchResult.errors. Пробрасываются только BaseException
+        (отмена, выход процесса).
+        """
+        tickers = list(tickers)
+        semaphore = asyncio.Semaphore(
+            max_concurrency or settings.deribit.DERIBIT_MAX_CONCURRENCY
+        )
+        timeout = timeout or settings.deribit.DERIBIT_REQUEST_TIMEOUT
+
+        results = await asyncio.gather(
+            *(
+                self._fetch_price_limited(ticker, semaphore, timeout)
+                for ticker in tickers
+            ),
+            return_exceptions=True
+        )
+
+        fetch_result = FetchResult()
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, PriceData):
+                fetch_result.prices[ticker] = result
+                logger.info(f"Fetched {ticker}: {result.price}")
+            elif isinstance(result, Exception):
+                fetch_result.errors[ticker] = (
+                    str(result) or type(result).__name__
+                )
+                logger.error(f"Failed to fetch {ticker}: {result!r}")
+            else:
+                raise result
+
+        return fetch_result
+
+    async def fetch_all_prices(
+        self,
+        tickers: Iterable[str]
+    ) -> Dict[str, PriceData]:
+        """
+        Получить цены для всех тикеров реестра
+        """
+        fetch_result = await self.fetch_prices(tickers)
+
+        if fetch_result.is_partial:
+            logger.warning(
+                f"Partial fetch: {len(fetch_result.prices)} ok, "
+                f"failed: {', '.join(fetch_result.errors)}"
+            )
 
-        return prices
+        return fetch_result.prices
 
 
 # Экземпляр по умолчанию
@@ -0,0 +1,202 @@
+"""
+Потоковый клиент Deribit на JSON-RPC WebSocket.
+
+Подписывается на каналы индексных цен, переподключается с
+экспоненциальной задержкой и складывает тики в ограниченную очередь.
+"""
+
+from __future__ import annotations
+import asyncio
+import itertools
+import json
+import logging
+from typing import Iterable
+
+import aiohttp
+
+from src.config.settings import settings
+from .deribit_client import PriceData
+
+logger = logging.getLogger(__name__)
+
+
+def index_channels(tickers: Iterable[str]) -> list[str]:
+    """Каналы индексных цен для тикеров (BTC_USD -> deribit_price_index.btc_usd)."""
+    return [f"deribit_price_index.{ticker.lower()}" for ticker in tickers]
+
+
+class DeribitStreamClient:
+    """
+    Клиент подписок Deribit WebSocket.
+    """
+
+    def __init__(
+        self,
+        queue: asyncio.Queue[PriceData],
+        tickers: Iterable[str],
+        channels: Iterable[str] | None = None,
+        url: str | None = None
+    ) -> None:
+        """
+        Инициализация клиента.
+
+        Args:
+            queue: Ограниченная очередь для тиков.
+            tickers: Тикеры реестра; тики остальных отбрасываются.
+            channels: Каналы подписки. По умолчанию — индексы tickers.
+            url: URL WebSocket. Переопределяется в тестах фейковым сервером.
+        """
+        self._queue = queue
+        self._tickers = frozenset(ticker.upper() for ticker in tickers)
+        self._channels = list(channels or index_channels(self._tickers))
+        self._url = url or settings.deribit.DERIBIT_WS_URL
+        self._ids = itertools.count(1)
+        self._stopped = asyncio.Event()
+
+    def stop(self) -> None:
+        """Остановить клиент после текущего соединения."""
+        self._stopped.set()
+
+    async def run(self) -> None:
+        """
+        Основной цикл: подключение, подписка, чтение, переподключение.
+        """
+        min_delay = settings.deribit.DERIBIT_WS_RECONNECT_MIN_DELAY
+        max_delay = settings.deribit.DERIBIT_WS_RECONNECT_MAX_DELAY
+        delay = min_delay
+
+        async with aiohttp.ClientSession() as session:
+            while not self._stopped.is_set():
+                try:
+                    async with session.ws_connect(
+                        self._url,
+                        heartbeat=settings.deribit.DERIBIT_WS_HEARTBEAT
+                    ) as ws:
+                        await self._subscribe(ws)
+                        logger.info(f"Subscribed to {', '.join(self._channels)}")
+                        delay = min_delay
+                        await self._read(ws)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error(f"WebSocket connection error: {e}")
+                except Exception:
+                    # Непредвиденная ошибка не должна останавливать сбор:
+                    # переподключаемся, как после разрыва
+                    logger.exception("Unexpected WebSocket client error")
+
+                if self._stopped.is_set():
+                    break
+
+                logger.info(f"Reconnecting in {delay}s")
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                delay = min(delay * 2, max_delay)
+
+    async def _send(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        method: str,
+        params: dict
+    ) -> None:
+        """Отправить JSON-RPC запрос."""
+        await ws.send_json({
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params
+        })
+
+    async def _subscribe(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Подписаться на каналы и включить heartbeat Deribit."""
+        await self._send(
+            ws,
+            "public/set_heartbeat",
+            {"interval": settings.deribit.DERIBIT_WS_HEARTBEAT}
+        )
+        await self._send(ws, "public/subscribe", {"channels": self._channels})
+
+    async def _read(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Читать сообщения до закрытия соединения."""
+        async for message in ws:
+            if self._stopped.is_set():
+                await ws.close()
+                return
+            if message.type != aiohttp.WSMsgType.TEXT:
+                if message.type == aiohttp.WSMsgType.ERROR:
+                    logger.error(f"WebSocket error: {ws.exception()}")
+                    return
+                continue
+
+            try:
+                await self._handle(ws, json.loads(message.data))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(f"Skipping malformed message: {e!r}")
+
+    async def _handle(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        payload: dict
+    ) -> None:
+        """
+        Обработать одно JSON-RPC сообщение.
+
+        Raises:
+            ValueError, KeyError, TypeError, AttributeError: Сообщение
+                не соответствует ожидаемому формату.
+        """
+        method = payload.get("method")
+
+        if method == "heartbeat":
+            if (payload.get("params") or {}).get("type") == "test_request":
+                await self._send(ws, "public/test", {})
+        elif method == "subscription":
+            price_data = self._parse_tick(payload["params"])
+            if price_data is not None:
+                self._put(price_data)
+        elif "error" in payload:
+            logger.error(f"JSON-RPC error: {payload['error']}")
+
+    def _parse_tick(self, params: dict) -> PriceData | None:
+        """
+        Преобразовать уведомление канала в PriceData.
+
+        deribit_price_index.btc_usd -> BTC_USD,
+        ticker.BTC-PERPETUAL.* -> BTC_USD (по index_price).
+        """
+        channel: str = params.get("channel", "")
+        data: dict = params.get("data", {})
+
+        if channel.startswith("deribit_price_index."):
+            ticker = data.get("index_name", "").upper()
+            price = data.get("price")
+        elif channel.startswith("ticker."):
+            currency = data.get("instrument_name", "").split("-")[0]
+            ticker = f"{currency}_USD"
+            price = data.get("index_price")
+        else:
+            return None
+
+        timestamp = data.get("timestamp")
+        if ticker not in self._tickers or price is None or timestamp is None:
+            return None
+
+        return PriceData(
+            ticker=ticker,
+            price=float(price),
+            timestamp=int(timestamp) // 1000
+        )
+
+    def _put(self, price_data: PriceData) -> None:
+        """
+        Положить тик в очередь.
+
+        При переполнении вытесняется самый старый тик: свежесть
+        данных важнее полноты при отставании писателя.
+        """
+        try:
+            self._queue.put_nowait(price_data)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.put_nowait(price_data)
+            logger.warning("Stream queue is full, dropped oldest tick")
@@ -0,0 +1,18 @@
+"""
+Метрики Prometheus клиента Deribit
+"""
+
+from prometheus_client import Counter, Histogram
+
+DERIBIT_REQUEST_DURATION = Histogram(
+    "deribit_request_duration_seconds",
+    "Длительность запроса к Deribit API",
+    ["endpoint", "ticker"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+DERIBIT_REQUEST_ERRORS = Counter(
+    "deribit_request_errors_total",
+    "Ошибки запросов к Deribit API",
+    ["endpoint", "ticker", "reason"],
+)
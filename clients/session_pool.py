@@ -0,0 +1,87 @@
+"""
+Пул долгоживущих aiohttp-сессий для клиента Deribit.
+
+Одна сессия на event loop внутри процесса: соединения (keep-alive)
+и DNS-кэш переживают отдельные вызовы клиента.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import weakref
+
+import aiohttp
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """
+    Процессный пул aiohttp-сессий, по одной на event loop.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пула."""
+        self._sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, aiohttp.ClientSession
+        ] = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Создать сессию с настроенным TCPConnector."""
+        connector = aiohttp.TCPConnector(
+            limit=settings.deribit.DERIBIT_POOL_LIMIT,
+            keepalive_timeout=settings.deribit.DERIBIT_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=settings.deribit.DERIBIT_DNS_CACHE_TTL,
+            use_dns_cache=True
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Получить сессию для текущего event loop или создать новую.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = self._create_session()
+            self._sessions[loop] = session
+        return session
+
+    async def close(self) -> None:
+        """Закрыть сессию текущего event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session and not session.closed:
+            await session.close()
+
+    def close_all(self) -> None:
+        """
+        Закрыть сессии всех event loop процесса.
+
+        Вызывается синхронно при остановке процесса, когда
+        ни один из loop не выполняется.
+        """
+        for loop, session in list(self._sessions.items()):
+            if session.closed or loop.is_closed():
+                continue
+            if loop.is_running():
+                logger.warning("Skip closing session: event loop is running")
+                continue
+            loop.run_until_complete(session.close())
+        self._sessions.clear()
+
+    def reset(self) -> None:
+        """
+        Забыть сессии без закрытия.
+
+        Используется после fork: унаследованные от родителя
+        соединения нельзя использовать в дочернем процессе.
+        """
+        self._sessions = weakref.WeakKeyDictionary()
+
+
+# Пул процесса по умолчанию
+default_session_pool = SessionPool()
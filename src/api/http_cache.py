@@ -0,0 +1,112 @@
+"""HTTP-кэширование ответов цен: ETag, Last-Modified, Cache-Control."""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Iterable
+
+from fastapi import Request, Response, status
+
+from config import settings
+from schemas import PriceRecordResponse
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    """Валидаторы ответа, вычисленные по последним ценам тикеров."""
+
+    etag: str
+    last_modified: float | None
+    max_age: int
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Заголовки кэширования для ответа 200 и 304."""
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        if self.last_modified is not None:
+            headers["Last-Modified"] = formatdate(
+                self.last_modified, usegmt=True
+            )
+        return headers
+
+    def is_not_modified(self, request: Request) -> bool:
+        """
+        Проверить условный запрос: If-None-Match имеет приоритет
+        над If-Modified-Since (RFC 9110).
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # Last-Modified передаётся с точностью до секунды
+        return int(self.last_modified) <= since
+
+    def not_modified(self) -> Response:
+        """Ответ 304 без тела."""
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=self.headers
+        )
+
+
+def build_validators(
+    request: Request,
+    watermarks: Iterable[PriceRecordResponse | None],
+    history_modified_at: float | None = None,
+) -> CacheValidators:
+    """
+    Вычислить валидаторы по водяным знакам — последним записям тикеров.
+
+    ETag — хэш пути, параметров запроса и (ticker, timestamp, id)
+    последних записей: ответ меняется только вместе с ними.
+    max-age — время до ожидаемой следующей цены (FETCH_INTERVAL после
+    последней записи), чтобы CDN и прокси не отдавали устаревшее.
+    history_modified_at — время загрузки истории задним числом: она
+    не меняет последнюю запись, но меняет ответы по диапазонам.
+    """
+    interval = settings.celery_config.FETCH_INTERVAL
+    now = time.time()
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(request.url.path.encode())
+    digest.update(
+        str(sorted(request.query_params.multi_items())).encode()
+    )
+
+    last_modified: float | None = None
+    max_age = interval
+    for watermark in watermarks:
+        if watermark is None:
+            digest.update(b"|-")
+            continue
+        digest.update(
+            f"|{watermark.ticker}:{watermark.timestamp}:{watermark.id}"
+            .encode()
+        )
+        created_at = watermark.created_at.timestamp()
+        last_modified = max(last_modified or created_at, created_at)
+        max_age = min(max_age, int(created_at + interval - now))
+
+    if history_modified_at is not None:
+        digest.update(f"|history:{history_modified_at}".encode())
+        last_modified = max(
+            last_modified or history_modified_at, history_modified_at
+        )
+
+    return CacheValidators(
+        etag=f'W/"{digest.hexdigest()}"',
+        last_modified=last_modified,
+        max_age=max(max_age, 0)
+    )
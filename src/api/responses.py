@@ -0,0 +1,9 @@
+"""Классы HTTP-ответов API."""
+
+from fastapi import Response
+
+
+class JSONBytesResponse(Response):
+    """Ответ с уже сериализованным JSON-телом (без response_model)."""
+
+    media_type = "application/json"
@@ -1,24 +1,55 @@
 """API маршруты для работы с данными о ценах."""
 
-from typing import List
+import asyncio
+from typing import AsyncIterator, FrozenSet, List
+from uuid import UUID
 
 from fastapi import (
     APIRouter,
     Depends,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
 )
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db, UnitOfWork
+from config import settings
+from database import database_manager, get_db, UnitOfWork
+from exceptions import UnknownTickerError
 from schemas import (
     PriceRecordResponse,
     PriceLatestResponse,
+    PriceLatestBatchResponse,
     PriceDateRangeResponse,
+    PriceCandlesResponse,
+    PriceStatsResponse,
     AllPricesQuery,
     LatestPriceQuery,
-    DateRangePricesQuery
+    LatestPricesQuery,
+    LivePricesQuery,
+    DateRangePricesQuery,
+    ExportPricesQuery,
+    CandlesQuery,
+    PriceStatsQuery
 )
 
-from services import PriceService, get_price_service
+from services import (
+    ARCHIVE_FORMATS,
+    PriceArchiveService,
+    PriceBroadcaster,
+    PriceService,
+    get_price_archive_service,
+    get_price_broadcaster,
+    get_price_service
+)
+from utils import decode_cursor, dumps, encode_cursor
+from tracing import span
+from .http_cache import build_validators
+from .responses import JSONBytesResponse
 
 
 router = APIRouter(
@@ -37,25 +68,83 @@ async def get_uow(
     return UnitOfWork(session)
 
 
+def query_error(field: str, message: str, value) -> RequestValidationError:
+    """
+    Ошибка query-параметра в формате FastAPI (ответ 422).
+
+    Исключение валидатора модели параметров, объявленной через
+    Depends(), выходит из зависимости как 500, поэтому проверки,
+    требующие разбора значения, выполняются в маршруте.
+    """
+    return RequestValidationError([{
+        "type": "value_error",
+        "loc": ("query", field),
+        "msg": message,
+        "input": value,
+    }])
+
+
 @router.get(
     "/all",
     response_model=List[PriceRecordResponse],
     summary="Получить все цены по тикеру BTC_USD или ETH_USD",
-    description="Возвращает все сохранённые записи о ценах"
+    description=(
+        "Возвращает все сохранённые записи о ценах. Если страница "
+        "заполнена, курсор следующей страницы возвращается в заголовке "
+        "X-Next-Cursor"
+    )
 )
 async def get_all_prices(
+    request: Request,
     query: AllPricesQuery = Depends(),
     uow: UnitOfWork = Depends(get_uow),
     service: PriceService = Depends(get_price_service),
-) -> List[PriceRecordResponse]:
-    """Получить все записи о ценах для указанного тикера."""
+) -> Response:
+    """
+    Получить все записи о ценах для указанного тикера.
+
+    Строки сериализуются orjson напрямую; response_model
+    используется только для документации.
+    """
+
+    if query.cursor is not None:
+        if query.offset:
+            raise query_error(
+                "cursor",
+                "cursor нельзя использовать вместе с offset",
+                query.cursor
+            )
+        try:
+            decode_cursor(query.cursor)
+        except ValueError as e:
+            raise query_error("cursor", str(e), query.cursor)
+
+    validators = build_validators(
+        request,
+        [await service.get_watermark(uow, query.ticker)],
+        await service.get_history_modified_at(uow, query.ticker)
+    )
+    if validators.is_not_modified(request):
+        return validators.not_modified()
 
-    return list(await service.get_prices_by_ticker(
+    prices = await service.get_prices_by_ticker(
         uow=uow,
         ticker=query.ticker,
         limit=query.limit,
-        offset=query.offset
-    ))
+        offset=query.offset,
+        cursor=query.cursor
+    )
+
+    headers = validators.headers
+    if len(prices) == query.limit:
+        last = prices[-1]
+        headers["X-Next-Cursor"] = encode_cursor(
+            last["timestamp"], UUID(str(last["id"]))
+        )
+
+    with span("json.encode", rows=len(prices)):
+        body = dumps(prices)
+    return JSONBytesResponse(body, headers=headers)
 
 
 @router.get(
@@ -65,13 +154,21 @@ async def get_all_prices(
     description="Возвращает последнюю запись о цене"
 )
 async def get_latest_price(
+    request: Request,
+    response: Response,
     query: LatestPriceQuery = Depends(),
     uow: UnitOfWork = Depends(get_uow),
     service: PriceService = Depends(get_price_service),
-) -> PriceLatestResponse:
+) -> PriceLatestResponse | Response:
     """Получить последнюю цену для указанного тикера."""
 
     record = await service.get_latest_price(uow, query.ticker)
+
+    validators = build_validators(request, [record])
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    response.headers.update(validators.headers)
+
     return PriceLatestResponse(
         ticker=record.ticker,
         price=record.price,
@@ -80,6 +177,50 @@ async def get_latest_price(
     )
 
 
+@router.get(
+    "/latest/batch",
+    response_model=PriceLatestBatchResponse,
+    summary="Получить последние цены нескольких тикеров",
+    description=(
+        "Возвращает последнюю запись о цене для каждого тикера одним "
+        "запросом к кэшу и БД"
+    )
+)
+async def get_latest_prices(
+    request: Request,
+    response: Response,
+    query: LatestPricesQuery = Depends(),
+    uow: UnitOfWork = Depends(get_uow),
+    service: PriceService = Depends(get_price_service),
+) -> PriceLatestBatchResponse | Response:
+    """Получить последние цены для списка тикеров."""
+
+    try:
+        tickers = query.ticker_list
+    except ValueError as e:
+        raise query_error("tickers", str(e), query.tickers)
+
+    records, unknown = await service.get_latest_prices(uow, tickers)
+
+    validators = build_validators(request, records.values())
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    response.headers.update(validators.headers)
+
+    return PriceLatestBatchResponse(
+        prices={
+            ticker: None if record is None else PriceLatestResponse(
+                ticker=record.ticker,
+                price=record.price,
+                timestamp=record.timestamp,
+                fetched_at=record.created_at
+            )
+            for ticker, record in records.items()
+        },
+        unknown=unknown
+    )
+
+
 @router.get(
     "/date-range",
     response_model=PriceDateRangeResponse,
@@ -87,24 +228,295 @@ async def get_latest_price(
     description="Возвращает записи о цене в указанном диапазоне"
 )
 async def get_prices_by_date_range(
+    request: Request,
     query: DateRangePricesQuery = Depends(),
     uow: UnitOfWork = Depends(get_uow),
     service: PriceService = Depends(get_price_service),
-) -> PriceDateRangeResponse:
+) -> Response:
     """Получить записи о ценах для тикера в диапазоне дат."""
 
+    validators = build_validators(
+        request,
+        [await service.get_watermark(uow, query.ticker)],
+        await service.get_history_modified_at(uow, query.ticker)
+    )
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
     prices = await service.get_prices_by_date_range(
         uow=uow,
         ticker=query.ticker,
         start_date=query.start_date,
         end_date=query.end_date,
+        limit=query.limit,
+        resolution=query.resolution
+    )
+
+    with span("json.encode", rows=len(prices)):
+        body = dumps({
+            "ticker": query.ticker,
+            "start_date": query.start_date,
+            "end_date": query.end_date,
+            "resolution": query.resolution,
+            "count": len(prices),
+            "prices": prices
+        })
+    return JSONBytesResponse(body, headers=validators.headers)
+
+
+@router.get(
+    "/candles",
+    response_model=PriceCandlesResponse,
+    summary="Получить свечи BTC_USD или ETH_USD по диапазону дат",
+    description=(
+        "Возвращает open/high/low/close и количество записей "
+        "по интервалам 1m, 5m, 1h или 1d"
+    )
+)
+async def get_candles(
+    request: Request,
+    query: CandlesQuery = Depends(),
+    uow: UnitOfWork = Depends(get_uow),
+    service: PriceService = Depends(get_price_service),
+) -> Response:
+    """Получить свечи для тикера в диапазоне дат."""
+
+    validators = build_validators(
+        request,
+        [await service.get_watermark(uow, query.ticker)],
+        await service.get_history_modified_at(uow, query.ticker)
+    )
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    candles = await service.get_candles(
+        uow=uow,
+        ticker=query.ticker,
+        start_date=query.start_date,
+        end_date=query.end_date,
+        interval=query.interval,
         limit=query.limit
     )
 
-    return PriceDateRangeResponse(
+    with span("json.encode", rows=len(candles)):
+        body = dumps({
+            "ticker": query.ticker,
+            "interval": query.interval,
+            "start_date": query.start_date,
+            "end_date": query.end_date,
+            "count": len(candles),
+            "candles": candles
+        })
+    return JSONBytesResponse(body, headers=validators.headers)
+
+
+@router.get(
+    "/stats",
+    response_model=PriceStatsResponse,
+    summary="Статистика цен BTC_USD или ETH_USD по диапазону дат",
+    description=(
+        "Возвращает логарифмические доходности, скользящее среднее, "
+        "реализованную волатильность, TWAP и максимальную просадку"
+    )
+)
+async def get_price_stats(
+    request: Request,
+    query: PriceStatsQuery = Depends(),
+    uow: UnitOfWork = Depends(get_uow),
+    service: PriceService = Depends(get_price_service),
+) -> Response:
+    """Получить статистику цен для тикера в диапазоне дат."""
+
+    validators = build_validators(
+        request,
+        [await service.get_watermark(uow, query.ticker)],
+        await service.get_history_modified_at(uow, query.ticker)
+    )
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    stats = await service.get_price_stats(
+        uow=uow,
         ticker=query.ticker,
         start_date=query.start_date,
         end_date=query.end_date,
-        count=len(prices),
-        prices=list(prices)
+        window=query.window,
+        limit=query.limit,
+        resolution=query.resolution
+    )
+
+    with span("json.encode", rows=stats["count"]):
+        body = dumps({
+            "ticker": query.ticker,
+            "start_date": query.start_date,
+            "end_date": query.end_date,
+            "window": query.window,
+            "resolution": query.resolution,
+            **stats
+        })
+    return JSONBytesResponse(body, headers=validators.headers)
+
+
+# Типы содержимого форматов выгрузки
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Потоковая выгрузка цен BTC_USD или ETH_USD по диапазону дат",
+    description=(
+        "Отдаёт все записи в диапазоне в формате NDJSON, CSV, Parquet "
+        "или Arrow IPC без ограничения количества"
+    )
+)
+async def export_prices(
+    query: ExportPricesQuery = Depends(),
+    uow: UnitOfWork = Depends(get_uow),
+    service: PriceService = Depends(get_price_service),
+    archive: PriceArchiveService = Depends(get_price_archive_service),
+) -> StreamingResponse:
+    """Выгрузить записи о ценах для тикера в диапазоне дат."""
+
+    # Проверяем тикер до начала потока, пока можно вернуть 404
+    ticker = await service.resolve_ticker(uow, query.ticker)
+    export = (
+        archive.export if query.format in ARCHIVE_FORMATS
+        else service.export_prices_by_date_range
+    )
+    filename = (
+        f"{ticker}_{query.start_date}_{query.end_date}.{query.format}"
+    )
+
+    return StreamingResponse(
+        export(
+            uow=uow,
+            ticker=ticker,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            format=query.format
+        ),
+        media_type=EXPORT_MEDIA_TYPES[query.format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+async def resolve_live_tickers(
+    service: PriceService,
+    query: LivePricesQuery,
+) -> FrozenSet[str] | None:
+    """
+    Проверить тикеры подписки по реестру.
+
+    Используется короткая сессия: соединение с БД не удерживается
+    на всё время подписки.
+
+    Raises:
+        ValueError: Список тикеров пуст или слишком длинный.
+        UnknownTickerError: Тикер не отслеживается.
+    """
+    tickers = query.ticker_list
+    if tickers is None:
+        return None
+    async with database_manager.session_factory() as session:
+        uow = UnitOfWork(session)
+        return frozenset([
+            await service.resolve_ticker(uow, ticker) for ticker in tickers
+        ])
+
+
+@router.get(
+    "/live",
+    response_class=StreamingResponse,
+    summary="Подписка на новые цены (Server-Sent Events)",
+    description=(
+        "Отправляет событие price с записью о цене (как в /all) сразу "
+        "после сохранения новой цены"
+    )
+)
+async def stream_live_prices(
+    query: LivePricesQuery = Depends(),
+    service: PriceService = Depends(get_price_service),
+    broadcaster: PriceBroadcaster = Depends(get_price_broadcaster),
+) -> StreamingResponse:
+    """Потоковая рассылка новых цен в формате text/event-stream."""
+
+    try:
+        tickers = await resolve_live_tickers(service, query)
+    except ValueError as e:
+        raise query_error("tickers", str(e), query.tickers)
+    heartbeat = settings.stream_config.LIVE_HEARTBEAT_INTERVAL
+
+    async def events() -> AsyncIterator[bytes]:
+        async with broadcaster.subscribe(tickers) as subscription:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(
+                        subscription.get(), heartbeat
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield b"event: price\ndata: " + payload + b"\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
+
+
+@router.websocket("/live/ws")
+async def websocket_live_prices(
+    websocket: WebSocket,
+    tickers: str | None = None,
+    service: PriceService = Depends(get_price_service),
+    broadcaster: PriceBroadcaster = Depends(get_price_broadcaster),
+) -> None:
+    """
+    Подписка на новые цены через WebSocket.
+
+    Каждое сообщение — JSON записи о цене. Входящие сообщения
+    клиента игнорируются.
+    """
+
+    try:
+        subscribed = await resolve_live_tickers(
+            service, LivePricesQuery(tickers=tickers)
+        )
+    except (ValueError, UnknownTickerError) as e:
+        await websocket.close(
+            code=status.WS_1008_POLICY_VIOLATION, reason=str(e)[:120]
+        )
+        return
+
+    await websocket.accept()
+
+    async with broadcaster.subscribe(subscribed) as subscription:
+
+        async def send() -> None:
+            try:
+                while True:
+                    payload = await subscription.get()
+                    await websocket.send_text(payload.decode())
+            except (WebSocketDisconnect, RuntimeError):
+                return
+
+        async def receive() -> None:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+
+        tasks = {asyncio.create_task(send()), asyncio.create_task(receive())}
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
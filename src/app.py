@@ -6,18 +6,28 @@ FastAPI приложение
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from starlette.middleware.cors import CORSMiddleware
 
 from api import api_router
-from middleware import ExceptionHandlerMiddleware
+from middleware import ExceptionHandlerMiddleware, MetricsMiddleware
 from config import settings, setup_logging
+from metrics import render_metrics
+from tracing import instrument_app, instrument_celery, setup_tracing
+from services import (
+    get_live_price_publisher,
+    get_price_broadcaster,
+    get_price_redis_cache
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Управление жизненным циклом приложения"""
     yield
+    await get_price_broadcaster().close()
+    await get_live_price_publisher().close()
+    await get_price_redis_cache().close()
 
 
 # Инициализируем FastAPI
@@ -34,8 +44,16 @@ app = FastAPI(
 # Инициализируем логгер
 app_logger = setup_logging()
 
-# Подключаем middleware для обработки исключений
-if settings.monitoring_config.ENABLE_EXCEPTION_LOGGING:
+# Трассировка: серверные спаны маршрутов и контекст задач Celery
+if setup_tracing("crypto-price-tracker-api"):
+    instrument_app(app)
+    instrument_celery()
+
+# Подключаем middleware обработки исключений и журнала запросов
+if (
+    settings.monitoring_config.ENABLE_EXCEPTION_LOGGING
+    or settings.monitoring_config.ENABLE_REQUEST_LOGGING
+):
     app.add_middleware(
         ExceptionHandlerMiddleware,
         logger=app_logger
@@ -51,5 +69,15 @@ app.add_middleware(
     allow_headers=settings.cors_config.ALLOWED_HEADERS,
 )
 
+# Подключаем middleware метрик (внешний слой — учитывает и ответы 500)
+if settings.monitoring_config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Метрики в формате Prometheus."""
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
+
 # Подключаем API роутеры
 app.include_router(api_router)
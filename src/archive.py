@@ -0,0 +1,126 @@
+""" Точка входа выгрузки и загрузки истории цен в Parquet / Arrow IPC
+
+Использование:
+    python -m src.archive export BTC_USD btc.parquet
+    python -m src.archive export ETH_USD eth.arrow --format arrow \\
+        --start-date 1704067200 --end-date 1706745600
+    python -m src.archive import btc.parquet
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from config import setup_logging
+from database import UnitOfWork, database_manager
+from services import (
+    ARCHIVE_FORMATS,
+    PriceArchiveService,
+    get_price_redis_cache
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def export_archive(
+    ticker: str,
+    output: str,
+    format: str,
+    start_date: int,
+    end_date: int,
+) -> None:
+    """Выгрузить историю тикера в файл."""
+
+    archive = PriceArchiveService()
+    written = 0
+    try:
+        async with database_manager.session_factory() as session:
+            uow = UnitOfWork(session)
+            with open(output, "wb") as file:
+                async for chunk in archive.export(
+                    uow=uow,
+                    ticker=ticker,
+                    start_date=start_date,
+                    end_date=end_date,
+                    format=format
+                ):
+                    file.write(chunk)
+                    written += len(chunk)
+    finally:
+        await database_manager.engine.dispose()
+
+    logger.info(f"Exported {ticker} to {output} ({written} bytes)")
+
+
+async def import_archive(source: str, rebuild_rollups: bool) -> None:
+    """Загрузить Parquet-файл и поставить пересчёт агрегатов."""
+
+    archive = PriceArchiveService()
+    try:
+        result = await archive.import_parquet(
+            database_manager.session_factory, source
+        )
+    finally:
+        await get_price_redis_cache().close()
+        await database_manager.engine.dispose()
+
+    # Диапазон пуст (None), только если файл без строк
+    if (
+        rebuild_rollups
+        and result.rows_inserted
+        and result.first_timestamp is not None
+        and result.last_timestamp is not None
+    ):
+        from tasks.rollups import backfill_rollups
+
+        backfill_rollups.delay(
+            start_date=result.first_timestamp,
+            end_date=result.last_timestamp + 1
+        )
+        logger.info("Scheduled rollup backfill for imported range")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Выгрузка и загрузка истории цен"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Выгрузить историю")
+    export_parser.add_argument("ticker")
+    export_parser.add_argument("output")
+    export_parser.add_argument(
+        "--format", choices=ARCHIVE_FORMATS, default="parquet"
+    )
+    export_parser.add_argument("--start-date", type=int, default=0)
+    export_parser.add_argument("--end-date", type=int, default=None)
+
+    import_parser = commands.add_parser("import", help="Загрузить Parquet")
+    import_parser.add_argument("source")
+    import_parser.add_argument(
+        "--no-rollups",
+        action="store_true",
+        help="Не ставить задачу пересчёта агрегатов"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        asyncio.run(export_archive(
+            ticker=args.ticker,
+            output=args.output,
+            format=args.format,
+            start_date=args.start_date,
+            end_date=(
+                args.end_date if args.end_date is not None
+                else int(time.time())
+            )
+        ))
+    else:
+        asyncio.run(import_archive(args.source, not args.no_rollups))
+
+
+if __name__ == "__main__":
+    setup_logging()
+    main()
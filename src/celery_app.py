@@ -2,9 +2,21 @@
 Инициализация Celery приложения
 """
 
+import os
+
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import (
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown
+)
 
 from config import settings
+from metrics import mark_process_dead, start_metrics_server
+from tracing import instrument_celery, setup_tracing
+from clients import default_session_pool
+from tasks.runtime import worker_runtime
 
 
 # Создание Celery app
@@ -12,7 +24,12 @@ celery_app = Celery(
     "crypto_price_tracker",
     broker=settings.celery_config.broker_url,
     backend=settings.celery_config.result_backend,
-    include=["tasks.price_fetcher"]
+    include=[
+        "tasks.price_fetcher",
+        "tasks.rollups",
+        "tasks.partitions",
+        "tasks.instruments"
+    ]
 )
 
 # Конфигурация
@@ -36,5 +53,52 @@ celery_app.conf.update(
             "schedule": settings.celery_config.FETCH_INTERVAL,
             "options": {"expires": 50}
         },
+        "sync-instruments": {
+            "task": "tasks.instruments.sync_instruments",
+            "schedule": settings.derbit_config.DERIBIT_INSTRUMENT_SYNC_INTERVAL,
+        },
+        "maintain-price-partitions-daily": {
+            "task": "tasks.partitions.maintain_price_partitions",
+            "schedule": crontab(hour=0, minute=5),
+        },
     },
 )
+
+
+@worker_init.connect
+def start_worker_metrics_server(**kwargs) -> None:
+    """
+    Запустить HTTP-сервер метрик в главном процессе воркера.
+
+    Задачи выполняются в дочерних процессах prefork: их метрики
+    видны при заданном PROMETHEUS_MULTIPROC_DIR.
+    """
+    port = settings.monitoring_config.METRICS_WORKER_PORT
+    if settings.monitoring_config.METRICS_ENABLED and port:
+        start_metrics_server(port)
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs) -> None:
+    """
+    Сбросить унаследованные после fork HTTP-сессии,
+    запустить event loop и пул БД процесса, настроить трассировку.
+    """
+    default_session_pool.reset()
+    worker_runtime.reset()
+    worker_runtime.start()
+
+    # Провайдер трассировки создаётся после fork (поток экспорта)
+    if setup_tracing("crypto-price-tracker-worker"):
+        instrument_celery()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs) -> None:
+    """
+    Закрыть HTTP-сессии, пул БД и event loop процесса воркера,
+    убрать его live-гейджи из метрик.
+    """
+    worker_runtime.stop()
+    default_session_pool.close_all()
+    mark_process_dead(kwargs.get("pid") or os.getpid())
@@ -12,6 +12,7 @@ from .database import data_config
 from .settings import Settings
 from .app import app_config
 from .cors import cors_config
+from .stream import stream_config
 from .logging import (
     setup_logger,
     get_logger,
@@ -29,5 +30,6 @@ __all__ = [
     "setup_logger",
     "get_logger",
     "setup_logging",
-    "cors_config"
+    "cors_config",
+    "stream_config"
 ]
@@ -17,6 +17,22 @@ class DataBaseConfig(BaseConfig):
     DB_PASSWORD: str = Field(description="Пароль БД")
     DB_DRIVER: str = Field(description="Драйвер БД")
 
+    # СЕКЦИОНИРОВАНИЕ pricerecords
+    PARTITION_PRECREATE_MONTHS: int = Field(
+        description="На сколько месяцев вперёд создавать партиции"
+    )
+    PARTITION_RETENTION_MONTHS: int = Field(
+        description="Сколько месяцев хранить сырые цены (0 — бессрочно)"
+    )
+    PARTITION_DROP_EXPIRED: bool = Field(
+        description="Удалять устаревшие партиции (иначе только отсоединять)"
+    )
+
+    # КОМПАКТНОЕ ХРАНЕНИЕ
+    COMPACT_STORAGE_ENABLED: bool = Field(
+        description="Дублировать записи цен в pricerecords_compact"
+    )
+
     def get_database_url(self) -> str:
         """
         Получить URL базы данных с указанным драйвером
@@ -11,6 +11,48 @@ class DeribitConfig(BaseConfig):
     DERIBIT_API_URL: str = Field(
         description="Базовый URL Deribit API"
     )
+    DERIBIT_MAX_CONCURRENCY: int = Field(
+        description="Максимум параллельных запросов к Deribit API"
+    )
+    DERIBIT_REQUEST_TIMEOUT: float = Field(
+        description="Таймаут получения цены по одному тикеру (сек)"
+    )
+
+    # Пул соединений
+    DERIBIT_POOL_LIMIT: int = Field(
+        description="Максимум одновременных соединений в пуле"
+    )
+    DERIBIT_KEEPALIVE_TIMEOUT: float = Field(
+        description="Время жизни простаивающего keep-alive соединения (сек)"
+    )
+    DERIBIT_DNS_CACHE_TTL: int = Field(
+        description="TTL кэша DNS-резолвинга (сек)"
+    )
+
+    # Реестр инструментов
+    DERIBIT_INSTRUMENT_SYNC_INTERVAL: int = Field(
+        description="Интервал синхронизации реестра с индексами Deribit (сек)"
+    )
+    DERIBIT_INSTRUMENT_CACHE_TTL: float = Field(
+        description="Время жизни реестра тикеров в памяти процесса (сек)"
+    )
+    DERIBIT_INSTRUMENT_AUTO_ACTIVATE: bool = Field(
+        description="Сразу собирать цены новых индексов Deribit"
+    )
+
+    # WebSocket
+    DERIBIT_WS_URL: str = Field(
+        description="URL WebSocket Deribit API"
+    )
+    DERIBIT_WS_HEARTBEAT: int = Field(
+        description="Интервал heartbeat WebSocket (сек)"
+    )
+    DERIBIT_WS_RECONNECT_MIN_DELAY: float = Field(
+        description="Начальная задержка переподключения (сек)"
+    )
+    DERIBIT_WS_RECONNECT_MAX_DELAY: float = Field(
+        description="Максимальная задержка переподключения (сек)"
+    )
 
 
 derbit_config = DeribitConfig()
@@ -1,6 +1,8 @@
 """  Конфигурация мониторинга и логирования """
 
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import BaseConfig
@@ -22,6 +24,12 @@ class MonitoringConfig(BaseConfig):
     ENABLE_REQUEST_LOGGING: bool = Field(
         description="Включить логи запросов"
     )
+    REQUEST_LOG_SAMPLE_RATE: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Доля запросов в журнале (ответы 5xx пишутся всегда)"
+    )
     ENABLE_EXCEPTION_LOGGING: bool = Field(
         description="Включить логи ошибок"
     )
@@ -29,6 +37,40 @@ class MonitoringConfig(BaseConfig):
         description="Включить логи бизнес-логики"
     )
 
+    # МЕТРИКИ
+    METRICS_ENABLED: bool = Field(
+        default=True,
+        description="Публиковать метрики Prometheus (/metrics)"
+    )
+    METRICS_WORKER_PORT: int = Field(
+        default=9808,
+        description="Порт HTTP-сервера метрик воркера Celery (0 — выкл.)"
+    )
+
+    # ТРАССИРОВКА (OpenTelemetry, extra "tracing")
+    TRACING_ENABLED: bool = Field(
+        default=False,
+        description="Включить трассировку OpenTelemetry"
+    )
+    TRACING_EXPORTER: Literal["otlp", "file"] = Field(
+        default="otlp",
+        description="Экспорт спанов: OTLP-коллектор или файл JSON Lines"
+    )
+    TRACING_OTLP_ENDPOINT: str = Field(
+        default="http://localhost:4317",
+        description="Адрес OTLP/gRPC коллектора"
+    )
+    TRACING_FILE_PATH: str = Field(
+        default="traces.jsonl",
+        description="Файл спанов для экспорта file"
+    )
+    TRACING_SAMPLE_RATIO: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Доля трассируемых запросов"
+    )
+
     # ОКРУЖЕНИЕ
     DEBUG: bool = Field(description="Режим отладки")
 
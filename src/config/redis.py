@@ -18,10 +18,29 @@ class RedisConfig(BaseConfig):
         description="Номер базы данных Redis"
     )
 
+    # КЭШ ЦЕН
+    REDIS_CACHE_ENABLED: bool = Field(
+        description="Включить общий Redis-кэш чтения цен"
+    )
+    REDIS_CACHE_DB: int = Field(
+        description="Номер базы данных Redis для кэша цен"
+    )
+    REDIS_CACHE_TTL: int = Field(
+        description="Время жизни записей кэша цен (сек)"
+    )
+
     @property
     def url(self) -> str:
         """Получить URL подключения к Redis."""
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
+    @property
+    def cache_url(self) -> str:
+        """Получить URL подключения к Redis для кэша цен."""
+        return (
+            f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/"
+            f"{self.REDIS_CACHE_DB}"
+        )
+
 
 redis_config = RedisConfig()
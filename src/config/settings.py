@@ -9,6 +9,7 @@ from .redis import redis_config
 from .database import data_config
 from .app import app_config
 from .cors import cors_config
+from .stream import stream_config
 
 
 class Settings:
@@ -23,6 +24,7 @@ class Settings:
         self.deribit = derbit_config
         self.redis = redis_config
         self.cors = cors_config
+        self.stream = stream_config
 
 
 settings = Settings()
@@ -0,0 +1,39 @@
+""" Конфигурация потокового сбора цен """
+
+from pydantic import Field
+
+from .base import BaseConfig
+
+
+class StreamConfig(BaseConfig):
+    """Конфигурация потокового сбора цен"""
+
+    STREAM_QUEUE_SIZE: int = Field(
+        description="Размер очереди тиков между WebSocket и писателем"
+    )
+    STREAM_BATCH_SIZE: int = Field(
+        description="Максимальный размер пачки записи в БД"
+    )
+    STREAM_FLUSH_INTERVAL: float = Field(
+        description="Максимальное ожидание добора пачки (сек)"
+    )
+
+    # Live-рассылка цен клиентам API
+    LIVE_PRICES_ENABLED: bool = Field(
+        description="Публиковать новые цены в Redis pub/sub для SSE/WebSocket"
+    )
+    LIVE_CHANNEL: str = Field(
+        description="Канал Redis pub/sub новых цен"
+    )
+    LIVE_CLIENT_BUFFER_SIZE: int = Field(
+        description=(
+            "Буфер сообщений одного клиента; при переполнении "
+            "вытесняются самые старые"
+        )
+    )
+    LIVE_HEARTBEAT_INTERVAL: float = Field(
+        description="Интервал keep-alive комментариев SSE (сек)"
+    )
+
+
+stream_config = StreamConfig()
@@ -4,12 +4,16 @@ from .database import (
     database_manager
 )
 from .dependencies import get_db
+from .pool import InstrumentedAsyncPool
 from .uow import UnitOfWork
+from .partitions import PricePartitionManager
 
 __all__ = [
     "DatabaseManager",
     "get_db_session",
     "get_db",
+    "InstrumentedAsyncPool",
     "UnitOfWork",
-    "database_manager"
+    "database_manager",
+    "PricePartitionManager"
 ]
@@ -11,13 +11,17 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from config import settings
+from .pool import InstrumentedAsyncPool
 
 
 class DatabaseManager:
     """Менеджер базы данных для управления подключением."""
 
     def __init__(self, database_url: str):
-        self.engine = create_async_engine(database_url)
+        self.engine = create_async_engine(
+            database_url,
+            poolclass=InstrumentedAsyncPool
+        )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
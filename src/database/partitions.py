@@ -0,0 +1,182 @@
+""" Обслуживание месячных партиций таблицы pricerecords """
+
+import logging
+import re
+import typing
+from datetime import datetime, timezone
+
+from sqlalchemy import CursorResult, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import PriceRecord
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = PriceRecord.__tablename__
+PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})(\d{{2}})$")
+# Партиция записей вне месячных диапазонов
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+
+def month_start(year: int, month: int) -> datetime:
+    """Начало месяца в UTC с нормализацией переполнения месяца."""
+    year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+def partition_name(start: datetime) -> str:
+    """Имя партиции месяца: pricerecords_pYYYYMM."""
+    return f"{PARENT_TABLE}_p{start:%Y%m}"
+
+
+class PricePartitionManager:
+    """
+    Создание будущих и вывод устаревших партиций pricerecords.
+
+    Записи вне месячных партиций лежат в DEFAULT-партиции; при создании
+    партиции месяца его записи переносятся в неё из DEFAULT.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_partitions(self) -> list[str]:
+        """Имена подключённых партиций pricerecords."""
+        result = await self._session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :parent"
+            ),
+            {"parent": PARENT_TABLE}
+        )
+        return list(result.scalars().all())
+
+    async def ensure_partitions(
+        self,
+        months_ahead: int,
+        now: datetime | None = None
+    ) -> list[str]:
+        """
+        Создать партиции текущего месяца и months_ahead следующих.
+
+        Returns:
+            Имена созданных партиций.
+        """
+        now = now or datetime.now(timezone.utc)
+        return await self._ensure_months([
+            month_start(now.year, now.month + offset)
+            for offset in range(months_ahead + 1)
+        ])
+
+    async def ensure_range(self, start_date: int, end_date: int) -> list[str]:
+        """
+        Создать партиции всех месяцев, пересекающих
+        [start_date, end_date] (UNIX timestamp).
+
+        Returns:
+            Имена созданных партиций.
+        """
+        first = datetime.fromtimestamp(start_date, timezone.utc)
+        last = datetime.fromtimestamp(end_date, timezone.utc)
+        count = (last.year - first.year) * 12 + last.month - first.month + 1
+        return await self._ensure_months([
+            month_start(first.year, first.month + offset)
+            for offset in range(count)
+        ])
+
+    async def absorb_default(self) -> list[str]:
+        """
+        Перенести записи из DEFAULT-партиции в месячные партиции,
+        создав их.
+
+        Returns:
+            Имена созданных партиций.
+        """
+        result = await self._session.execute(text(
+            "SELECT DISTINCT date_trunc("
+            "'month', to_timestamp(timestamp) AT TIME ZONE 'UTC') "
+            f'FROM "{DEFAULT_PARTITION}"'
+        ))
+        return await self._ensure_months([
+            month_start(month.year, month.month)
+            for month in result.scalars().all()
+        ])
+
+    async def _ensure_months(self, months: list[datetime]) -> list[str]:
+        """
+        Создать недостающие партиции месяцев.
+
+        Таблица месяца создаётся отдельно, записи её диапазона
+        переносятся из DEFAULT-партиции, затем таблица подключается:
+        CREATE ... PARTITION OF упал бы, будь в DEFAULT такие записи.
+        """
+        existing = set(await self.list_partitions())
+        created = []
+
+        for start in sorted(set(months)):
+            name = partition_name(start)
+            if name in existing:
+                continue
+            lower = int(start.timestamp())
+            upper = int(month_start(start.year, start.month + 1).timestamp())
+
+            await self._session.execute(text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" '
+                f'(LIKE "{PARENT_TABLE}" INCLUDING DEFAULTS)'
+            ))
+            moved = typing.cast(CursorResult, await self._session.execute(text(
+                f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+                f"WHERE timestamp >= {lower} AND timestamp < {upper} "
+                f'RETURNING *) INSERT INTO "{name}" SELECT * FROM moved'
+            )))
+            await self._session.execute(text(
+                f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{name}" '
+                f"FOR VALUES FROM ({lower}) TO ({upper})"
+            ))
+            if moved.rowcount:
+                logger.info(
+                    f"Moved {moved.rowcount} rows from default into {name}")
+            existing.add(name)
+            created.append(name)
+
+        return created
+
+    async def apply_retention(
+        self,
+        retention_months: int,
+        drop: bool,
+        now: datetime | None = None
+    ) -> list[str]:
+        """
+        Отсоединить (и при drop=True удалить) партиции, целиком
+        лежащие раньше чем retention_months месяцев назад.
+
+        Returns:
+            Имена выведенных партиций.
+        """
+        if retention_months <= 0:
+            return []
+
+        now = now or datetime.now(timezone.utc)
+        cutoff = month_start(now.year, now.month - retention_months)
+        expired = []
+
+        for name in await self.list_partitions():
+            match = PARTITION_NAME.match(name)
+            if match is None:
+                continue
+            year, month = int(match.group(1)), int(match.group(2))
+            # Партиция устарела, если её верхняя граница не позже cutoff
+            if month_start(year, month + 1) > cutoff:
+                continue
+
+            await self._session.execute(text(
+                f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"'
+            ))
+            if drop:
+                await self._session.execute(text(f'DROP TABLE "{name}"'))
+            expired.append(name)
+
+        return expired
@@ -0,0 +1,30 @@
+""" Пул соединений с метриками ожидания """
+
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_WAIT
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool, измеряющий ожидание свободного соединения
+    и число выданных соединений.
+
+    Рост ожидания при полном пуле — сигнал увеличить pool_size
+    или сократить время удержания сессий.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+        DB_POOL_CHECKED_OUT.inc()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        DB_POOL_CHECKED_OUT.dec()
+        super()._do_return_conn(record)
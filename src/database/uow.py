@@ -1,10 +1,18 @@
 """Unit of Work паттерн для управления транзакциями."""
 
-from typing import Optional
+import time
+from typing import Awaitable, Callable, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from repositories import PriceRepository
+from config import settings
+from metrics import DB_COMMIT_DURATION
+from repositories import (
+    CompactPriceRepository,
+    PriceRepository,
+    RollupRepository,
+    TickerRepository
+)
 
 
 class UnitOfWork:
@@ -13,6 +21,10 @@ class UnitOfWork:
     def __init__(self, session: AsyncSession) -> None:
         self._session: AsyncSession = session
         self._prices: Optional[PriceRepository] = None
+        self._rollups: Optional[RollupRepository] = None
+        self._compact_prices: Optional[CompactPriceRepository] = None
+        self._tickers: Optional[TickerRepository] = None
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
 
     async def __aenter__(self) -> "UnitOfWork":
         """Вход в контекстный менеджер."""
@@ -25,12 +37,26 @@ class UnitOfWork:
         else:
             await self.commit()
 
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Зарегистрировать действие, выполняемое после успешного коммита
+        (инвалидация кэшей, публикация событий).
+        """
+        self._after_commit.append(callback)
+
     async def commit(self) -> None:
-        """Зафиксировать транзакцию."""
+        """Зафиксировать транзакцию и выполнить after-commit действия."""
+        started = time.perf_counter()
         await self._session.commit()
+        DB_COMMIT_DURATION.observe(time.perf_counter() - started)
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            await callback()
 
     async def rollback(self) -> None:
-        """Откатить транзакцию."""
+        """Откатить транзакцию и отменить after-commit действия."""
+        self._after_commit.clear()
         await self._session.rollback()
 
     @property
@@ -38,5 +64,32 @@ class UnitOfWork:
         """Получить репозиторий цен (lazy initialization)"""
 
         if self._prices is None:
-            self._prices = PriceRepository(self._session)
+            self._prices = PriceRepository(
+                self._session,
+                compact_storage=settings.data_config.COMPACT_STORAGE_ENABLED
+            )
         return self._prices
+
+    @property
+    def rollups(self) -> RollupRepository:
+        """Получить репозиторий агрегатов (lazy initialization)"""
+
+        if self._rollups is None:
+            self._rollups = RollupRepository(self._session)
+        return self._rollups
+
+    @property
+    def compact_prices(self) -> CompactPriceRepository:
+        """Получить репозиторий компактного хранения (lazy initialization)"""
+
+        if self._compact_prices is None:
+            self._compact_prices = CompactPriceRepository(self._session)
+        return self._compact_prices
+
+    @property
+    def tickers(self) -> TickerRepository:
+        """Получить репозиторий реестра тикеров (lazy initialization)"""
+
+        if self._tickers is None:
+            self._tickers = TickerRepository(self._session)
+        return self._tickers
@@ -1,11 +1,13 @@
 from .exceptions import (
     PriceNotFoundError,
+    UnknownTickerError,
     DeribitClientError,
     ErrorResponse
 )
 
 __all__ = [
     'PriceNotFoundError',
+    'UnknownTickerError',
     'DeribitClientError',
     'ErrorResponse'
 ]
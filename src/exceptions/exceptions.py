@@ -19,6 +19,14 @@ class PriceNotFoundError(Exception):
         super().__init__(f"Нет данных о цене для {self.ticker}: {ticker}")
 
 
+class UnknownTickerError(Exception):
+    """Тикер отсутствует в реестре инструментов"""
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        super().__init__(f"Неизвестный тикер: {ticker}")
+
+
 class DeribitClientError(Exception):
     """Ошибка клиента Deribit API"""
 
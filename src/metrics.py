@@ -0,0 +1,140 @@
+"""
+Метрики Prometheus процесса: БД, задачи Celery, HTTP API
+
+Метрики клиента Deribit — в clients/metrics.py.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+    REGISTRY
+)
+
+# Границы для быстрых операций (запросы БД, ожидание пула)
+FAST_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+# --- База данных ---
+
+PRICE_ROWS_WRITTEN = Counter(
+    "price_rows_written_total",
+    "Записи цен, вставленные репозиторием",
+    ["method"],
+)
+
+PRICE_WRITE_DURATION = Histogram(
+    "price_write_duration_seconds",
+    "Длительность записи пачки цен",
+    ["method"],
+    buckets=FAST_BUCKETS,
+)
+
+DB_COMMIT_DURATION = Histogram(
+    "db_commit_duration_seconds",
+    "Длительность коммита транзакции UnitOfWork",
+    buckets=FAST_BUCKETS,
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Ожидание соединения из пула SQLAlchemy",
+    buckets=FAST_BUCKETS,
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Соединения, выданные из пула",
+    multiprocess_mode="livesum",
+)
+
+# --- Задачи Celery ---
+
+TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Длительность выполнения задачи",
+    ["task", "status"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+TASK_RETRIES = Counter(
+    "celery_task_retries_total",
+    "Перезапуски задачи после ошибки",
+    ["task"],
+)
+
+TASK_TIMEOUTS = Counter(
+    "celery_task_timeouts_total",
+    "Задачи, прерванные soft time limit",
+    ["task"],
+)
+
+# --- HTTP API ---
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Длительность обработки HTTP-запроса",
+    ["method", "route", "status"],
+    buckets=FAST_BUCKETS,
+)
+
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP-запросы в обработке",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """
+    Реестр для публикации метрик.
+
+    При нескольких процессах (PROMETHEUS_MULTIPROC_DIR задан)
+    метрики собираются из файлов всех процессов.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def mark_process_dead(pid: int) -> None:
+    """
+    Удалить файлы live-гейджей завершившегося процесса, чтобы
+    его значения не оставались в livesum после перезапуска дочернего
+    процесса prefork.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Сериализовать метрики в текстовый формат Prometheus."""
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
+
+
+_metrics_server_started = False
+
+
+def start_metrics_server(port: int) -> None:
+    """
+    Запустить HTTP-сервер метрик в фоновом потоке (идемпотентно).
+
+    Модуль celery_app загружается и как src.celery_app, и как
+    celery_app, поэтому обработчик сигнала может сработать дважды.
+    """
+    global _metrics_server_started
+    if _metrics_server_started:
+        return
+    start_http_server(port, registry=metrics_registry())
+    _metrics_server_started = True
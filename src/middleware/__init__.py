@@ -1,10 +1,12 @@
 from .business import BusinessLogicLogger, get_business_logger
 from .exception_handler import ExceptionHandlerMiddleware
+from .http_metrics import MetricsMiddleware
 
 
 __all__ = [
 
     'ExceptionHandlerMiddleware',
+    'MetricsMiddleware',
     'BusinessLogicLogger',
     'get_business_logger'
 
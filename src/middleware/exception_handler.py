@@ -1,51 +1,140 @@
-"""Middleware для обработки исключений """
+"""ASGI middleware обработки исключений и журнала запросов"""
 
 import logging
+import random
+import time
 import traceback
-from typing import Any, Callable
 
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.status import (
+    HTTP_404_NOT_FOUND,
+    HTTP_500_INTERNAL_SERVER_ERROR
+)
 
 from config import settings
-from exceptions import PriceNotFoundError, ErrorResponse
+from exceptions import PriceNotFoundError, UnknownTickerError, ErrorResponse
 
 
-class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware для централизованной обработки исключений."""
+class ExceptionHandlerMiddleware:
+    """
+    Middleware для централизованной обработки исключений
+    и журнала запросов.
 
-    def __init__(self, app: ASGIApp, logger: logging.Logger | None = None):
-        super().__init__(app)
+    Чистый ASGI: в отличие от BaseHTTPMiddleware, нет отдельной задачи
+    и потока-посредника на запрос, тело ответа (включая стриминг /export
+    и /live) передаётся без изменений.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: logging.Logger | None = None,
+        sample_rate: float | None = None
+    ):
+        """
+        Args:
+            app: Следующее ASGI-приложение.
+            logger: Логгер ошибок и запросов.
+            sample_rate: Доля запросов в журнале (по умолчанию
+                REQUEST_LOG_SAMPLE_RATE); ответы 5xx пишутся всегда.
+        """
+        config = settings.monitoring_config
+        self.app = app
         self.logger = logger or logging.getLogger(__name__)
-        self.enabled = settings.monitoring_config.ENABLE_EXCEPTION_LOGGING
+        self.handle_exceptions = config.ENABLE_EXCEPTION_LOGGING
+        self.log_requests = config.ENABLE_REQUEST_LOGGING
+        self.sample_rate = (
+            config.REQUEST_LOG_SAMPLE_RATE if sample_rate is None
+            else sample_rate
+        )
 
-    async def dispatch(
+    async def __call__(
         self,
-        request: Request,
-        call_next: Callable[[Request], Any]
-    ) -> Response:
-        """Обработка всех исключений."""
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ) -> None:
+        if scope["type"] != "http" or not (
+            self.handle_exceptions or self.log_requests
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+        response_started = False
 
-        if not self.enabled:
-            return await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+            await send(message)
 
+        started = time.perf_counter()
         try:
-            return await call_next(request)
-        except PriceNotFoundError as e:
-            self.logger.warning(f"Price not found: {e.ticker}")
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if not self.handle_exceptions:
+                raise
+            if response_started:
+                # Заголовки уже отправлены — ответ не заменить,
+                # соединение закрывает сервер
+                self.logger.error(
+                    f"Error after response started: {str(e)}\n"
+                    f"{traceback.format_exc()}")
+                raise
+
+            response = self._error_response(e)
+            status_code = response.status_code
+            await response(scope, receive, send)
+        finally:
+            if self.log_requests and (
+                status_code >= HTTP_500_INTERNAL_SERVER_ERROR
+                or self.sample_rate >= 1.0
+                or random.random() < self.sample_rate
+            ):
+                self._log_request(
+                    scope, status_code, time.perf_counter() - started
+                )
+
+    def _error_response(self, exc: Exception) -> JSONResponse:
+        """Ответ на исключение (вызывается внутри блока except)."""
+
+        if isinstance(exc, PriceNotFoundError):
+            self.logger.warning(f"Price not found: {exc.ticker}")
             return JSONResponse(
-                status_code=404,
-                content={"detail": str(e)}
+                status_code=HTTP_404_NOT_FOUND,
+                content={"detail": str(exc)}
             )
-        except Exception as e:
-            # Непредвиденные ошибки
-            self.logger.error(
-                f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
+        if isinstance(exc, UnknownTickerError):
+            self.logger.warning(f"Unknown ticker: {exc.ticker}")
             return JSONResponse(
-                status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-                content=ErrorResponse(
-                    detail="Internal server error").model_dump()
+                status_code=HTTP_404_NOT_FOUND,
+                content={"detail": str(exc)}
             )
+
+        # Непредвиденные ошибки
+        self.logger.error(
+            f"Unexpected error: {str(exc)}\n{traceback.format_exc()}")
+        return JSONResponse(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content=ErrorResponse(detail="Internal server error").model_dump()
+        )
+
+    def _log_request(
+        self,
+        scope: Scope,
+        status_code: int,
+        elapsed: float
+    ) -> None:
+        """Строка журнала запроса: метод, путь, статус, длительность."""
+
+        path = scope["path"]
+        if scope.get("query_string"):
+            path = f"{path}?{scope['query_string'].decode('latin-1')}"
+        client = scope.get("client")
+        self.logger.info(
+            f"{scope['method']} {path} {status_code} "
+            f"{elapsed * 1000:.1f}ms client={client[0] if client else '-'}"
+        )
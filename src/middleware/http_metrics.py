@@ -0,0 +1,62 @@
+"""ASGI middleware метрик HTTP-запросов"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+# Метка для путей без маршрута — ограничивает кардинальность
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def resolve_route(scope: Scope) -> str:
+    """
+    Шаблон маршрута запроса (/api/prices/{ticker}, а не сам путь),
+    чтобы число временных рядов не росло с числом тикеров.
+
+    Маршрут кладёт в scope роутер FastAPI при сопоставлении, поэтому
+    функция вызывается после обработки запроса — повторного
+    сопоставления нет.
+    """
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """
+    Латентность и число запросов в обработке по маршрутам.
+
+    Чистый ASGI: тело ответа не буферизуется, стриминг (/export,
+    /live) проходит без изменений. Длительность считается до
+    окончания отправки ответа.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Маршрут до обработки неизвестен — запросы в обработке
+        # считаются по методу
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            HTTP_REQUEST_DURATION.labels(
+                method, resolve_route(scope), str(status_code)
+            ).observe(time.perf_counter() - started)
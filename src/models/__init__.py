@@ -1,7 +1,23 @@
 from .models_base import BaseModel
-from .models import PriceRecord
+from .models import (
+    PriceRecord,
+    PriceRollupBase,
+    PriceRollup1m,
+    PriceRollup1h,
+    PriceRollup1d,
+    PRICE_ROLLUPS,
+    Ticker,
+    CompactPriceRecord
+)
 
 __all__ = [
     'BaseModel',
-    'PriceRecord'
+    'PriceRecord',
+    'PriceRollupBase',
+    'PriceRollup1m',
+    'PriceRollup1h',
+    'PriceRollup1d',
+    'PRICE_ROLLUPS',
+    'Ticker',
+    'CompactPriceRecord'
 ]
@@ -1,5 +1,6 @@
-from .type_decorators import UUIDTypeDecorator
+from .type_decorators import UUIDTypeDecorator, ScaledDecimalTypeDecorator
 
 __all__ = [
-    "UUIDTypeDecorator"
+    "UUIDTypeDecorator",
+    "ScaledDecimalTypeDecorator"
 ]
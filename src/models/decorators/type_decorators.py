@@ -1,8 +1,9 @@
 """Декораторы типов для SQLAlchemy"""
 
+from decimal import Decimal
 from uuid import UUID as UUIDType
 
-from sqlalchemy import String
+from sqlalchemy import BigInteger, String
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy import TypeDecorator
 
@@ -34,3 +35,30 @@ class UUIDTypeDecorator(TypeDecorator):
             return value
         else:
             return UUIDType(value)
+
+
+class ScaledDecimalTypeDecorator(TypeDecorator):
+    """
+    Decimal с фиксированной точкой, хранимый как BIGINT.
+
+    Значение умножается на 10**scale: 8 байт вместо numeric
+    переменной длины, целочисленные сравнения и агрегаты.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def __init__(self, scale: int = 8, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scale = scale
+        self._factor = Decimal(10) ** scale
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        return int((Decimal(str(value)) * self._factor).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        return Decimal(value) / self._factor
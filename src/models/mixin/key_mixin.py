@@ -13,6 +13,5 @@ class UUIDPrimaryKeyMixin:
         UUIDTypeDecorator(),
         default=uuid4,
         primary_key=True,
-        index=True,
         comment='Уникальный идентификатор'
     )
@@ -13,6 +13,5 @@ class UnixTimestampMixin:
     timestamp: Mapped[int] = mapped_column(
         BigInteger,
         nullable=False,
-        index=True,
         comment='UNIX timestamp цены'
     )
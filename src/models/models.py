@@ -1,28 +1,178 @@
 """Модели базы данных для приложения crypto price tracker."""
 
 from decimal import Decimal
+from typing import ClassVar
 
 from sqlalchemy import (
     DECIMAL,
+    BigInteger,
+    Boolean,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    SmallInteger,
     String,
+    true,
 )
 from sqlalchemy.orm import (
     Mapped,
     mapped_column
 )
 
-from .models_base import BaseModel
+from .decorators import ScaledDecimalTypeDecorator
+
+from .models_base import Base, BaseModel
 
 
 class PriceRecord(BaseModel):
-    """Модель для хранения записей цен криптовалют."""
+    """
+    Модель для хранения записей цен криптовалют.
+
+    Таблица секционирована по месяцам (RANGE по timestamp),
+    партиции ведёт задача tasks.partitions.maintain_price_partitions.
+    """
 
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
+
+    # Ключ секционирования обязан входить в первичный ключ
+    timestamp: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        comment='UNIX timestamp цены'
+    )
     ticker: Mapped[str] = mapped_column(
         String(20),
-        nullable=False,
-        index=True
+        nullable=False
     )
     price: Mapped[Decimal] = mapped_column(
         DECIMAL(20, 8),
         nullable=False
     )
+
+
+# Покрывающий индекс под все чтения: фильтр по тикеру,
+# сортировка по времени (новые первыми), index-only scan.
+# Уникальность (ticker, timestamp) — цель ON CONFLICT DO NOTHING
+Index(
+    "ix_pricerecords_ticker_timestamp",
+    PriceRecord.ticker,
+    PriceRecord.timestamp.desc(),
+    unique=True,
+    postgresql_include=["price", "created_at"]
+)
+
+
+class PriceRollupBase(Base):
+    """
+    Базовая модель агрегата цен (OHLC) за интервал.
+
+    open_ts/close_ts хранят время первой/последней цены интервала,
+    чтобы инкрементальный upsert корректно обновлял open и close.
+    """
+
+    __abstract__ = True
+
+    # Длительность интервала в секундах
+    interval_seconds: ClassVar[int]
+
+    ticker: Mapped[str] = mapped_column(String(20), primary_key=True)
+    bucket: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        comment='Начало интервала (UNIX timestamp)'
+    )
+    open: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
+    high: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
+    low: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
+    close: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    open_ts: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    close_ts: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class PriceRollup1m(PriceRollupBase):
+    """Минутные агрегаты цен."""
+
+    __tablename__ = "pricerollups_1m"
+    interval_seconds = 60
+
+
+class PriceRollup1h(PriceRollupBase):
+    """Часовые агрегаты цен."""
+
+    __tablename__ = "pricerollups_1h"
+    interval_seconds = 3600
+
+
+class PriceRollup1d(PriceRollupBase):
+    """Дневные агрегаты цен."""
+
+    __tablename__ = "pricerollups_1d"
+    interval_seconds = 86400
+
+
+# От крупных к мелким — для выбора самого грубого подходящего агрегата
+PRICE_ROLLUPS: list[type[PriceRollupBase]] = [
+    PriceRollup1d,
+    PriceRollup1h,
+    PriceRollup1m,
+]
+
+
+class Ticker(Base):
+    """
+    Реестр инструментов: индексы Deribit, цены которых собираются.
+
+    Также справочник идентификаторов для компактного хранения цен.
+    """
+
+    __tablename__ = "tickers"
+
+    id: Mapped[int] = mapped_column(
+        SmallInteger,
+        Identity(),
+        primary_key=True
+    )
+    name: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        unique=True
+    )
+    active: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        server_default=true(),
+        comment='Собирать цены индекса'
+    )
+
+
+class CompactPriceRecord(Base):
+    """
+    Компактная запись цены: 18 байт данных на строку.
+
+    Естественный ключ (ticker_id, timestamp) вместо UUID,
+    smallint-ссылка на справочник вместо строки тикера,
+    цена как целое с масштабом 10**8 вместо DECIMAL.
+    Колонки 8-байтовые первыми — без выравнивающих отступов.
+    """
+
+    __tablename__ = "pricerecords_compact"
+    __table_args__ = (PrimaryKeyConstraint("ticker_id", "timestamp"),)
+
+    timestamp: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment='UNIX timestamp цены'
+    )
+    price: Mapped[Decimal] = mapped_column(
+        ScaledDecimalTypeDecorator(scale=8),
+        nullable=False,
+        comment='Цена * 10^8'
+    )
+    ticker_id: Mapped[int] = mapped_column(
+        SmallInteger,
+        ForeignKey("tickers.id"),
+        nullable=False
+    )
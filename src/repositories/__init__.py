@@ -1,5 +1,13 @@
 """Репозитории для работы с базой данных."""
 
 from .price_repository import PriceRepository
+from .rollup_repository import RollupRepository
+from .compact_price_repository import CompactPriceRepository
+from .ticker_repository import TickerRepository
 
-__all__ = ["PriceRepository"]
+__all__ = [
+    "PriceRepository",
+    "RollupRepository",
+    "CompactPriceRepository",
+    "TickerRepository"
+]
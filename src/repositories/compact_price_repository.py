@@ -0,0 +1,112 @@
+"""Репозиторий компактного хранения цен"""
+
+from typing import ClassVar, Iterable, Mapping, Sequence
+
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import CompactPriceRecord, Ticker
+from schemas import PricePointResponse
+
+
+class CompactPriceRepository:
+    """Репозиторий для записей pricerecords_compact и справочника тикеров"""
+
+    # Идентификаторы тикеров не меняются — кэшируем на процесс
+    _ticker_ids: ClassVar[dict[str, int]] = {}
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def resolve_ticker_ids(self, names: Iterable[str]) -> dict[str, int]:
+        """
+        Получить идентификаторы тикеров, добавив отсутствующие в справочник.
+        """
+
+        names = set(names)
+        ids = {n: self._ticker_ids[n] for n in names if n in self._ticker_ids}
+        missing = names - ids.keys()
+        if not missing:
+            return ids
+
+        result = await self._session.execute(
+            select(Ticker.name, Ticker.id).where(Ticker.name.in_(missing))
+        )
+        existing = dict(result.tuples().all())
+        # В кэш попадают только уже закоммиченные тикеры
+        self._ticker_ids.update(existing)
+        ids.update(existing)
+
+        missing -= existing.keys()
+        if missing:
+            result = await self._session.execute(
+                insert(Ticker)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=[Ticker.name])
+                .returning(Ticker.name, Ticker.id)
+            )
+            ids.update(dict(result.tuples().all()))
+
+        # Тикер мог быть добавлен параллельной транзакцией
+        missing -= ids.keys()
+        if missing:
+            result = await self._session.execute(
+                select(Ticker.name, Ticker.id).where(Ticker.name.in_(missing))
+            )
+            ids.update(dict(result.tuples().all()))
+
+        return ids
+
+    async def save_many(self, rows: Sequence[Mapping]) -> None:
+        """
+        Сохранить пачку записей одним INSERT (в рамках текущей транзакции).
+
+        Повторная запись того же (ticker, timestamp) игнорируется.
+        """
+
+        if not rows:
+            return
+
+        ticker_ids = await self.resolve_ticker_ids(row["ticker"] for row in rows)
+        await self._session.execute(
+            insert(CompactPriceRecord)
+            .values([
+                {
+                    "ticker_id": ticker_ids[row["ticker"]],
+                    "timestamp": row["timestamp"],
+                    "price": row["price"],
+                }
+                for row in rows
+            ])
+            .on_conflict_do_nothing()
+        )
+
+    async def get_prices_by_date_range(
+        self,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        limit: int = 100
+    ) -> Sequence[PricePointResponse]:
+        """Получить записи о ценах в диапазоне дат (новые первыми)"""
+
+        query = (
+            select(
+                Ticker.name.label("ticker"),
+                CompactPriceRecord.price,
+                CompactPriceRecord.timestamp
+            )
+            .join(Ticker, Ticker.id == CompactPriceRecord.ticker_id)
+            .where(
+                and_(
+                    Ticker.name == ticker,
+                    CompactPriceRecord.timestamp >= start_date,
+                    CompactPriceRecord.timestamp <= end_date
+                )
+            )
+            .order_by(CompactPriceRecord.timestamp.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(query)
+        return [PricePointResponse.model_validate(row) for row in result.all()]
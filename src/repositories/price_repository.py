@@ -1,54 +1,204 @@
 """Репозиторий для работы с ценами"""
 
-from typing import Sequence
+import time
+import typing
+from typing import AsyncIterator, Mapping, Sequence
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, and_
+import numpy as np
+from sqlalchemy import (
+    CursorResult, Double, Row, String, cast, func, literal, select, and_,
+    text, true, tuple_
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY, aggregate_order_by, array_agg, insert
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from metrics import PRICE_ROWS_WRITTEN, PRICE_WRITE_DURATION
 from models import PriceRecord
-from schemas import PriceRecordResponse
+from tracing import traced
+from utils import JSONRow
+from .rollup_repository import RollupRepository
+from .compact_price_repository import CompactPriceRepository
+
+
+# Колонки записи в порядке полей PriceRecordResponse
+RECORD_COLUMNS = (
+    PriceRecord.ticker,
+    PriceRecord.id,
+    PriceRecord.price,
+    PriceRecord.timestamp,
+    PriceRecord.created_at,
+)
 
 
 class PriceRepository:
     """Репозиторий для операций с записями о ценах"""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        compact_storage: bool = False
+    ) -> None:
+        """
+        Args:
+            session: Сессия БД.
+            compact_storage: Дублировать записи в pricerecords_compact.
+        """
         self._session = session
+        self._rollups = RollupRepository(session)
+        self._compact = (
+            CompactPriceRepository(session) if compact_storage else None
+        )
 
     async def save_price_data(
         self, ticker: str, price: float, timestamp: int
-    ) -> PriceRecord:
-        """Сохранить запись о цене в БД"""
+    ) -> PriceRecord | None:
+        """
+        Сохранить запись о цене в БД (в рамках текущей транзакции)
+
+        Возвращает None, если цена за этот timestamp уже сохранена.
+        """
+
+        records = await self.save_many(
+            [{"ticker": ticker, "price": price, "timestamp": timestamp}]
+        )
+        return records[0] if records else None
+
+    @traced()
+    async def save_many(
+        self, rows: Sequence[Mapping]
+    ) -> Sequence[PriceRecord]:
+        """
+        Сохранить пачку записей одним INSERT ... ON CONFLICT DO NOTHING
+        RETURNING и инкрементально обновить агрегаты.
+
+        Записи с уже существующим (ticker, timestamp) пропускаются и не
+        возвращаются, поэтому повторы задачи идемпотентны.
+        Коммит не выполняется — транзакцией управляет UnitOfWork.
+        """
+
+        if not rows:
+            return []
+
+        started = time.perf_counter()
+        result = await self._session.scalars(
+            insert(PriceRecord)
+            .on_conflict_do_nothing(
+                index_elements=[PriceRecord.ticker, PriceRecord.timestamp]
+            )
+            .returning(PriceRecord),
+            [dict(row) for row in rows]
+        )
+        records = result.all()
+        await self._rollups.upsert(records)
+        if self._compact is not None:
+            await self._compact.save_many(rows)
+
+        PRICE_WRITE_DURATION.labels("insert").observe(
+            time.perf_counter() - started
+        )
+        PRICE_ROWS_WRITTEN.labels("insert").inc(len(records))
+        return records
+
+    @traced()
+    async def copy_many(self, rows: Sequence[Mapping]) -> int:
+        """
+        Загрузить большую пачку записей через COPY (asyncpg).
+
+        COPY идёт во временную таблицу, откуда записи переносятся
+        INSERT ... ON CONFLICT DO NOTHING — повторная загрузка идемпотентна.
+        Записи не возвращаются; id сохраняется, если передан,
+        created_at/updated_at заполняются серверными значениями
+        по умолчанию. Агрегаты не обновляются — после загрузки их нужно
+        пересчитать (RollupRepository.rebuild).
+
+        Returns:
+            Количество вставленных записей.
+        """
+
+        if not rows:
+            return 0
+
+        started = time.perf_counter()
+        table = PriceRecord.__tablename__
+        stage = f"{table}_stage"
+
+        await self._session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+            f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        ))
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        # Соединение asyncpg: COPY недоступен через DBAPI-адаптер
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None
+        await driver_connection.copy_records_to_table(
+            stage,
+            records=[
+                (
+                    row.get("id") or uuid4(),
+                    row["ticker"],
+                    row["price"],
+                    row["timestamp"]
+                )
+                for row in rows
+            ],
+            columns=["id", "ticker", "price", "timestamp"]
+        )
+
+        # text() выполняется без ORM — результат курсорный, с rowcount
+        result = typing.cast(CursorResult, await self._session.execute(text(
+            f"WITH moved AS (DELETE FROM {stage} RETURNING *) "
+            f"INSERT INTO {table} SELECT * FROM moved "
+            f"ON CONFLICT (ticker, timestamp) DO NOTHING"
+        )))
 
-        record = PriceRecord(
-            ticker=ticker,
-            price=price,
-            timestamp=timestamp
+        PRICE_WRITE_DURATION.labels("copy").observe(
+            time.perf_counter() - started
         )
-        self._session.add(record)
-        await self._session.commit()
-        await self._session.refresh(record)
-        return record
+        PRICE_ROWS_WRITTEN.labels("copy").inc(result.rowcount)
+        return result.rowcount
 
+    @traced()
     async def get_prices_by_ticker(
         self,
         ticker: str,
         limit: int = 100,
-        offset: int = 0
-    ) -> Sequence[PriceRecordResponse]:
-        """Получить записи о ценах для тикера (новые первыми)"""
+        offset: int = 0,
+        after: tuple[int, UUID] | None = None
+    ) -> Sequence[JSONRow]:
+        """
+        Получить записи о ценах для тикера (новые первыми)
+
+        Если передан after = (timestamp, id), выполняется keyset-переход
+        по индексу сразу за этой позицией, offset игнорируется.
+        Возвращаются строки колонок, без ORM-объектов и pydantic-моделей.
+        """
 
         query = (
-            select(PriceRecord)
+            select(*RECORD_COLUMNS)
             .where(PriceRecord.ticker == ticker)
-            .order_by(PriceRecord.timestamp.desc())
+            .order_by(PriceRecord.timestamp.desc(), PriceRecord.id.desc())
             .limit(limit)
-            .offset(offset)
         )
+        if after is not None:
+            timestamp, record_id = after
+            query = query.where(
+                # Условие по timestamp отдельно — для поиска по индексу
+                PriceRecord.timestamp <= timestamp,
+                tuple_(PriceRecord.timestamp, PriceRecord.id)
+                < tuple_(timestamp, literal(record_id, PriceRecord.id.type))
+            )
+        else:
+            query = query.offset(offset)
         result = await self._session.execute(query)
-        records = result.scalars().all()
-        return [PriceRecordResponse.model_validate(r) for r in records]
+        return [row._asdict() for row in result]
 
+    @traced()
     async def get_latest_price(self, ticker: str) -> PriceRecord | None:
         """Получить последнюю цену для тикера"""
 
@@ -61,17 +211,77 @@ class PriceRepository:
         result = await self._session.execute(query)
         return result.scalar_one_or_none()
 
+    @traced()
+    async def get_latest_prices(
+        self, tickers: Sequence[str]
+    ) -> Sequence[PriceRecord]:
+        """
+        Получить последние цены нескольких тикеров одним запросом
+
+        unnest(tickers) CROSS JOIN LATERAL (... LIMIT 1): для каждого
+        тикера — один спуск по индексу (ticker, timestamp DESC), в отличие
+        от DISTINCT ON, который читает все записи тикеров.
+        Тикеры без записей в результат не попадают.
+        """
+
+        if not tickers:
+            return []
+
+        requested = (
+            func.unnest(literal(list(tickers), ARRAY(String)))
+            .table_valued("ticker")
+            .render_derived()
+        )
+        latest = (
+            select(PriceRecord)
+            .where(PriceRecord.ticker == requested.c.ticker)
+            .order_by(PriceRecord.timestamp.desc())
+            .limit(1)
+            .lateral()
+        )
+        record = aliased(PriceRecord, latest)
+
+        result = await self._session.execute(
+            select(record).select_from(requested).join(latest, true())
+        )
+        return result.scalars().all()
+
+    @traced()
+    async def get_first_timestamp(self, ticker: str | None = None) -> int | None:
+        """Получить время самой старой записи (по тикеру или по всем)"""
+
+        query = select(func.min(PriceRecord.timestamp))
+        if ticker is not None:
+            query = query.where(PriceRecord.ticker == ticker)
+        return await self._session.scalar(query)
+
+    @traced()
     async def get_prices_by_date_range(
         self,
         ticker: str,
         start_date: int,
         end_date: int,
-        limit: int = 100
-    ) -> Sequence[PriceRecordResponse]:
-        """Получить записи о ценах в диапазоне дат"""
+        limit: int = 100,
+        resolution_seconds: int | None = None
+    ) -> Sequence[JSONRow]:
+        """
+        Получить записи о ценах в диапазоне дат
+
+        Если задано разрешение, запрос уходит в самый грубый
+        подходящий агрегат (одна точка на интервал) вместо сырых записей.
+        """
+
+        if resolution_seconds is not None:
+            return await self._rollups.get_points(
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                resolution_seconds=resolution_seconds,
+                limit=limit
+            )
 
         query = (
-            select(PriceRecord)
+            select(*RECORD_COLUMNS)
             .where(
                 and_(
                     PriceRecord.ticker == ticker,
@@ -83,5 +293,145 @@ class PriceRepository:
             .limit(limit)
         )
         result = await self._session.execute(query)
-        records = result.scalars().all()
-        return [PriceRecordResponse.model_validate(r) for r in records]
+        return [row._asdict() for row in result]
+
+    @traced()
+    async def get_price_series(
+        self,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        limit: int = 10000,
+        resolution_seconds: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Получить ряд цен в диапазоне дат как массивы NumPy
+
+        Берутся последние limit точек (сырые записи или точки агрегата),
+        упорядоченные по возрастанию времени.
+
+        Returns:
+            (timestamps int64, prices float64) — непрерывные массивы.
+        """
+
+        if resolution_seconds is not None:
+            points = await self._rollups.get_points(
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                resolution_seconds=resolution_seconds,
+                limit=limit
+            )
+            rows = [(p["timestamp"], p["price"]) for p in reversed(points)]
+        else:
+            query = (
+                select(PriceRecord.timestamp, cast(PriceRecord.price, Double))
+                .where(
+                    and_(
+                        PriceRecord.ticker == ticker,
+                        PriceRecord.timestamp >= start_date,
+                        PriceRecord.timestamp <= end_date
+                    )
+                )
+                .order_by(PriceRecord.timestamp.desc())
+                .limit(limit)
+            )
+            result = await self._session.execute(query)
+            rows = result.all()[::-1]
+
+        timestamps = np.fromiter(
+            (row[0] for row in rows), dtype=np.int64, count=len(rows)
+        )
+        prices = np.fromiter(
+            (row[1] for row in rows), dtype=np.float64, count=len(rows)
+        )
+        return timestamps, prices
+
+    async def stream_prices_by_date_range(
+        self,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        batch_size: int = 5000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Потоково выдать записи о ценах в диапазоне дат (старые первыми)
+
+        Использует серверный курсор: в памяти одновременно не более
+        batch_size строк.
+        """
+
+        query = (
+            select(
+                PriceRecord.id,
+                PriceRecord.ticker,
+                PriceRecord.price,
+                PriceRecord.timestamp,
+                PriceRecord.created_at
+            )
+            .where(
+                and_(
+                    PriceRecord.ticker == ticker,
+                    PriceRecord.timestamp >= start_date,
+                    PriceRecord.timestamp <= end_date
+                )
+            )
+            .order_by(PriceRecord.timestamp.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(query)
+        async for partition in result.partitions():
+            yield partition
+
+    @traced()
+    async def get_candles(
+        self,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        interval_seconds: int,
+        limit: int = 1000
+    ) -> Sequence[JSONRow]:
+        """
+        Получить свечи OHLC по интервалам (старые первыми)
+
+        Группировка выполняется в БД: timestamp хранится как UNIX
+        секунды, поэтому начало интервала — timestamp - timestamp % step
+        (аналог date_bin для целочисленного времени). Если интервалов
+        в диапазоне больше limit, возвращаются последние limit свечей.
+        """
+
+        bucket = (
+            PriceRecord.timestamp - PriceRecord.timestamp % interval_seconds
+        ).label("bucket")
+
+        query = (
+            select(
+                bucket,
+                array_agg(
+                    aggregate_order_by(
+                        PriceRecord.price, PriceRecord.timestamp.asc()
+                    )
+                )[1].label("open"),
+                func.max(PriceRecord.price).label("high"),
+                func.min(PriceRecord.price).label("low"),
+                array_agg(
+                    aggregate_order_by(
+                        PriceRecord.price, PriceRecord.timestamp.desc()
+                    )
+                )[1].label("close"),
+                func.count().label("count")
+            )
+            .where(
+                and_(
+                    PriceRecord.ticker == ticker,
+                    PriceRecord.timestamp >= start_date,
+                    PriceRecord.timestamp <= end_date
+                )
+            )
+            .group_by(bucket)
+            .order_by(bucket.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(query)
+        return [row._asdict() for row in result][::-1]
@@ -0,0 +1,200 @@
+"""Репозиторий агрегатов цен (rollup) разных разрешений"""
+
+from collections import defaultdict
+from typing import Sequence
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import PRICE_ROLLUPS, PriceRecord, PriceRollupBase
+from tracing import traced
+from utils import JSONRow
+
+
+class RollupRepository:
+    """Репозиторий для инкрементального обновления и чтения агрегатов"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @staticmethod
+    def select_rollup(resolution_seconds: int) -> type[PriceRollupBase]:
+        """
+        Выбрать самый грубый агрегат, интервал которого
+        делит запрошенное разрешение без остатка.
+        """
+        for rollup in PRICE_ROLLUPS:
+            if resolution_seconds % rollup.interval_seconds == 0:
+                return rollup
+        raise ValueError(f"Unsupported resolution: {resolution_seconds}s")
+
+    @traced()
+    async def upsert(self, records: Sequence[PriceRecord]) -> None:
+        """
+        Добавить новые записи о ценах во все агрегаты (в рамках
+        текущей транзакции).
+
+        Записи предварительно группируются по (ticker, bucket):
+        один INSERT ... ON CONFLICT не может обновить строку дважды.
+        """
+
+        if not records:
+            return
+
+        for rollup in PRICE_ROLLUPS:
+            step = rollup.interval_seconds
+            groups: dict[tuple[str, int], list[PriceRecord]] = defaultdict(list)
+            for record in records:
+                bucket = record.timestamp - record.timestamp % step
+                groups[(record.ticker, bucket)].append(record)
+
+            rows = []
+            for (ticker, bucket), group in groups.items():
+                group.sort(key=lambda r: r.timestamp)
+                prices = [r.price for r in group]
+                rows.append({
+                    "ticker": ticker,
+                    "bucket": bucket,
+                    "open": group[0].price,
+                    "high": max(prices),
+                    "low": min(prices),
+                    "close": group[-1].price,
+                    "count": len(group),
+                    "open_ts": group[0].timestamp,
+                    "close_ts": group[-1].timestamp,
+                })
+
+            table = rollup.__table__
+            stmt = insert(rollup).values(rows)
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.ticker, table.c.bucket],
+                set_={
+                    "open": case(
+                        (excluded.open_ts < table.c.open_ts, excluded.open),
+                        else_=table.c.open
+                    ),
+                    "open_ts": func.least(table.c.open_ts, excluded.open_ts),
+                    "high": func.greatest(table.c.high, excluded.high),
+                    "low": func.least(table.c.low, excluded.low),
+                    "close": case(
+                        (excluded.close_ts >= table.c.close_ts, excluded.close),
+                        else_=table.c.close
+                    ),
+                    "close_ts": func.greatest(
+                        table.c.close_ts, excluded.close_ts
+                    ),
+                    "count": table.c.count + excluded.count,
+                }
+            )
+            await self._session.execute(stmt)
+
+    @traced()
+    async def rebuild(
+        self,
+        start_date: int,
+        end_date: int,
+        ticker: str | None = None
+    ) -> None:
+        """
+        Пересчитать агрегаты из сырых записей за [start_date, end_date).
+
+        Границы выравниваются по дневному интервалу, чтобы каждый
+        затронутый интервал пересчитывался по полному набору записей.
+        """
+
+        day = PRICE_ROLLUPS[0].interval_seconds
+        start_date -= start_date % day
+        end_date += -end_date % day
+
+        for rollup in PRICE_ROLLUPS:
+            step = rollup.interval_seconds
+            bucket = (
+                PriceRecord.timestamp - PriceRecord.timestamp % step
+            ).label("bucket")
+
+            conditions = [
+                PriceRecord.timestamp >= start_date,
+                PriceRecord.timestamp < end_date,
+            ]
+            if ticker is not None:
+                conditions.append(PriceRecord.ticker == ticker)
+
+            source = (
+                select(
+                    PriceRecord.ticker,
+                    bucket,
+                    array_agg(aggregate_order_by(
+                        PriceRecord.price, PriceRecord.timestamp.asc()
+                    ))[1],
+                    func.max(PriceRecord.price),
+                    func.min(PriceRecord.price),
+                    array_agg(aggregate_order_by(
+                        PriceRecord.price, PriceRecord.timestamp.desc()
+                    ))[1],
+                    func.count(),
+                    func.min(PriceRecord.timestamp),
+                    func.max(PriceRecord.timestamp),
+                )
+                .where(and_(*conditions))
+                .group_by(PriceRecord.ticker, bucket)
+            )
+
+            table = rollup.__table__
+            columns = [
+                "ticker", "bucket", "open", "high", "low", "close",
+                "count", "open_ts", "close_ts",
+            ]
+            stmt = insert(rollup).from_select(columns, source)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.ticker, table.c.bucket],
+                set_={
+                    name: stmt.excluded[name]
+                    for name in columns[2:]
+                }
+            )
+            await self._session.execute(stmt)
+
+    @traced()
+    async def get_points(
+        self,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        resolution_seconds: int,
+        limit: int = 1000
+    ) -> Sequence[JSONRow]:
+        """
+        Получить цены с заданным разрешением (новые первыми).
+
+        Читается самый грубый подходящий агрегат; цена точки —
+        цена закрытия интервала.
+        """
+
+        rollup = self.select_rollup(resolution_seconds)
+        bucket = (
+            rollup.bucket - rollup.bucket % resolution_seconds
+        ).label("timestamp")
+
+        query = (
+            select(
+                rollup.ticker,
+                bucket,
+                array_agg(aggregate_order_by(
+                    rollup.close, rollup.close_ts.desc()
+                ))[1].label("price"),
+            )
+            .where(
+                and_(
+                    rollup.ticker == ticker,
+                    rollup.bucket >= start_date - start_date % resolution_seconds,
+                    rollup.bucket <= end_date
+                )
+            )
+            .group_by(rollup.ticker, bucket)
+            .order_by(bucket.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(query)
+        return [row._asdict() for row in result]
@@ -0,0 +1,56 @@
+"""Репозиторий реестра инструментов"""
+
+from typing import Iterable, Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Ticker
+
+
+class TickerRepository:
+    """Репозиторий для записей реестра тикеров"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_active(self) -> Sequence[str]:
+        """Получить имена тикеров, цены которых собираются"""
+
+        result = await self._session.scalars(
+            select(Ticker.name).where(Ticker.active.is_(True))
+        )
+        return result.all()
+
+    async def sync(self, names: Iterable[str], activate: bool = False) -> int:
+        """
+        Синхронизировать реестр со списком индексов биржи
+        (в рамках текущей транзакции).
+
+        Новые тикеры добавляются активными, если activate=True;
+        существующие не меняются. Тикеры, которых больше нет
+        в списке, деактивируются.
+
+        Returns:
+            Количество добавленных тикеров.
+        """
+
+        names = sorted(set(names))
+        if not names:
+            return 0
+
+        result = await self._session.scalars(
+            insert(Ticker)
+            .values([{"name": name, "active": activate} for name in names])
+            .on_conflict_do_nothing(index_elements=[Ticker.name])
+            .returning(Ticker.name)
+        )
+        added = len(result.all())
+
+        await self._session.execute(
+            update(Ticker)
+            .where(Ticker.name.not_in(names), Ticker.active.is_(True))
+            .values(active=False)
+        )
+        return added
@@ -2,9 +2,15 @@
 
 from .responses import (
     PriceRecordResponse,
+    PricePointResponse,
     PriceLatestResponse,
+    PriceLatestBatchResponse,
     PriceDateRangeResponse,
-
+    CandleResponse,
+    PriceCandlesResponse,
+    PriceStatsPoint,
+    PriceStatsSummary,
+    PriceStatsResponse,
 )
 from .base import (
     BaseSchema,
@@ -16,18 +22,35 @@ from .base import (
 from .requests import (
     AllPricesQuery,
     LatestPriceQuery,
-    DateRangePricesQuery
+    LatestPricesQuery,
+    LivePricesQuery,
+    DateRangePricesQuery,
+    ExportPricesQuery,
+    CandlesQuery,
+    PriceStatsQuery
 )
 
 __all__ = [
     "PriceRecordResponse",
+    "PricePointResponse",
     "PriceLatestResponse",
+    "PriceLatestBatchResponse",
     "PriceDateRangeResponse",
+    "CandleResponse",
+    "PriceCandlesResponse",
+    "PriceStatsPoint",
+    "PriceStatsSummary",
+    "PriceStatsResponse",
     "BaseSchema",
     "TickerBase",
     "DateRangeBase",
     "PaginationBase",
     "AllPricesQuery",
     "LatestPriceQuery",
-    "DateRangePricesQuery"
+    "LatestPricesQuery",
+    "LivePricesQuery",
+    "DateRangePricesQuery",
+    "ExportPricesQuery",
+    "CandlesQuery",
+    "PriceStatsQuery"
 ]
@@ -1,8 +1,13 @@
 """Параметры запросов."""
 
+from typing import Literal
+
 from pydantic import Field
 
+from utils import CandleInterval
+
 from .base import (
+    BaseSchema,
     DateRangeBase,
     PaginationBase,
     TickerBase
@@ -17,13 +22,134 @@ class DateRangePricesQuery(TickerBase, DateRangeBase):
         le=10000,
         description="Максимальное количество записей"
     )
+    resolution: CandleInterval | None = Field(
+        default=None,
+        description=(
+            "Разрешение: одна точка (цена закрытия) на интервал из "
+            "агрегатов. Без параметра возвращаются сырые записи"
+        )
+    )
 
 
 class AllPricesQuery(TickerBase, PaginationBase):
     """ Запрос всех цен по тикеру """
-    pass
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Курсор следующей страницы из заголовка X-Next-Cursor "
+            "(keyset-пагинация, используется вместо offset)"
+        )
+    )
 
 
 class LatestPriceQuery(TickerBase):
     """ Запрос последней цены """
     pass
+
+
+# Максимум тикеров в одном запросе /latest/batch и /live
+MAX_BATCH_TICKERS = 200
+
+
+def split_tickers(value: str) -> list[str]:
+    """Разобрать список тикеров через запятую (без повторов)."""
+    tickers = list(dict.fromkeys(
+        t.strip() for t in value.split(",") if t.strip()
+    ))
+    if not tickers:
+        raise ValueError("Нужно указать хотя бы один тикер")
+    if len(tickers) > MAX_BATCH_TICKERS:
+        raise ValueError(
+            f"Не более {MAX_BATCH_TICKERS} тикеров в одном запросе"
+        )
+    return tickers
+
+
+class LatestPricesQuery(BaseSchema):
+    """ Запрос последних цен нескольких тикеров """
+    tickers: str = Field(
+        ...,
+        description=(
+            f"Тикеры через запятую (не более {MAX_BATCH_TICKERS})"
+        ),
+        examples=["BTC_USD,ETH_USD"]
+    )
+
+    @property
+    def ticker_list(self) -> list[str]:
+        """
+        Тикеры без повторов в порядке запроса.
+
+        Raises:
+            ValueError: Список пуст или длиннее MAX_BATCH_TICKERS.
+        """
+        return split_tickers(self.tickers)
+
+
+class LivePricesQuery(BaseSchema):
+    """ Подписка на новые цены """
+    tickers: str | None = Field(
+        default=None,
+        description=(
+            "Тикеры через запятую; без параметра — все тикеры"
+        ),
+        examples=["BTC_USD,ETH_USD"]
+    )
+
+    @property
+    def ticker_list(self) -> list[str] | None:
+        """
+        Тикеры без повторов или None (все).
+
+        Raises:
+            ValueError: Список пуст или длиннее MAX_BATCH_TICKERS.
+        """
+        return None if self.tickers is None else split_tickers(self.tickers)
+
+
+class ExportPricesQuery(TickerBase, DateRangeBase):
+    """ Запрос потоковой выгрузки цен по диапазону дат """
+    format: Literal["ndjson", "csv", "parquet", "arrow"] = Field(
+        default="ndjson",
+        description=(
+            "Формат выгрузки: построчные ndjson/csv или колоночные "
+            "parquet (zstd) / arrow (Arrow IPC stream)"
+        )
+    )
+
+
+class CandlesQuery(TickerBase, DateRangeBase):
+    """ Запрос свечей по диапазону дат """
+    interval: CandleInterval = Field(
+        default="1m",
+        description="Размер свечи"
+    )
+    limit: int = Field(
+        default=1000,
+        ge=1,
+        le=10000,
+        description="Максимальное количество свечей"
+    )
+
+
+class PriceStatsQuery(TickerBase, DateRangeBase):
+    """ Запрос статистики цен по диапазону дат """
+    window: int = Field(
+        default=20,
+        ge=2,
+        le=1000,
+        description="Размер скользящего окна в точках"
+    )
+    resolution: CandleInterval | None = Field(
+        default=None,
+        description=(
+            "Разрешение ряда: цены закрытия интервалов из агрегатов. "
+            "Без параметра используются сырые записи"
+        )
+    )
+    limit: int = Field(
+        default=10000,
+        ge=2,
+        le=100000,
+        description="Максимальное количество точек (последние по времени)"
+    )
@@ -2,12 +2,12 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import Field
 
-from .base import TickerBase
+from .base import BaseSchema, TickerBase
 
 
 class PriceRecordResponse(TickerBase):
@@ -19,6 +19,13 @@ class PriceRecordResponse(TickerBase):
     created_at: datetime = Field(..., description="Время создания записи в БД")
 
 
+class PricePointResponse(TickerBase):
+    """ Точка цены агрегата (цена закрытия интервала) """
+
+    price: Decimal = Field(..., description="Цена закрытия интервала")
+    timestamp: int = Field(..., ge=0, description="Начало интервала в UNIX timestamp")
+
+
 class PriceLatestResponse(TickerBase):
     """Последняя цена"""
 
@@ -27,13 +34,107 @@ class PriceLatestResponse(TickerBase):
     fetched_at: datetime = Field(..., description="Время получения цены")
 
 
+class PriceLatestBatchResponse(BaseSchema):
+    """Последние цены нескольких тикеров"""
+
+    prices: Dict[str, Optional[PriceLatestResponse]] = Field(
+        default_factory=dict,
+        description="Последняя цена по тикеру (null — цен ещё нет)"
+    )
+    unknown: List[str] = Field(
+        default_factory=list,
+        description="Запрошенные тикеры, которые не отслеживаются"
+    )
+
+
 class PriceDateRangeResponse(TickerBase):
     """Цены по диапазону дат"""
 
     start_date: int = Field(..., ge=0, description="Начало диапазона")
     end_date: int = Field(..., ge=0, description="Конец диапазона")
+    resolution: str | None = Field(
+        default=None,
+        description="Разрешение агрегата (None — сырые записи)"
+    )
     count: int = Field(..., ge=0, description="Количество записей")
-    prices: List[PriceRecordResponse] = Field(
+    prices: List[PriceRecordResponse | PricePointResponse] = Field(
         default_factory=list,
         description="Список записей о ценах"
     )
+
+
+class CandleResponse(BaseSchema):
+    """Свеча OHLC за интервал"""
+
+    bucket: int = Field(..., ge=0, description="Начало интервала (UNIX timestamp)")
+    open: Decimal = Field(..., description="Первая цена интервала")
+    high: Decimal = Field(..., description="Максимальная цена интервала")
+    low: Decimal = Field(..., description="Минимальная цена интервала")
+    close: Decimal = Field(..., description="Последняя цена интервала")
+    count: int = Field(..., ge=0, description="Количество записей в интервале")
+
+
+class PriceCandlesResponse(TickerBase):
+    """Свечи по диапазону дат"""
+
+    interval: str = Field(..., description="Размер свечи")
+    start_date: int = Field(..., ge=0, description="Начало диапазона")
+    end_date: int = Field(..., ge=0, description="Конец диапазона")
+    count: int = Field(..., ge=0, description="Количество свечей")
+    candles: List[CandleResponse] = Field(
+        default_factory=list,
+        description="Свечи, старые первыми"
+    )
+
+
+class PriceStatsPoint(BaseSchema):
+    """Точка ряда со скользящими значениями"""
+
+    timestamp: int = Field(..., ge=0, description="Время в UNIX timestamp")
+    price: float = Field(..., description="Цена")
+    log_return: Optional[float] = Field(
+        None, description="Логарифмическая доходность к предыдущей точке"
+    )
+    moving_average: Optional[float] = Field(
+        None, description="Скользящее среднее цены по окну"
+    )
+    volatility: Optional[float] = Field(
+        None, description="Годовая реализованная волатильность по окну"
+    )
+
+
+class PriceStatsSummary(BaseSchema):
+    """Сводная статистика ряда"""
+
+    first_price: float
+    last_price: float
+    min_price: float
+    max_price: float
+    mean_price: float
+    twap: float = Field(..., description="Средняя цена, взвешенная по времени")
+    total_return: float = Field(..., description="Доходность за период")
+    mean_log_return: Optional[float] = None
+    volatility: Optional[float] = Field(
+        None, description="Годовая реализованная волатильность за период"
+    )
+    max_drawdown: float = Field(..., description="Максимальная просадка (<= 0)")
+    drawdown_peak_timestamp: int
+    drawdown_trough_timestamp: int
+
+
+class PriceStatsResponse(TickerBase):
+    """Статистика цен по диапазону дат"""
+
+    start_date: int = Field(..., ge=0, description="Начало диапазона")
+    end_date: int = Field(..., ge=0, description="Конец диапазона")
+    window: int = Field(..., ge=2, description="Размер скользящего окна")
+    resolution: str | None = Field(
+        default=None,
+        description="Разрешение агрегата (None — сырые записи)"
+    )
+    count: int = Field(..., ge=0, description="Количество точек")
+    summary: Optional[PriceStatsSummary] = None
+    points: List[PriceStatsPoint] = Field(
+        default_factory=list,
+        description="Точки ряда, старые первыми"
+    )
@@ -1,3 +1,39 @@
 from .price_service import PriceService, get_price_service
+from .instrument_registry import InstrumentRegistry, get_instrument_registry
+from .price_stream_writer import PriceStreamWriter
+from .latest_price_cache import LatestPriceCache, get_latest_price_cache
+from .price_redis_cache import PriceRedisCache, get_price_redis_cache
+from .live_prices import (
+    LivePricePublisher,
+    LiveSubscription,
+    PriceBroadcaster,
+    get_live_price_publisher,
+    get_price_broadcaster
+)
+from .price_archive import (
+    ARCHIVE_FORMATS,
+    ImportResult,
+    PriceArchiveService,
+    get_price_archive_service
+)
 
-__all__ = ["PriceService", "get_price_service"]
+__all__ = [
+    "PriceService",
+    "get_price_service",
+    "InstrumentRegistry",
+    "get_instrument_registry",
+    "PriceStreamWriter",
+    "LatestPriceCache",
+    "get_latest_price_cache",
+    "PriceRedisCache",
+    "get_price_redis_cache",
+    "LivePricePublisher",
+    "LiveSubscription",
+    "PriceBroadcaster",
+    "get_live_price_publisher",
+    "get_price_broadcaster",
+    "ARCHIVE_FORMATS",
+    "ImportResult",
+    "PriceArchiveService",
+    "get_price_archive_service"
+]
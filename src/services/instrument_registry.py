@@ -0,0 +1,124 @@
+"""
+Реестр инструментов: тикеры, цены которых собираются
+"""
+
+import asyncio
+import logging
+import time
+from typing import FrozenSet
+
+from clients import DeribitClient
+from config import settings
+from database import UnitOfWork
+from exceptions import UnknownTickerError
+
+logger = logging.getLogger(__name__)
+
+# Длина колонки ticker в pricerecords
+MAX_TICKER_LENGTH = 20
+
+
+class InstrumentRegistry:
+    """
+    In-memory копия таблицы tickers с TTL.
+
+    Проверка тикера — поиск в frozenset; при истечении TTL набор
+    перечитывается из БД одним запросом на процесс.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Args:
+            ttl: Время жизни набора тикеров в памяти (сек).
+        """
+        self._ttl = ttl
+        self._tickers: FrozenSet[str] = frozenset()
+        self._expires_at = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def tickers(self) -> FrozenSet[str]:
+        """Последний загруженный набор активных тикеров."""
+        return self._tickers
+
+    def load(self, tickers) -> None:
+        """Заменить набор тикеров и продлить TTL."""
+        self._tickers = frozenset(tickers)
+        self._expires_at = time.monotonic() + self._ttl
+
+    def invalidate(self) -> None:
+        """Перечитать набор при следующем обращении."""
+        self._expires_at = 0.0
+
+    async def refresh(self, uow: UnitOfWork) -> FrozenSet[str]:
+        """
+        Получить активные тикеры, перечитав их из БД, если TTL истёк.
+
+        Конкурентные обращения ждут одну загрузку.
+        """
+        if self._expires_at > time.monotonic():
+            return self._tickers
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._expires_at <= time.monotonic():
+                self.load(await uow.tickers.list_active())
+        return self._tickers
+
+    async def require(self, uow: UnitOfWork, ticker: str) -> str:
+        """
+        Нормализовать тикер (верхний регистр) и проверить его по реестру.
+
+        Raises:
+            UnknownTickerError: Тикера нет среди активных.
+        """
+        ticker = ticker.upper()
+        if ticker not in await self.refresh(uow):
+            raise UnknownTickerError(ticker)
+        return ticker
+
+    async def sync(
+        self,
+        uow: UnitOfWork,
+        client: DeribitClient,
+        activate: bool = False
+    ) -> int:
+        """
+        Синхронизировать таблицу tickers с индексами Deribit
+        (в рамках транзакции uow). Набор в памяти перечитывается
+        после коммита.
+
+        Returns:
+            Количество добавленных тикеров.
+        """
+        names = await client.fetch_index_names()
+        too_long = [name for name in names if len(name) > MAX_TICKER_LENGTH]
+        if too_long:
+            logger.warning(f"Skipping index names: {', '.join(too_long)}")
+
+        added = await uow.tickers.sync(
+            [name for name in names if len(name) <= MAX_TICKER_LENGTH],
+            activate=activate
+        )
+
+        async def invalidate() -> None:
+            self.invalidate()
+
+        uow.on_commit(invalidate)
+        return added
+
+
+# Глобальный инстанс реестра процесса
+_instrument_registry: InstrumentRegistry | None = None
+
+
+def get_instrument_registry() -> InstrumentRegistry:
+    """Получить инстанс реестра инструментов."""
+
+    global _instrument_registry
+    if _instrument_registry is None:
+        _instrument_registry = InstrumentRegistry(
+            ttl=settings.derbit_config.DERIBIT_INSTRUMENT_CACHE_TTL
+        )
+    return _instrument_registry
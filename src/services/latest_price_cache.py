@@ -0,0 +1,119 @@
+"""
+In-process кэш последних цен
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from config import settings
+from schemas import PriceRecordResponse
+
+
+class LatestPriceCache:
+    """
+    Кэш последней цены по тикеру с TTL и single-flight загрузкой.
+
+    Заполняется при записи цен и при промахе из репозитория;
+    конкурентные промахи по одному тикеру ждут одну загрузку.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Args:
+            ttl: Время жизни записи (сек), обычно равно FETCH_INTERVAL.
+        """
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, PriceRecordResponse]] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def get(self, ticker: str) -> PriceRecordResponse | None:
+        """Получить неистёкшую запись."""
+        entry = self._entries.get(ticker)
+        if entry is None:
+            return None
+
+        expires_at, record = entry
+        if expires_at < time.monotonic():
+            del self._entries[ticker]
+            return None
+        return record
+
+    def put(self, record: PriceRecordResponse) -> None:
+        """Сохранить запись, если она не старее уже закэшированной."""
+        entry = self._entries.get(record.ticker)
+        if entry is not None and entry[1].timestamp > record.timestamp:
+            return
+        self._entries[record.ticker] = (time.monotonic() + self._ttl, record)
+
+    def invalidate(self, ticker: str | None = None) -> None:
+        """Сбросить запись тикера или весь кэш."""
+        if ticker is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(ticker, None)
+
+    async def get_or_load(
+        self,
+        ticker: str,
+        loader: Callable[[], Awaitable[PriceRecordResponse | None]],
+    ) -> PriceRecordResponse | None:
+        """
+        Получить запись из кэша или загрузить через loader.
+
+        Одновременно выполняется не более одной загрузки на тикер.
+        Если загружающий запрос отменён (клиент отключился), ожидающие
+        не отменяются, а повторяют загрузку сами: loader работает
+        на сессии своего запроса, поэтому общей задачей быть не может.
+        """
+        while True:
+            record = self.get(ticker)
+            if record is not None:
+                return record
+
+            inflight = self._inflight.get(ticker)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if inflight.cancelled() and not (
+                    current is not None and current.cancelling()
+                ):
+                    # Отменена чужая загрузка, а не этот запрос
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[ticker] = future
+        try:
+            record = await loader()
+            if record is not None:
+                self.put(record)
+            future.set_result(record)
+            return record
+        except Exception as e:
+            future.set_exception(e)
+            # Помечаем исключение прочитанным, если ожидающих не было
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[ticker]
+
+
+# Глобальный инстанс кэша процесса
+_latest_price_cache: LatestPriceCache | None = None
+
+
+def get_latest_price_cache() -> LatestPriceCache:
+    """Получить инстанс кэша последних цен."""
+
+    global _latest_price_cache
+    if _latest_price_cache is None:
+        _latest_price_cache = LatestPriceCache(
+            ttl=settings.celery_config.FETCH_INTERVAL
+        )
+    return _latest_price_cache
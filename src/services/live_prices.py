@@ -0,0 +1,239 @@
+"""
+Live-рассылка новых цен через Redis pub/sub
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, FrozenSet, Sequence
+
+import orjson
+from redis import RedisError
+from redis.asyncio import Redis
+
+from config import settings
+from schemas import PriceRecordResponse
+from utils import dumps
+
+logger = logging.getLogger(__name__)
+
+
+class LivePricePublisher:
+    """
+    Публикация новых цен в канал Redis.
+
+    Вызывается после коммита записи цен; каждое сообщение — JSON
+    одной записи (как в ответе /all). Ошибки Redis не пробрасываются.
+    """
+
+    def __init__(self, url: str, channel: str, enabled: bool = True) -> None:
+        """
+        Args:
+            url: URL Redis.
+            channel: Канал pub/sub.
+            enabled: Если False, публикация не выполняется.
+        """
+        self._channel = channel
+        self._redis: Redis | None = Redis.from_url(url) if enabled else None
+
+    async def publish(self, records: Sequence[PriceRecordResponse]) -> None:
+        """Опубликовать записи одним pipeline."""
+        if self._redis is None or not records:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for record in records:
+                    pipe.publish(
+                        self._channel, dumps(record.model_dump(mode="json"))
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Live price publish failed: {e}")
+
+    async def close(self) -> None:
+        """Закрыть пул соединений Redis."""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+class LiveSubscription:
+    """
+    Подписка одного клиента: ограниченный буфер сообщений.
+
+    Медленный клиент не тормозит рассылку: при переполнении
+    буфера вытесняется самое старое сообщение.
+    """
+
+    def __init__(
+        self,
+        tickers: FrozenSet[str] | None,
+        buffer_size: int
+    ) -> None:
+        """
+        Args:
+            tickers: Тикеры подписки; None — все.
+            buffer_size: Размер буфера сообщений.
+        """
+        self.tickers = tickers
+        self.dropped = 0
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=buffer_size)
+
+    def offer(self, ticker: str, payload: bytes) -> None:
+        """Положить сообщение в буфер без ожидания."""
+        if self.tickers is not None and ticker not in self.tickers:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(payload)
+
+    async def get(self) -> bytes:
+        """Дождаться следующего сообщения."""
+        return await self._queue.get()
+
+
+class PriceBroadcaster:
+    """
+    Раздача новых цен подписчикам процесса API.
+
+    Одна подписка на канал Redis на процесс, независимо от числа
+    клиентов. Каждое сообщение разбирается один раз и раскладывается
+    по буферам подписчиков — стоимость клиента — put_nowait.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        channel: str,
+        buffer_size: int,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0
+    ) -> None:
+        """
+        Args:
+            url: URL Redis.
+            channel: Канал pub/sub.
+            buffer_size: Размер буфера одного клиента.
+            reconnect_delay: Начальная задержка переподключения (сек).
+            max_reconnect_delay: Максимальная задержка переподключения (сек).
+        """
+        self._url = url
+        self._channel = channel
+        self._buffer_size = buffer_size
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._subscriptions: set[LiveSubscription] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Количество подключённых клиентов."""
+        return len(self._subscriptions)
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        tickers: FrozenSet[str] | None = None
+    ) -> AsyncIterator[LiveSubscription]:
+        """
+        Подписаться на новые цены на время контекста.
+
+        Чтение канала запускается при первой подписке.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        subscription = LiveSubscription(tickers, self._buffer_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+            if subscription.dropped:
+                logger.info(
+                    f"Live subscriber dropped {subscription.dropped} "
+                    f"messages")
+
+    def _dispatch(self, payload: bytes) -> None:
+        """Разложить сообщение по буферам подписчиков."""
+        try:
+            ticker = orjson.loads(payload)["ticker"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            ticker = None
+        if not isinstance(ticker, str):
+            logger.warning("Skipping malformed live price message")
+            return
+        for subscription in tuple(self._subscriptions):
+            subscription.offer(ticker, payload)
+
+    async def _run(self) -> None:
+        """
+        Читать канал Redis, переподключаясь с экспоненциальной задержкой.
+
+        Любая ошибка, не только RedisError, ведёт к переподключению:
+        завершение задачи оставило бы подключённых клиентов без цен.
+        """
+        delay = self._reconnect_delay
+        while True:
+            redis = Redis.from_url(self._url)
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    delay = self._reconnect_delay
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._dispatch(message["data"])
+            except RedisError as e:
+                logger.warning(
+                    f"Live price subscription failed: {e}, "
+                    f"reconnecting in {delay}s")
+            except Exception:
+                logger.exception(
+                    f"Unexpected live price subscription error, "
+                    f"reconnecting in {delay}s")
+            finally:
+                await redis.aclose()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    async def close(self) -> None:
+        """Остановить чтение канала."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Глобальные инстансы процесса
+_live_price_publisher: LivePricePublisher | None = None
+_price_broadcaster: PriceBroadcaster | None = None
+
+
+def get_live_price_publisher() -> LivePricePublisher:
+    """Получить инстанс публикатора новых цен."""
+
+    global _live_price_publisher
+    if _live_price_publisher is None:
+        _live_price_publisher = LivePricePublisher(
+            url=settings.redis_config.cache_url,
+            channel=settings.stream_config.LIVE_CHANNEL,
+            enabled=settings.stream_config.LIVE_PRICES_ENABLED
+        )
+    return _live_price_publisher
+
+
+def get_price_broadcaster() -> PriceBroadcaster:
+    """Получить инстанс раздачи новых цен."""
+
+    global _price_broadcaster
+    if _price_broadcaster is None:
+        _price_broadcaster = PriceBroadcaster(
+            url=settings.redis_config.cache_url,
+            channel=settings.stream_config.LIVE_CHANNEL,
+            buffer_size=settings.stream_config.LIVE_CLIENT_BUFFER_SIZE
+        )
+    return _price_broadcaster
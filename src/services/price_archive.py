@@ -0,0 +1,282 @@
+"""
+Колоночная выгрузка и загрузка истории цен (Apache Arrow / Parquet)
+"""
+
+import io
+import logging
+from dataclasses import dataclass
+from typing import AsyncIterator, Sequence
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from database import PricePartitionManager, UnitOfWork
+from .price_redis_cache import PriceRedisCache, get_price_redis_cache
+
+logger = logging.getLogger(__name__)
+
+# Строк на пачку серверного курсора / пачку COPY при загрузке
+ARCHIVE_BATCH_SIZE = 50_000
+
+# Строк в одной row group Parquet
+PARQUET_ROW_GROUP_SIZE = 500_000
+
+# Колонки в порядке PriceRepository.stream_prices_by_date_range
+PRICE_ARROW_SCHEMA = pa.schema([
+    pa.field("id", pa.binary(16), nullable=False),
+    pa.field("ticker", pa.string(), nullable=False),
+    pa.field("price", pa.decimal128(20, 8), nullable=False),
+    pa.field("timestamp", pa.int64(), nullable=False),
+    pa.field("created_at", pa.timestamp("us", tz="UTC"), nullable=False),
+])
+
+ARCHIVE_FORMATS = ("parquet", "arrow")
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """Итог загрузки архива."""
+
+    rows_read: int
+    rows_inserted: int
+    first_timestamp: int | None
+    last_timestamp: int | None
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Файлоподобный приёмник для писателей pyarrow: накапливает
+    записанные байты до очередного drain().
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def to_record_batch(rows: Sequence[Row]) -> pa.RecordBatch:
+    """Собрать RecordBatch из строк (id, ticker, price, timestamp, created_at)."""
+    ids, tickers, prices, timestamps, created_at = zip(*rows)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array([i.bytes for i in ids], PRICE_ARROW_SCHEMA.field("id").type),
+            pa.array(tickers, pa.string()),
+            pa.array(prices, PRICE_ARROW_SCHEMA.field("price").type),
+            pa.array(timestamps, pa.int64()),
+            pa.array(created_at, PRICE_ARROW_SCHEMA.field("created_at").type),
+        ],
+        schema=PRICE_ARROW_SCHEMA
+    )
+
+
+class PriceArchiveService:
+    """
+    Выгрузка истории цен в Parquet / Arrow IPC и загрузка Parquet обратно.
+
+    Обе операции идут пачками фиксированного размера, поэтому
+    потребление памяти не зависит от объёма истории.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+        redis_cache: PriceRedisCache | None = None,
+    ) -> None:
+        """
+        Args:
+            batch_size: Строк на пачку чтения и записи.
+            row_group_size: Строк в row group Parquet.
+            redis_cache: Кэш запросов, сбрасываемый после загрузки.
+        """
+        self._batch_size = batch_size
+        self._row_group_size = row_group_size
+        self._redis_cache = redis_cache or get_price_redis_cache()
+
+    async def iter_record_batches(
+        self,
+        uow: UnitOfWork,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Потоково выдать записи о ценах пачками Arrow (старые первыми)."""
+        async for rows in uow.prices.stream_prices_by_date_range(
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=self._batch_size
+        ):
+            yield to_record_batch(rows)
+
+    async def export(
+        self,
+        uow: UnitOfWork,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        format: str = "parquet",
+    ) -> AsyncIterator[bytes]:
+        """
+        Потоковая выгрузка цен в Parquet (zstd) или Arrow IPC stream.
+
+        Чанки отдаются по мере готовности: для Parquet — после каждой
+        row group, для Arrow — после каждой пачки курсора.
+        """
+        if format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unsupported archive format: {format}")
+
+        sink = _ChunkSink()
+        batches = self.iter_record_batches(uow, ticker, start_date, end_date)
+
+        if format == "arrow":
+            with pa.ipc.new_stream(sink, PRICE_ARROW_SCHEMA) as writer:
+                async for batch in batches:
+                    writer.write_batch(batch)
+                    yield sink.drain()
+            yield sink.drain()
+            return
+
+        pending: list[pa.RecordBatch] = []
+        pending_rows = 0
+        with pq.ParquetWriter(
+            sink, PRICE_ARROW_SCHEMA, compression="zstd"
+        ) as writer:
+            async for batch in batches:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                if pending_rows >= self._row_group_size:
+                    writer.write_table(
+                        pa.Table.from_batches(pending),
+                        row_group_size=pending_rows
+                    )
+                    pending, pending_rows = [], 0
+                    yield sink.drain()
+            if pending:
+                writer.write_table(
+                    pa.Table.from_batches(pending),
+                    row_group_size=pending_rows
+                )
+        yield sink.drain()
+
+    async def import_parquet(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        source,
+    ) -> ImportResult:
+        """
+        Загрузить Parquet-файл через COPY (PriceRepository.copy_many).
+
+        Сначала файл просматривается по колонкам timestamp и ticker:
+        для его диапазона создаются недостающие месячные партиции
+        (в том числе для месяцев, уже выведенных политикой хранения).
+        Каждая пачка — отдельная транзакция; записи с существующим
+        (ticker, timestamp) пропускаются, поэтому загрузку можно
+        повторить после сбоя. После коммита пачки кэш её тикеров
+        сбрасывается. Агрегаты не обновляются — их нужно пересчитать
+        за [first_timestamp, last_timestamp].
+
+        Args:
+            session_factory: Фабрика сессий БД.
+            source: Путь или файлоподобный объект Parquet.
+        """
+        parquet_file = pq.ParquetFile(source)
+        rows_read = rows_inserted = 0
+        first_timestamp: int | None = None
+        last_timestamp: int | None = None
+
+        timestamp_range = self._timestamp_range(parquet_file)
+        if timestamp_range is not None:
+            first_timestamp, last_timestamp = timestamp_range
+            async with session_factory() as session:
+                async with session.begin():
+                    created = await PricePartitionManager(
+                        session
+                    ).ensure_range(*timestamp_range)
+            if created:
+                logger.info(f"Created partitions for import: {created}")
+
+        for batch in parquet_file.iter_batches(batch_size=self._batch_size):
+            rows = batch.to_pylist()
+            for row in rows:
+                if isinstance(row.get("id"), bytes):
+                    row["id"] = UUID(bytes=row["id"])
+            tickers = pc.unique(  # type: ignore[attr-defined]
+                batch.column("ticker")
+            ).to_pylist()
+
+            async with session_factory() as session:
+                async with UnitOfWork(session) as uow:
+                    inserted = await uow.prices.copy_many(rows)
+                    if inserted:
+                        async def invalidate(tickers=tickers) -> None:
+                            await self._redis_cache.invalidate_history(
+                                tickers
+                            )
+
+                        uow.on_commit(invalidate)
+            rows_inserted += inserted
+            rows_read += len(rows)
+
+        logger.info(
+            f"Imported {rows_inserted} of {rows_read} price records "
+            f"[{first_timestamp}, {last_timestamp}]")
+        return ImportResult(
+            rows_read=rows_read,
+            rows_inserted=rows_inserted,
+            first_timestamp=first_timestamp,
+            last_timestamp=last_timestamp
+        )
+
+    def _timestamp_range(
+        self, parquet_file: pq.ParquetFile
+    ) -> tuple[int, int] | None:
+        """
+        Минимальный и максимальный timestamp файла (None — строк нет).
+
+        Читается только колонка timestamp.
+        """
+        bounds: tuple[int, int] | None = None
+        for batch in parquet_file.iter_batches(
+            batch_size=self._batch_size, columns=["timestamp"]
+        ):
+            # Функции pyarrow.compute создаются при импорте
+            batch_bounds = pc.min_max(  # type: ignore[attr-defined]
+                batch.column("timestamp")
+            ).as_py()
+            if batch_bounds["min"] is None:
+                continue
+            if bounds is None:
+                bounds = (batch_bounds["min"], batch_bounds["max"])
+            else:
+                bounds = (
+                    min(bounds[0], batch_bounds["min"]),
+                    max(bounds[1], batch_bounds["max"])
+                )
+        return bounds
+
+
+def get_price_archive_service() -> PriceArchiveService:
+    """Фабрика сервиса архива цен для FastAPI/Depends."""
+    return PriceArchiveService()
@@ -0,0 +1,295 @@
+"""
+Общий Redis-кэш чтения цен для всех реплик API
+"""
+
+import logging
+import time
+from typing import Any, Iterable, List, Sequence
+
+import orjson
+from redis import RedisError
+from redis.asyncio import Redis
+
+from config import settings
+from schemas import PriceRecordResponse
+from utils import CANDLE_INTERVALS, JSONRow, dumps
+
+logger = logging.getLogger(__name__)
+
+
+class PriceRedisCache:
+    """
+    Read-through кэш запросов цен в Redis.
+
+    Все запросы по тикеру лежат в одном hash `prices:{ticker}`,
+    поле — форма запроса и параметры (`latest`, `all:100:0`,
+    `range:1704067200:1704153599:1000`, `stats:...:20:1h`). Запись новых
+    цен удаляет hash целиком и сразу кладёт свежий `latest`.
+
+    Диапазоны в полях выровнены по корзине (align_range): скользящие
+    окна вида «последние 24 часа» из разных запросов попадают в одно поле.
+
+    Значения — JSON-строки результатов без pydantic-моделей: попадание
+    в кэш стоит одного orjson.loads.
+
+    Ошибки Redis не пробрасываются: кэш деградирует до промаха.
+    """
+
+    LATEST = "latest"
+
+    # Время последнего изменения истории тикера задним числом
+    # (загрузка архива): ticker -> UNIX timestamp, без TTL
+    HISTORY_KEY = "prices:history_modified"
+
+    def __init__(
+        self,
+        url: str,
+        ttl: int,
+        range_bucket: int,
+        enabled: bool = True
+    ) -> None:
+        """
+        Args:
+            url: URL Redis.
+            ttl: Время жизни hash тикера (сек).
+            range_bucket: Корзина выравнивания диапазонов сырых записей
+                (сек), обычно FETCH_INTERVAL.
+            enabled: Если False, кэш всегда промахивается.
+        """
+        self._ttl = ttl
+        self._range_bucket = range_bucket
+        self._redis: Redis | None = Redis.from_url(url) if enabled else None
+
+    @staticmethod
+    def _key(ticker: str) -> str:
+        return f"prices:{ticker}"
+
+    @staticmethod
+    def all_field(limit: int, offset: int, cursor: str | None = None) -> str:
+        """Поле для запроса /all."""
+        if cursor is not None:
+            return f"all:{limit}:c:{cursor}"
+        return f"all:{limit}:{offset}"
+
+    def align_range(
+        self,
+        start_date: int,
+        end_date: int,
+        resolution: str | None = None
+    ) -> tuple[int, int]:
+        """
+        Расширить диапазон до границ корзины: разрешения, если задано,
+        иначе range_bucket. Начало округляется вниз, конец — до
+        последней секунды своей корзины.
+        """
+        bucket = (
+            CANDLE_INTERVALS[resolution] if resolution
+            else self._range_bucket
+        )
+        return (
+            start_date - start_date % bucket,
+            end_date - end_date % bucket + bucket - 1
+        )
+
+    @staticmethod
+    def range_field(
+        start_date: int,
+        end_date: int,
+        limit: int,
+        resolution: str | None = None
+    ) -> str:
+        """Поле для запроса /date-range (диапазон из align_range)."""
+        field = f"range:{start_date}:{end_date}:{limit}"
+        return f"{field}:{resolution}" if resolution else field
+
+    @staticmethod
+    def stats_field(
+        start_date: int,
+        end_date: int,
+        limit: int,
+        window: int,
+        resolution: str | None = None
+    ) -> str:
+        """Поле для запроса /stats (диапазон из align_range)."""
+        field = f"stats:{start_date}:{end_date}:{limit}:{window}"
+        return f"{field}:{resolution}" if resolution else field
+
+    @staticmethod
+    def _latest_row(record: PriceRecordResponse) -> JSONRow:
+        return record.model_dump(mode="json")
+
+    async def _get(self, ticker: str, field: str) -> Any | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.hget(self._key(ticker), field)
+        except RedisError as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            return None
+        return None if raw is None else orjson.loads(raw)
+
+    async def _set(self, ticker: str, field: str, value: Any) -> None:
+        if self._redis is None:
+            return
+        key = self._key(ticker)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, field, dumps(value))
+                pipe.expire(key, self._ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis cache write failed: {e}")
+
+    async def get_records(
+        self,
+        ticker: str,
+        field: str
+    ) -> List[JSONRow] | None:
+        """Получить закэшированный результат запроса или None."""
+        return await self._get(ticker, field)
+
+    async def set_records(
+        self,
+        ticker: str,
+        field: str,
+        records: Sequence[JSONRow]
+    ) -> None:
+        """Сохранить результат запроса."""
+        await self._set(ticker, field, list(records))
+
+    async def get_stats(self, ticker: str, field: str) -> JSONRow | None:
+        """Получить закэшированную статистику или None."""
+        return await self._get(ticker, field)
+
+    async def set_stats(self, ticker: str, field: str, stats: JSONRow) -> None:
+        """Сохранить статистику."""
+        await self._set(ticker, field, stats)
+
+    async def get_latest(self, ticker: str) -> PriceRecordResponse | None:
+        """Получить последнюю цену тикера."""
+        records = await self.get_records(ticker, self.LATEST)
+        if not records:
+            return None
+        return PriceRecordResponse.model_validate(records[0])
+
+    async def set_latest(self, record: PriceRecordResponse) -> None:
+        """Сохранить последнюю цену тикера."""
+        await self.set_records(
+            record.ticker, self.LATEST, [self._latest_row(record)]
+        )
+
+    async def get_latest_many(
+        self,
+        tickers: Sequence[str]
+    ) -> dict[str, PriceRecordResponse]:
+        """Получить последние цены нескольких тикеров за один round-trip."""
+        if self._redis is None or not tickers:
+            return {}
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for ticker in tickers:
+                    pipe.hget(self._key(ticker), self.LATEST)
+                raws = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            return {}
+        return {
+            ticker: PriceRecordResponse.model_validate(orjson.loads(raw)[0])
+            for ticker, raw in zip(tickers, raws)
+            if raw is not None
+        }
+
+    async def set_latest_many(
+        self,
+        records: Sequence[PriceRecordResponse]
+    ) -> None:
+        """Сохранить последние цены нескольких тикеров."""
+        if self._redis is None or not records:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for record in records:
+                    key = self._key(record.ticker)
+                    pipe.hset(
+                        key, self.LATEST, dumps([self._latest_row(record)])
+                    )
+                    pipe.expire(key, self._ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis cache write failed: {e}")
+
+    async def replace_latest(
+        self,
+        records: Sequence[PriceRecordResponse]
+    ) -> None:
+        """
+        Сбросить кэш тикеров записанных цен и положить новые `latest`.
+
+        Вызывается после коммита новых цен.
+        """
+        if self._redis is None or not records:
+            return
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for record in records:
+                    key = self._key(record.ticker)
+                    pipe.delete(key)
+                    pipe.hset(
+                        key, self.LATEST, dumps([self._latest_row(record)])
+                    )
+                    pipe.expire(key, self._ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis cache invalidation failed: {e}")
+
+    async def invalidate_history(self, tickers: Iterable[str]) -> None:
+        """
+        Сбросить кэш тикеров после изменения истории и отметить время
+        изменения (сдвигает ETag и Last-Modified ответов по истории).
+        """
+        tickers = list(tickers)
+        if self._redis is None or not tickers:
+            return
+        modified_at = time.time()
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for ticker in tickers:
+                    pipe.delete(self._key(ticker))
+                    pipe.hset(self.HISTORY_KEY, ticker, modified_at)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis cache invalidation failed: {e}")
+
+    async def get_history_modified_at(self, ticker: str) -> float | None:
+        """Время последнего изменения истории тикера или None."""
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.hget(self.HISTORY_KEY, ticker)
+        except RedisError as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            return None
+        return None if raw is None else float(raw)
+
+    async def close(self) -> None:
+        """Закрыть пул соединений Redis."""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+# Глобальный инстанс Redis-кэша процесса
+_price_redis_cache: PriceRedisCache | None = None
+
+
+def get_price_redis_cache() -> PriceRedisCache:
+    """Получить инстанс Redis-кэша цен."""
+
+    global _price_redis_cache
+    if _price_redis_cache is None:
+        _price_redis_cache = PriceRedisCache(
+            url=settings.redis_config.cache_url,
+            ttl=settings.redis_config.REDIS_CACHE_TTL,
+            range_bucket=settings.celery_config.FETCH_INTERVAL,
+            enabled=settings.redis_config.REDIS_CACHE_ENABLED
+        )
+    return _price_redis_cache
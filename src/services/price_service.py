@@ -3,13 +3,24 @@
 Работает с UnitOfWork для транзакционности
 """
 
-from typing import Sequence
+import csv
+import io
+from typing import AsyncIterator, Sequence
+
+import orjson
 
 from database import UnitOfWork
 from exceptions import PriceNotFoundError
 from middleware import get_business_logger
 from schemas import PriceRecordResponse
+from tracing import span, traced
 from clients import DeribitClient, PriceData
+from utils import CANDLE_INTERVALS, JSONRow, decode_cursor
+from .price_stats import compute_price_stats
+from .instrument_registry import InstrumentRegistry, get_instrument_registry
+from .live_prices import LivePricePublisher, get_live_price_publisher
+from .latest_price_cache import LatestPriceCache, get_latest_price_cache
+from .price_redis_cache import PriceRedisCache, get_price_redis_cache
 
 
 class PriceService:
@@ -18,26 +29,56 @@ class PriceService:
     def __init__(
         self,
         deribit_client: DeribitClient | None = None,
+        latest_price_cache: LatestPriceCache | None = None,
+        redis_cache: PriceRedisCache | None = None,
+        instrument_registry: InstrumentRegistry | None = None,
+        live_publisher: LivePricePublisher | None = None,
     ) -> None:
         """
         Инициализация сервиса цен.
 
         Args:
             deribit_client: Клиент Deribit. Если не передан, создаётся новый.
+            latest_price_cache: Кэш последних цен. По умолчанию — общий
+                кэш процесса.
+            redis_cache: Общий Redis-кэш чтения. По умолчанию — инстанс
+                процесса.
+            instrument_registry: Реестр тикеров. По умолчанию — инстанс
+                процесса.
+            live_publisher: Публикатор новых цен для SSE/WebSocket.
+                По умолчанию — инстанс процесса.
         """
         self._deribit_client = deribit_client
+        self._latest_price_cache = (
+            latest_price_cache or get_latest_price_cache()
+        )
+        self._redis_cache = redis_cache or get_price_redis_cache()
+        self._instrument_registry = (
+            instrument_registry or get_instrument_registry()
+        )
+        self._live_publisher = live_publisher or get_live_price_publisher()
         self._business_logger = get_business_logger()
 
     async def _get_deribit_client(self) -> DeribitClient:
         """
-        Получить клиент Deribit с правильным event loop.
+        Получить клиент Deribit.
 
-        Всегда создаёт новую сессию для текущего loop.
+        Сессия для текущего loop берётся из процессного пула.
         """
         if self._deribit_client is None:
             self._deribit_client = DeribitClient()
         return self._deribit_client
 
+    async def resolve_ticker(self, uow: UnitOfWork, ticker: str) -> str:
+        """
+        Нормализовать тикер и проверить его по реестру инструментов.
+
+        Raises:
+            UnknownTickerError: Тикер не отслеживается.
+        """
+        return await self._instrument_registry.require(uow, ticker)
+
+    @traced()
     async def save_price_data(
         self,
         uow: UnitOfWork,
@@ -49,6 +90,8 @@ class PriceService:
             price=price_data.price,
             timestamp=price_data.timestamp
         )
+        if record is None:
+            return
 
         self._business_logger.log_price_saved(
             ticker=record.ticker,
@@ -56,67 +99,209 @@ class PriceService:
             timestamp=record.timestamp
         )
 
+    @traced()
     async def fetch_and_save_all_prices(
         self,
         uow: UnitOfWork,
-    ) -> Sequence[PriceRecordResponse]:
+    ) -> list[str]:
         """
-        Получить все цены с Deribit и сохранить в базу данных
+        Получить цены всех активных тикеров реестра с Deribit
+        и сохранить в базу данных
+
+        Вся операция выполняется в рамках одной транзакции (uow).
+        Цены, уже сохранённые за тот же timestamp (повтор задачи,
+        пересечение запусков beat), пропускаются.
 
-        Вся операция выполняется в рамках одной транзакции (uow)
+        Note: DeribitClient берёт сессию из процессного пула,
+              по одной на event loop, поэтому соединения
+              переиспользуются между вызовами.
 
-        Note: DeribitClient создаётся заново для каждого вызова,
-              чтобы избежать проблем с event loop в Celery.
+        Returns:
+            Тикеры, цены которых были сохранены.
         """
+        tickers = await self._instrument_registry.refresh(uow)
         async with DeribitClient() as client:
-            price_data_map = await client.fetch_all_prices()
+            price_data_map = await client.fetch_all_prices(sorted(tickers))
 
-        saved_tickers = []
+        records = await uow.prices.save_many([
+            {
+                "ticker": price_data.ticker,
+                "price": price_data.price,
+                "timestamp": price_data.timestamp
+            }
+            for price_data in price_data_map.values()
+        ])
+        saved_tickers = [record.ticker for record in records]
 
-        for ticker, price_data in price_data_map.items():
-            await uow.prices.save_price_data(
-                ticker=price_data.ticker,
-                price=price_data.price,
-                timestamp=price_data.timestamp
-            )
-            saved_tickers.append(ticker)
+        uow.on_commit(lambda: self.refresh_caches(records))
 
         self._business_logger.log_prices_saved(saved_tickers)
 
         return saved_tickers
 
+    async def refresh_caches(self, records: Sequence) -> None:
+        """
+        Обновить кэши последних цен после коммита новых записей
+        и опубликовать их подписчикам live-рассылки.
+        """
+        newest: dict[str, PriceRecordResponse] = {}
+        for record in records:
+            response = PriceRecordResponse.model_validate(record)
+            current = newest.get(response.ticker)
+            if current is None or current.timestamp <= response.timestamp:
+                newest[response.ticker] = response
+
+        for response in newest.values():
+            self._latest_price_cache.put(response)
+        await self._redis_cache.replace_latest(list(newest.values()))
+        await self._live_publisher.publish(list(newest.values()))
+
+    @traced()
     async def get_prices_by_ticker(
         self,
         uow: UnitOfWork,
         ticker: str,
         limit: int = 1000,
         offset: int = 0,
-    ) -> Sequence[PriceRecordResponse]:
+        cursor: str | None = None,
+    ) -> Sequence[JSONRow]:
         """
-        Получить записи о ценах для тикера через репозиторий
+        Получить записи о ценах для тикера
+
+        Постранично через offset или через курсор (keyset).
+        Read-through через общий Redis-кэш. Записи возвращаются
+        строками для сериализации без pydantic (utils.dumps).
         """
-        return await uow.prices.get_prices_by_ticker(
+        ticker = await self.resolve_ticker(uow, ticker)
+        field = self._redis_cache.all_field(limit, offset, cursor)
+        cached = await self._redis_cache.get_records(ticker, field)
+        if cached is not None:
+            return cached
+
+        records = await uow.prices.get_prices_by_ticker(
             ticker=ticker,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=decode_cursor(cursor) if cursor else None
         )
+        await self._redis_cache.set_records(ticker, field, records)
+        return records
 
+    @traced()
     async def get_latest_price(
         self,
         uow: UnitOfWork,
         ticker: str,
     ) -> PriceRecordResponse:
         """
-        Получить последнюю цену для тикера через репозиторий
+        Получить последнюю цену для тикера
 
+        Сначала из кэша последних цен процесса, при промахе — из общего
+        Redis-кэша, затем через репозиторий (конкурентные промахи
+        выполняют один запрос).
         """
-        record = await uow.prices.get_latest_price(ticker)
+
+        ticker = await self.resolve_ticker(uow, ticker)
+
+        async def load() -> PriceRecordResponse | None:
+            cached = await self._redis_cache.get_latest(ticker)
+            if cached is not None:
+                return cached
+
+            record = await uow.prices.get_latest_price(ticker)
+            if record is None:
+                return None
+
+            response = PriceRecordResponse.model_validate(record)
+            await self._redis_cache.set_latest(response)
+            return response
+
+        record = await self._latest_price_cache.get_or_load(ticker, load)
 
         if not record:
             raise PriceNotFoundError(ticker)
 
-        return PriceRecordResponse.model_validate(record)
+        return record
 
+    @traced()
+    async def get_watermark(
+        self,
+        uow: UnitOfWork,
+        ticker: str,
+    ) -> PriceRecordResponse | None:
+        """
+        Последняя запись тикера для HTTP-валидаторов (None — цен нет)
+
+        Берётся из кэшей последних цен; основная таблица читается
+        только при промахе обоих кэшей.
+        """
+        try:
+            return await self.get_latest_price(uow, ticker)
+        except PriceNotFoundError:
+            return None
+
+    @traced()
+    async def get_history_modified_at(
+        self,
+        uow: UnitOfWork,
+        ticker: str,
+    ) -> float | None:
+        """
+        Время последнего изменения истории тикера задним числом
+        (загрузка архива) для HTTP-валидаторов ответов по истории.
+        """
+        ticker = await self.resolve_ticker(uow, ticker)
+        return await self._redis_cache.get_history_modified_at(ticker)
+
+    @traced()
+    async def get_latest_prices(
+        self,
+        uow: UnitOfWork,
+        tickers: Sequence[str],
+    ) -> tuple[dict[str, PriceRecordResponse | None], list[str]]:
+        """
+        Получить последние цены нескольких тикеров
+
+        Те же уровни, что у get_latest_price, но пачкой: кэш процесса,
+        затем один pipeline в Redis, затем один запрос в БД на все
+        оставшиеся тикеры. Для тикеров без цен возвращается None.
+
+        Returns:
+            Цены известных тикеров и список неизвестных реестру
+            тикеров (они не читаются и не прерывают запрос).
+        """
+        active = await self._instrument_registry.refresh(uow)
+        requested = list(dict.fromkeys(t.upper() for t in tickers))
+        tickers = [t for t in requested if t in active]
+        unknown = [t for t in requested if t not in active]
+
+        found: dict[str, PriceRecordResponse] = {}
+        for ticker in tickers:
+            record = self._latest_price_cache.get(ticker)
+            if record is not None:
+                found[ticker] = record
+
+        missing = [t for t in tickers if t not in found]
+        if missing:
+            cached = await self._redis_cache.get_latest_many(missing)
+            for record in cached.values():
+                self._latest_price_cache.put(record)
+            found.update(cached)
+
+        missing = [t for t in tickers if t not in found]
+        if missing:
+            loaded = [
+                PriceRecordResponse.model_validate(record)
+                for record in await uow.prices.get_latest_prices(missing)
+            ]
+            for record in loaded:
+                self._latest_price_cache.put(record)
+                found[record.ticker] = record
+            await self._redis_cache.set_latest_many(loaded)
+
+        return {ticker: found.get(ticker) for ticker in tickers}, unknown
+
+    @traced()
     async def get_prices_by_date_range(
         self,
         uow: UnitOfWork,
@@ -124,17 +309,168 @@ class PriceService:
         start_date: int,
         end_date: int,
         limit: int = 1000,
-    ) -> Sequence[PriceRecordResponse]:
+        resolution: str | None = None,
+    ) -> Sequence[JSONRow]:
         """
         Получить записи о ценах для тикера в диапазоне дат
+
+        С разрешением — точки из агрегатов, без него — сырые записи.
+        Read-through через общий Redis-кэш: в кэше лежит результат для
+        диапазона, выровненного по корзине, ответ обрезается до
+        запрошенного диапазона.
         """
-        return await uow.prices.get_prices_by_date_range(
+        ticker = await self.resolve_ticker(uow, ticker)
+        resolution_seconds = (
+            CANDLE_INTERVALS[resolution] if resolution else None
+        )
+        aligned_start, aligned_end = self._redis_cache.align_range(
+            start_date, end_date, resolution
+        )
+        # Агрегаты сами выравнивают начало по разрешению
+        lower = aligned_start if resolution else start_date
+
+        field = self._redis_cache.range_field(
+            aligned_start, aligned_end, limit, resolution
+        )
+        records = await self._redis_cache.get_records(ticker, field)
+        if records is None:
+            records = await uow.prices.get_prices_by_date_range(
+                ticker=ticker,
+                start_date=aligned_start,
+                end_date=aligned_end,
+                limit=limit,
+                resolution_seconds=resolution_seconds
+            )
+            await self._redis_cache.set_records(ticker, field, records)
+
+        # Записи идут от новых к старым: обрезка точна, пока лимит не
+        # занят записями после end_date
+        if len(records) == limit and records and (
+            records[0]["timestamp"] > end_date
+        ):
+            return await uow.prices.get_prices_by_date_range(
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+                resolution_seconds=resolution_seconds
+            )
+        return [
+            record for record in records
+            if lower <= record["timestamp"] <= end_date
+        ]
+
+    @traced()
+    async def get_price_stats(
+        self,
+        uow: UnitOfWork,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        window: int = 20,
+        limit: int = 10000,
+        resolution: str | None = None,
+    ) -> JSONRow:
+        """
+        Получить статистику ряда цен тикера в диапазоне дат
+
+        Ряд тот же, что у get_prices_by_date_range, но читается сразу
+        в массивы NumPy. Диапазон выравнивается по корзине (разрешение
+        или FETCH_INTERVAL), чтобы скользящие окна разных запросов
+        делили результат в общем Redis-кэше.
+        """
+        ticker = await self.resolve_ticker(uow, ticker)
+        start_date, end_date = self._redis_cache.align_range(
+            start_date, end_date, resolution
+        )
+        field = self._redis_cache.stats_field(
+            start_date, end_date, limit, window, resolution
+        )
+        cached = await self._redis_cache.get_stats(ticker, field)
+        if cached is not None:
+            return cached
+
+        timestamps, prices = await uow.prices.get_price_series(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
+            limit=limit,
+            resolution_seconds=(
+                CANDLE_INTERVALS[resolution] if resolution else None
+            )
+        )
+        with span("compute_price_stats", points=len(prices)):
+            stats = compute_price_stats(timestamps, prices, window)
+        await self._redis_cache.set_stats(ticker, field, stats)
+        return stats
+
+    @traced()
+    async def get_candles(
+        self,
+        uow: UnitOfWork,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        interval: str,
+        limit: int = 1000,
+    ) -> Sequence[JSONRow]:
+        """
+        Получить свечи OHLC для тикера в диапазоне дат
+        """
+        return await uow.prices.get_candles(
+            ticker=await self.resolve_ticker(uow, ticker),
+            start_date=start_date,
+            end_date=end_date,
+            interval_seconds=CANDLE_INTERVALS[interval],
             limit=limit
         )
 
+    async def export_prices_by_date_range(
+        self,
+        uow: UnitOfWork,
+        ticker: str,
+        start_date: int,
+        end_date: int,
+        format: str = "ndjson",
+    ) -> AsyncIterator[bytes]:
+        """
+        Потоковая выгрузка цен в диапазоне дат в NDJSON или CSV
+
+        Каждая пачка строк серверного курсора отдаётся одним чанком,
+        без построения pydantic-моделей.
+        """
+        if format == "csv":
+            yield b"id,ticker,price,timestamp,created_at\r\n"
+
+        async for rows in uow.prices.stream_prices_by_date_range(
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date
+        ):
+            if format == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows(
+                    (row.id, row.ticker, row.price, row.timestamp,
+                     row.created_at.isoformat())
+                    for row in rows
+                )
+                yield buffer.getvalue().encode()
+            else:
+                yield b"".join(
+                    orjson.dumps(
+                        {
+                            "id": row.id,
+                            "ticker": row.ticker,
+                            "price": str(row.price),
+                            "timestamp": row.timestamp,
+                            "created_at": row.created_at
+                        },
+                        option=orjson.OPT_APPEND_NEWLINE
+                    )
+                    for row in rows
+                )
+
 
 def get_price_service() -> PriceService:
     """
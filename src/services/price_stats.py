@@ -0,0 +1,110 @@
+"""
+Векторизованная статистика ряда цен на NumPy
+"""
+
+from typing import Callable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils import JSONRow
+
+SECONDS_PER_YEAR = 365 * 86400
+
+
+def _rolling(
+    values: np.ndarray,
+    window: int,
+    reduce: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """
+    Скользящая статистика по окну из window точек, выровненная
+    по последней точке окна; первые window - 1 значений — NaN.
+    """
+    result = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        result[window - 1:] = reduce(sliding_window_view(values, window))
+    return result
+
+
+def compute_price_stats(
+    timestamps: np.ndarray,
+    prices: np.ndarray,
+    window: int
+) -> JSONRow:
+    """
+    Посчитать доходности, скользящие средние, волатильность,
+    TWAP и максимальную просадку.
+
+    Args:
+        timestamps: UNIX timestamp точек (int64, по возрастанию).
+        prices: Цены точек (float64).
+        window: Размер скользящего окна в точках.
+
+    Returns:
+        Сводка по ряду и точки со скользящими значениями
+        (NaN сериализуется как null).
+    """
+    count = len(prices)
+    if count == 0:
+        return {"count": 0, "summary": None, "points": []}
+
+    log_returns = np.full(count, np.nan)
+    log_returns[1:] = np.diff(np.log(prices))
+
+    intervals = np.diff(timestamps)
+    step = float(np.median(intervals)) if count > 1 else 0.0
+    annualization = np.sqrt(SECONDS_PER_YEAR / step) if step > 0 else np.nan
+
+    moving_average = _rolling(prices, window, lambda v: v.mean(axis=1))
+    volatility = _rolling(
+        log_returns, window, lambda v: v.std(axis=1, ddof=1)
+    ) * annualization
+
+    # Средняя цена, взвешенная по времени действия каждой цены
+    twap = (
+        float(np.dot(prices[:-1], intervals) / intervals.sum())
+        if count > 1 and intervals.sum() > 0 else float(prices.mean())
+    )
+
+    running_max = np.maximum.accumulate(prices)
+    drawdowns = prices / running_max - 1.0
+    trough = int(drawdowns.argmin())
+    peak = int(prices[:trough + 1].argmax())
+
+    returns = log_returns[1:]
+    summary = {
+        "first_price": float(prices[0]),
+        "last_price": float(prices[-1]),
+        "min_price": float(prices.min()),
+        "max_price": float(prices.max()),
+        "mean_price": float(prices.mean()),
+        "twap": twap,
+        "total_return": float(prices[-1] / prices[0] - 1.0),
+        "mean_log_return": float(returns.mean()) if count > 1 else None,
+        "volatility": (
+            float(returns.std(ddof=1) * annualization) if count > 2 else None
+        ),
+        "max_drawdown": float(drawdowns[trough]),
+        "drawdown_peak_timestamp": int(timestamps[peak]),
+        "drawdown_trough_timestamp": int(timestamps[trough]),
+    }
+
+    points = [
+        {
+            "timestamp": timestamp,
+            "price": price,
+            "log_return": log_return,
+            "moving_average": average,
+            "volatility": vol,
+        }
+        for timestamp, price, log_return, average, vol in zip(
+            timestamps.tolist(),
+            prices.tolist(),
+            log_returns.tolist(),
+            moving_average.tolist(),
+            volatility.tolist(),
+        )
+    ]
+
+    return {"count": count, "summary": summary, "points": points}
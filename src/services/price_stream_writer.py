@@ -0,0 +1,171 @@
+"""
+Пакетная запись потоковых тиков в базу данных
+"""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from clients import PriceData
+from database import UnitOfWork
+from .price_service import PriceService
+
+logger = logging.getLogger(__name__)
+
+
+class PriceStreamWriter:
+    """ Писатель, вычитывающий тики из очереди пачками """
+
+    def __init__(
+        self,
+        queue: asyncio.Queue[PriceData],
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int,
+        flush_interval: float,
+        price_service: PriceService | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        max_pending: int | None = None,
+    ) -> None:
+        """
+        Инициализация писателя.
+
+        Args:
+            queue: Очередь тиков от DeribitStreamClient.
+            session_factory: Фабрика сессий БД.
+            batch_size: Максимальный размер пачки.
+            flush_interval: Максимальное ожидание добора пачки (сек).
+            price_service: Сервис цен для обновления кэшей после записи.
+            max_retries: Повторы записи пачки при ошибке БД.
+            retry_delay: Начальная задержка повтора (сек), удваивается.
+            max_pending: Сколько незаписанных тиков держать до следующей
+                пачки; по умолчанию — размер очереди.
+        """
+        self._queue = queue
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._price_service = price_service or PriceService()
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._max_pending = max_pending or queue.maxsize or 10_000
+        self._pending: dict[tuple[str, int], PriceData] = {}
+
+    async def run(self) -> None:
+        """Вычитывать очередь и записывать пачки до отмены."""
+        try:
+            while True:
+                batch = await self._collect_batch()
+                await self._flush(batch)
+        except asyncio.CancelledError:
+            # Дописываем то, что уже успело попасть в очередь
+            batch = self._drain()
+            if batch or self._pending:
+                await self._flush(batch, retry=False)
+            if self._pending:
+                logger.error(
+                    f"Stream writer stopped with {len(self._pending)} "
+                    f"unwritten ticks")
+            raise
+
+    async def _collect_batch(self) -> list[PriceData]:
+        """
+        Дождаться первого тика и добрать пачку до batch_size
+        или до истечения flush_interval.
+        """
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self._flush_interval
+
+        while len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(self._queue.get(), remaining)
+                )
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    def _drain(self) -> list[PriceData]:
+        """Забрать из очереди всё без ожидания."""
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: list[PriceData], retry: bool = True) -> None:
+        """
+        Записать пачку вместе с незаписанными ранее тиками.
+
+        Тики с одинаковыми (ticker, timestamp) схлопываются до последнего.
+        Если запись не удалась после повторов, тики остаются в буфере
+        и пишутся со следующей пачкой (вставка идемпотентна: ON CONFLICT
+        DO NOTHING). Ошибка обновления кэшей запись не отменяет.
+        """
+        for price_data in batch:
+            self._pending[(price_data.ticker, price_data.timestamp)] = (
+                price_data
+            )
+        if not self._pending:
+            return
+
+        rows = [
+            {
+                "ticker": price_data.ticker,
+                "price": price_data.price,
+                "timestamp": price_data.timestamp
+            }
+            for price_data in self._pending.values()
+        ]
+        records = await self._write(rows, self._max_retries if retry else 0)
+        if records is None:
+            self._trim_pending()
+            return
+
+        self._pending.clear()
+        logger.debug(f"Wrote {len(rows)} stream ticks")
+
+        try:
+            await self._price_service.refresh_caches(records)
+        except Exception as e:
+            logger.error(f"Failed to refresh caches after stream write: {e}")
+
+    async def _write(self, rows: list[dict], retries: int) -> list | None:
+        """
+        Записать строки одной транзакцией с повторами.
+
+        Returns:
+            Вставленные записи или None, если запись не удалась.
+        """
+        delay = self._retry_delay
+        for attempt in range(retries + 1):
+            try:
+                async with self._session_factory() as session:
+                    async with UnitOfWork(session) as uow:
+                        records = await uow.prices.save_many(rows)
+                return list(records)
+            except Exception as e:
+                if attempt == retries:
+                    logger.error(
+                        f"Failed to write {len(rows)} stream ticks: {e}")
+                    return None
+                logger.warning(
+                    f"Stream write failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+                delay *= 2
+        return None
+
+    def _trim_pending(self) -> None:
+        """Ограничить буфер незаписанных тиков, вытеснив самые старые."""
+        overflow = len(self._pending) - self._max_pending
+        if overflow <= 0:
+            return
+        oldest = sorted(self._pending, key=lambda key: key[1])[:overflow]
+        for key in oldest:
+            del self._pending[key]
+        logger.warning(f"Dropped {overflow} oldest unwritten stream ticks")
@@ -0,0 +1,71 @@
+""" Точка входа потокового сбора цен через WebSocket """
+
+import asyncio
+
+from clients import DeribitStreamClient, PriceData
+from config import settings, setup_logging
+from database import UnitOfWork, database_manager
+from services import (
+    PriceStreamWriter,
+    get_instrument_registry,
+    get_live_price_publisher,
+    get_price_redis_cache
+)
+
+
+async def run_stream() -> None:
+    """
+    Запустить WebSocket-клиент и пакетного писателя.
+
+    Подписка — на индексы активных тикеров реестра на момент запуска;
+    после синхронизации реестра процесс нужно перезапустить.
+    """
+
+    async with database_manager.session_factory() as session:
+        tickers = await get_instrument_registry().refresh(UnitOfWork(session))
+
+    queue: asyncio.Queue[PriceData] = asyncio.Queue(
+        maxsize=settings.stream_config.STREAM_QUEUE_SIZE
+    )
+    stream_client = DeribitStreamClient(queue, tickers)
+    writer = PriceStreamWriter(
+        queue=queue,
+        session_factory=database_manager.session_factory,
+        batch_size=settings.stream_config.STREAM_BATCH_SIZE,
+        flush_interval=settings.stream_config.STREAM_FLUSH_INTERVAL
+    )
+
+    client_task = asyncio.create_task(stream_client.run())
+    writer_task = asyncio.create_task(writer.run())
+    done: set[asyncio.Task] = set()
+    try:
+        # Завершение любой из сторон (ошибка писателя, остановка
+        # клиента) останавливает обе
+        done, _ = await asyncio.wait(
+            {client_task, writer_task},
+            return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        # Сначала источник тиков, затем писатель: при отмене он
+        # дописывает очередь. Ресурсы закрываются только после этого.
+        stream_client.stop()
+        client_task.cancel()
+        await asyncio.gather(client_task, return_exceptions=True)
+        writer_task.cancel()
+        await asyncio.gather(writer_task, return_exceptions=True)
+
+        await get_price_redis_cache().close()
+        await get_live_price_publisher().close()
+        await database_manager.engine.dispose()
+
+    for task in done:
+        if task.cancelled():
+            continue
+        error = task.exception()
+        if error is not None:
+            raise error
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(run_stream())
@@ -0,0 +1,50 @@
+"""Задачи Celery для синхронизации реестра инструментов"""
+
+import logging
+
+from celery_app import celery_app
+
+from clients import DeribitClient
+from config import settings
+from database import UnitOfWork
+from services import get_instrument_registry
+from .runtime import worker_runtime
+
+logger = logging.getLogger(__name__)
+
+
+async def _sync_instruments_async() -> dict:
+    """Загрузить индексы Deribit в таблицу tickers одной транзакцией."""
+
+    registry = get_instrument_registry()
+
+    async with worker_runtime.session_factory() as session:
+        async with UnitOfWork(session) as uow:
+            async with DeribitClient() as client:
+                added = await registry.sync(
+                    uow,
+                    client,
+                    activate=settings.derbit_config.DERIBIT_INSTRUMENT_AUTO_ACTIVATE
+                )
+
+    async with worker_runtime.session_factory() as session:
+        tickers = await registry.refresh(UnitOfWork(session))
+
+    logger.info(
+        f"Synced instruments: {added} added, {len(tickers)} active")
+    return {
+        "status": "success",
+        "added": added,
+        "active": len(tickers)
+    }
+
+
+@celery_app.task(bind=True)
+def sync_instruments(self):
+    """
+    Синхронизировать реестр тикеров с индексами Deribit.
+
+    Задача запускается Celery Beat раз в
+    DERIBIT_INSTRUMENT_SYNC_INTERVAL секунд.
+    """
+    return worker_runtime.run(_sync_instruments_async())
@@ -0,0 +1,60 @@
+"""Задачи Celery для обслуживания партиций pricerecords"""
+
+import logging
+
+from celery_app import celery_app
+
+from config import settings
+from database import PricePartitionManager
+from .runtime import worker_runtime
+
+logger = logging.getLogger(__name__)
+
+
+async def _maintain_partitions_async() -> dict:
+    """
+    Создать будущие партиции, перенести записи из DEFAULT-партиции
+    в месячные и вывести устаревшие по политике хранения.
+
+    Каждая операция DDL — в своей транзакции.
+    """
+    config = settings.data_config
+
+    async with worker_runtime.session_factory() as session:
+        async with session.begin():
+            created = await PricePartitionManager(session).ensure_partitions(
+                months_ahead=config.PARTITION_PRECREATE_MONTHS
+            )
+
+    async with worker_runtime.session_factory() as session:
+        async with session.begin():
+            created += await PricePartitionManager(session).absorb_default()
+
+    async with worker_runtime.session_factory() as session:
+        async with session.begin():
+            expired = await PricePartitionManager(session).apply_retention(
+                retention_months=config.PARTITION_RETENTION_MONTHS,
+                drop=config.PARTITION_DROP_EXPIRED
+            )
+
+    if created:
+        logger.info(f"Created partitions: {created}")
+    if expired:
+        action = "Dropped" if config.PARTITION_DROP_EXPIRED else "Detached"
+        logger.info(f"{action} expired partitions: {expired}")
+
+    return {
+        "status": "success",
+        "created": created,
+        "expired": expired
+    }
+
+
+@celery_app.task(bind=True)
+def maintain_price_partitions(self):
+    """
+    Обслуживание месячных партиций pricerecords.
+
+    Задача запускается Celery Beat раз в сутки.
+    """
+    return worker_runtime.run(_maintain_partitions_async())
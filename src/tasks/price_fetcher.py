@@ -1,28 +1,20 @@
 """Периодические задачи Celery для получения цен криптовалют"""
 
-import asyncio
 import logging
+import time
 
 from celery.exceptions import SoftTimeLimitExceeded
 from celery_app import celery_app
-from sqlalchemy.ext.asyncio import (
-    create_async_engine,
-    AsyncSession,
-    async_sessionmaker
-)
 
 from config import settings
 from database import UnitOfWork
+from metrics import TASK_DURATION, TASK_RETRIES, TASK_TIMEOUTS
 from services import PriceService
+from .runtime import worker_runtime
 
 logger = logging.getLogger(__name__)
 
 
-def get_engine():
-    """Создать новый движок БД для текущего event loop."""
-    return create_async_engine(settings.data_config.get_database_url())
-
-
 async def _fetch_prices_async() -> dict:
     """
     Асинхронная функция для получения и сохранения цен.
@@ -31,29 +23,18 @@ async def _fetch_prices_async() -> dict:
     """
     service = PriceService()
 
-    # Создаём новый engine и session_factory для текущего loop
-    engine = get_engine()
-    async_session = async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-
-    try:
-        async with async_session() as session:
-            async with UnitOfWork(session) as uow:
-                saved_tickers = await service.fetch_and_save_all_prices(uow)
+    # Engine и пул соединений общие для всего процесса воркера
+    async with worker_runtime.session_factory() as session:
+        async with UnitOfWork(session) as uow:
+            saved_tickers = await service.fetch_and_save_all_prices(uow)
 
-        logger.info(
-            f"Successfully fetched and saved prices for: {saved_tickers}")
-        return {
-            "status": "success",
-            "count": len(saved_tickers),
-            "tickers": saved_tickers
-        }
-    finally:
-        # Закрываем engine после использования
-        await engine.dispose()
+    logger.info(
+        f"Successfully fetched and saved prices for: {saved_tickers}")
+    return {
+        "status": "success",
+        "count": len(saved_tickers),
+        "tickers": saved_tickers
+    }
 
 
 @celery_app.task(
@@ -67,6 +48,9 @@ def fetch_crypto_prices(self):
     Задача запускается Celery Beat каждую минуту.
     Использует soft_time_limit для graceful shutdown.
     """
+    task_name = "fetch_crypto_prices"
+    started = time.perf_counter()
+    status = "success"
     try:
         self.update_state(
             state="PROGRESS",
@@ -74,20 +58,28 @@ def fetch_crypto_prices(self):
         )
         logger.info("Starting crypto price fetch task")
 
-        # Запускаем асинхронный код в новом event loop
-        result = asyncio.run(_fetch_prices_async())
+        # Отправляем корутину в постоянный event loop процесса
+        result = worker_runtime.run(_fetch_prices_async())
         return result
 
     except SoftTimeLimitExceeded:
+        status = "timeout"
+        TASK_TIMEOUTS.labels(task_name).inc()
         logger.warning("Task fetch_crypto_prices timed out")
         return {
             "status": "timeout",
             "message": "Task exceeded soft time limit"
         }
     except Exception as e:
+        status = "error"
+        TASK_RETRIES.labels(task_name).inc()
         logger.error(f"Error fetching crypto prices: {e}")
         raise self.retry(
             exc=e,
             countdown=settings.celery_config.FETCH_RETRY_COUNTDOWN,
             max_retries=settings.celery_config.FETCH_MAX_RETRIES
         )
+    finally:
+        TASK_DURATION.labels(task_name, status).observe(
+            time.perf_counter() - started
+        )
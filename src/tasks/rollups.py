@@ -0,0 +1,68 @@
+"""Задачи Celery для обслуживания агрегатов цен"""
+
+import logging
+import time
+
+from celery_app import celery_app
+
+from database import UnitOfWork
+from .runtime import worker_runtime
+
+logger = logging.getLogger(__name__)
+
+# Размер окна пересчёта: одна транзакция на неделю данных
+BACKFILL_CHUNK_SECONDS = 7 * 86400
+
+
+async def _backfill_rollups_async(
+    start_date: int | None,
+    end_date: int,
+    ticker: str | None
+) -> dict:
+    """
+    Пересчитать агрегаты окнами по BACKFILL_CHUNK_SECONDS,
+    каждое окно — отдельная транзакция.
+    """
+    if start_date is None:
+        async with worker_runtime.session_factory() as session:
+            start_date = await UnitOfWork(session).prices.get_first_timestamp(
+                ticker
+            )
+        if start_date is None:
+            return {"status": "empty", "chunks": 0}
+
+    chunks = 0
+    for chunk_start in range(start_date, end_date, BACKFILL_CHUNK_SECONDS):
+        chunk_end = min(chunk_start + BACKFILL_CHUNK_SECONDS, end_date)
+        async with worker_runtime.session_factory() as session:
+            async with UnitOfWork(session) as uow:
+                await uow.rollups.rebuild(chunk_start, chunk_end, ticker)
+        chunks += 1
+
+    logger.info(
+        f"Rebuilt rollups for [{start_date}, {end_date}) in {chunks} chunks")
+    return {
+        "status": "success",
+        "chunks": chunks,
+        "start_date": start_date,
+        "end_date": end_date
+    }
+
+
+@celery_app.task(bind=True)
+def backfill_rollups(
+    self,
+    start_date: int | None = None,
+    end_date: int | None = None,
+    ticker: str | None = None
+):
+    """
+    Перестроить агрегаты 1m/1h/1d из сырых записей.
+
+    Запускается вручную, например после массового импорта:
+        celery -A src.celery_app call tasks.rollups.backfill_rollups
+    """
+    end_date = end_date if end_date is not None else int(time.time()) + 1
+    return worker_runtime.run(
+        _backfill_rollups_async(start_date, end_date, ticker)
+    )
@@ -0,0 +1,144 @@
+"""
+Асинхронный runtime процесса Celery воркера.
+
+Один event loop в фоновом потоке и один engine с пулом соединений
+на процесс: задача только отправляет корутину в готовый loop.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+from typing import Any, Coroutine, TypeVar
+
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker
+)
+
+from config import settings
+from clients import default_session_pool
+from database import InstrumentedAsyncPool
+from services import get_live_price_publisher, get_price_redis_cache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerRuntime:
+    """Event loop и engine БД, живущие всё время процесса воркера."""
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._engine: AsyncEngine | None = None
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Фабрика сессий поверх общего engine процесса."""
+        self.start()
+        assert self._session_factory is not None
+        return self._session_factory
+
+    def start(self) -> None:
+        """Запустить loop в фоновом потоке и создать engine (идемпотентно)."""
+        with self._lock:
+            if self._loop is not None:
+                return
+
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="worker-runtime-loop",
+                daemon=True
+            )
+            self._thread.start()
+
+            self._engine = create_async_engine(
+                settings.data_config.get_database_url(),
+                pool_pre_ping=True,
+                poolclass=InstrumentedAsyncPool
+            )
+            self._session_factory = async_sessionmaker(
+                bind=self._engine,
+                class_=AsyncSession,
+                expire_on_commit=False
+            )
+            logger.info("Worker runtime started")
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Выполнить корутину в loop процесса и дождаться результата.
+
+        Если ожидание прервано (например, SoftTimeLimitExceeded),
+        корутина отменяется. Контекст вызывающего потока (текущий
+        спан задачи Celery) переносится в корутину.
+        """
+        self.start()
+        assert self._loop is not None
+
+        context = contextvars.copy_context()
+
+        async def _run_in_context() -> T:
+            loop = asyncio.get_running_loop()
+            return await loop.create_task(coro, context=context)
+
+        future = asyncio.run_coroutine_threadsafe(
+            _run_in_context(), self._loop
+        )
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Закрыть HTTP-сессии, Redis и пул БД, остановить loop."""
+        with self._lock:
+            if self._loop is None:
+                return
+
+            loop, engine = self._loop, self._engine
+
+            async def _shutdown() -> None:
+                await default_session_pool.close()
+                await get_price_redis_cache().close()
+                await get_live_price_publisher().close()
+                if engine is not None:
+                    await engine.dispose()
+
+            try:
+                asyncio.run_coroutine_threadsafe(_shutdown(), loop).result()
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                if self._thread is not None:
+                    self._thread.join()
+                loop.close()
+
+                self._loop = None
+                self._thread = None
+                self._engine = None
+                self._session_factory = None
+                logger.info("Worker runtime stopped")
+
+    def reset(self) -> None:
+        """
+        Забыть состояние без закрытия.
+
+        Используется после fork: loop-поток и соединения
+        родителя в дочернем процессе недействительны.
+        """
+        self._loop = None
+        self._thread = None
+        self._engine = None
+        self._session_factory = None
+        self._lock = threading.Lock()
+
+
+# Runtime текущего процесса воркера
+worker_runtime = WorkerRuntime()
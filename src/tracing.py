@@ -0,0 +1,170 @@
+"""
+Трассировка OpenTelemetry
+
+Зависимости необязательные (extra "tracing"). При TRACING_ENABLED=false
+или без установленного opentelemetry декоратор traced возвращает
+функцию без изменений, а span — общий nullcontext: накладных
+расходов на горячем пути нет.
+"""
+
+import functools
+import logging
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Awaitable, Callable, TypeVar
+
+from config import settings
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - зависит от окружения
+    trace = None
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# Имя инструментирующей библиотеки в спанах
+TRACER_NAME = "crypto_price_tracker"
+
+TRACING_ENABLED = (
+    settings.monitoring_config.TRACING_ENABLED and trace is not None
+)
+
+_NOOP_SPAN = nullcontext()
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager:
+    """
+    Спан вокруг блока кода, дочерний к текущему.
+
+    Пример:
+        with span("json.encode", rows=len(prices)):
+            body = dumps(payload)
+    """
+    # Проверка trace — для анализатора типов: TRACING_ENABLED её включает
+    if not TRACING_ENABLED or trace is None:
+        return _NOOP_SPAN
+    return trace.get_tracer(TRACER_NAME).start_as_current_span(
+        name, attributes=attributes
+    )
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """
+    Декоратор корутины: вызов выполняется в спане name
+    (по умолчанию — квалифицированное имя функции).
+
+    Решение принимается при импорте: с выключенной трассировкой
+    возвращается исходная функция.
+    """
+    def decorate(func: F) -> F:
+        if not TRACING_ENABLED or trace is None:
+            return func
+
+        span_name = name or func.__qualname__
+        # ProxyTracer: провайдер может быть установлен позже
+        tracer = trace.get_tracer(TRACER_NAME)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def _create_exporter():
+    """Экспортёр спанов по TRACING_EXPORTER."""
+    config = settings.monitoring_config
+
+    if config.TRACING_EXPORTER == "file":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        # JSON Lines: один спан на строку
+        return ConsoleSpanExporter(
+            out=open(config.TRACING_FILE_PATH, "a", encoding="utf-8"),
+            formatter=lambda s: s.to_json(indent=None) + "\n"
+        )
+
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+        OTLPSpanExporter
+    )
+    return OTLPSpanExporter(endpoint=config.TRACING_OTLP_ENDPOINT)
+
+
+def setup_tracing(service_name: str) -> bool:
+    """
+    Установить глобальный TracerProvider процесса (идемпотентно).
+
+    Returns:
+        True, если трассировка включена и настроена.
+    """
+    if not settings.monitoring_config.TRACING_ENABLED:
+        return False
+    if trace is None:
+        logger.warning(
+            "TRACING_ENABLED is set, but opentelemetry is not installed")
+        return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import (
+        ParentBased,
+        TraceIdRatioBased
+    )
+
+    if isinstance(trace.get_tracer_provider(), TracerProvider):
+        return True
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(
+            TraceIdRatioBased(settings.monitoring_config.TRACING_SAMPLE_RATIO)
+        )
+    )
+    provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    trace.set_tracer_provider(provider)
+    logger.info(f"Tracing enabled for {service_name}")
+    return True
+
+
+def instrument_app(app) -> None:
+    """
+    Серверные спаны FastAPI: маршрут, статус, входящий traceparent.
+
+    Спаны отдельных ASGI-сообщений (send/receive) не создаются.
+    """
+    if not TRACING_ENABLED:
+        return
+    try:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    except ImportError:
+        logger.warning("opentelemetry-instrumentation-fastapi is not installed")
+        return
+
+    FastAPIInstrumentor.instrument_app(
+        app,
+        excluded_urls="metrics",
+        exclude_spans=["receive", "send"]
+    )
+
+
+def instrument_celery() -> None:
+    """
+    Передача контекста в задачи Celery: при публикации traceparent
+    кладётся в заголовки сообщения, воркер продолжает трассу.
+    """
+    if not TRACING_ENABLED:
+        return
+    try:
+        from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    except ImportError:
+        logger.warning("opentelemetry-instrumentation-celery is not installed")
+        return
+
+    instrumentor = CeleryInstrumentor()
+    if not instrumentor.is_instrumented_by_opentelemetry:
+        instrumentor.instrument()
@@ -1,3 +1,12 @@
-from .types import VALID_TICKERS
+from .types import CANDLE_INTERVALS, CandleInterval
+from .cursor import encode_cursor, decode_cursor
+from .serialization import JSONRow, dumps
 
-__all__ = ['VALID_TICKERS']
+__all__ = [
+    'CANDLE_INTERVALS',
+    'CandleInterval',
+    'encode_cursor',
+    'decode_cursor',
+    'JSONRow',
+    'dumps'
+]
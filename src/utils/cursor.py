@@ -0,0 +1,28 @@
+"""Непрозрачные курсоры keyset-пагинации."""
+
+import base64
+import binascii
+from uuid import UUID
+
+
+def encode_cursor(timestamp: int, record_id: UUID) -> str:
+    """Закодировать позицию (timestamp, id) в курсор."""
+    raw = f"{timestamp}:{record_id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, UUID]:
+    """
+    Раскодировать курсор в позицию (timestamp, id).
+
+    Raises:
+        ValueError: Курсор повреждён.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, record_id = (
+            base64.urlsafe_b64decode(padded).decode().split(":")
+        )
+        return int(timestamp), UUID(hex=record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Некорректный курсор")
@@ -0,0 +1,23 @@
+"""Быстрая JSON-сериализация ответов через orjson."""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+# Строка результата запроса: имя колонки -> значение
+JSONRow = dict[str, Any]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Сериализовать значение в JSON так же, как pydantic в режиме json:
+    Decimal и UUID — строками, datetime — ISO 8601 с суффиксом Z.
+    """
+    return orjson.dumps(value, default=_default, option=orjson.OPT_UTC_Z)
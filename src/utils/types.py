@@ -3,10 +3,6 @@
 from typing import Literal
 
 
-# Валидные тикеры как Literal типы (верхний регистр)
-BTC_USD = Literal["BTC_USD"]
-ETH_USD = Literal["ETH_USD"]
-TickerStr = BTC_USD | ETH_USD
-
-# Список всех валидных тикеров для проверки (верхний регистр)
-VALID_TICKERS = ["BTC_USD", "ETH_USD"]
+# Интервалы свечей и их длительность в секундах
+CandleInterval = Literal["1m", "5m", "1h", "1d"]
+CANDLE_INTERVALS = {"1m": 60, "5m": 300, "1h": 3600, "1d": 86400}
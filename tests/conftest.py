@@ -0,0 +1,35 @@
+"""
+Общая настройка тестов: пути импорта и переменные окружения из .env
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# clients импортируются как пакет корня, код src — без префикса
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+load_dotenv(ROOT / ".env")
+
+
+@pytest.fixture
+def client():
+    """
+    Клиент роутера цен без БД и сервиса: для проверок параметров,
+    которые отклоняются до обращения к ним.
+    """
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from api.routes import get_price_service, get_uow, router
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_uow] = lambda: None
+    app.dependency_overrides[get_price_service] = lambda: None
+    return TestClient(app)
@@ -0,0 +1,98 @@
+"""
+Курсоры keyset-пагинации /all: кодирование, ошибки запроса,
+стабильность страниц при появлении новых записей
+"""
+
+import asyncio
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from models import PriceRecord
+from repositories import PriceRepository
+from utils import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    record_id = uuid.uuid4()
+
+    cursor = encode_cursor(1_704_067_200, record_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (1_704_067_200, record_id)
+
+
+@pytest.mark.parametrize("cursor", ["zzz", "", encode_cursor(1, uuid.uuid4())[:-4]])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_invalid_cursor_is_422(client):
+    response = client.get("/v1/prices/all", params={
+        "ticker": "BTC_USD", "cursor": "zzz"
+    })
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "cursor"]
+
+
+def test_cursor_with_offset_is_422(client):
+    response = client.get("/v1/prices/all", params={
+        "ticker": "BTC_USD",
+        "cursor": encode_cursor(1, uuid.uuid4()),
+        "offset": 10
+    })
+
+    assert response.status_code == 422
+
+
+async def paginate_with_inserts() -> tuple[list[int], list[int]]:
+    """
+    Две страницы по курсору и по offset, между ними приходят
+    новые записи. Returns: (timestamps по курсору, по offset)
+    """
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(PriceRecord.__table__.create)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def add(timestamps) -> None:
+        async with session_factory() as session, session.begin():
+            await session.execute(insert(PriceRecord), [
+                {"id": uuid.uuid4(), "ticker": "BTC_USD",
+                 "price": Decimal("42000"), "timestamp": ts}
+                for ts in timestamps
+            ])
+
+    await add(range(100, 110))
+    async with session_factory() as session:
+        prices = PriceRepository(session)
+        first = await prices.get_prices_by_ticker("BTC_USD", limit=4)
+        await add(range(110, 113))
+        last = first[-1]
+        by_cursor = await prices.get_prices_by_ticker(
+            "BTC_USD", limit=4, after=(last["timestamp"], last["id"])
+        )
+        by_offset = await prices.get_prices_by_ticker(
+            "BTC_USD", limit=4, offset=4
+        )
+    await engine.dispose()
+
+    head = [r["timestamp"] for r in first]
+    return (
+        head + [r["timestamp"] for r in by_cursor],
+        head + [r["timestamp"] for r in by_offset],
+    )
+
+
+def test_cursor_pages_stable_when_new_rows_arrive():
+    by_cursor, by_offset = asyncio.run(paginate_with_inserts())
+
+    # Курсор продолжает ровно с места остановки
+    assert by_cursor == list(range(109, 101, -1))
+    # offset сдвигается на число новых записей и повторяет строки
+    assert len(set(by_offset)) < len(by_offset)
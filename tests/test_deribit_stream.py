@@ -0,0 +1,127 @@
+"""
+DeribitStreamClient против локального фейкового WebSocket-сервера
+"""
+
+import asyncio
+import json
+
+from aiohttp import web
+
+from clients import DeribitStreamClient, PriceData
+from src.config.settings import settings
+
+START_MS = 1_704_067_200_000  # 2024-01-01
+
+
+def tick(index_name: str, price, timestamp_ms: int) -> dict:
+    """Уведомление канала deribit_price_index.*"""
+    return {
+        "jsonrpc": "2.0",
+        "method": "subscription",
+        "params": {
+            "channel": f"deribit_price_index.{index_name}",
+            "data": {
+                "index_name": index_name,
+                "price": price,
+                "timestamp": timestamp_ms
+            }
+        }
+    }
+
+
+async def receive_json(ws: web.WebSocketResponse) -> dict:
+    return json.loads((await ws.receive()).data)
+
+
+async def run_scenario() -> tuple[list[list[dict]], list[PriceData], int]:
+    """
+    Первое соединение: подписка, heartbeat, битые кадры, тики, разрыв.
+    Второе (после переподключения): один тик.
+    """
+    connections: list[list[dict]] = []
+
+    async def handler(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        received: list[dict] = []
+        connections.append(received)
+
+        # public/set_heartbeat и public/subscribe
+        received.append(await receive_json(ws))
+        received.append(await receive_json(ws))
+
+        if len(connections) == 1:
+            await ws.send_json({
+                "jsonrpc": "2.0",
+                "method": "heartbeat",
+                "params": {"type": "test_request"}
+            })
+            received.append(await receive_json(ws))
+
+            await ws.send_str("not json")
+            await ws.send_json([1, 2, 3])
+            await ws.send_json({"jsonrpc": "2.0", "method": "subscription"})
+            await ws.send_json({"jsonrpc": "2.0", "method": "heartbeat"})
+            await ws.send_json(tick("btc_usd", "not a price", START_MS))
+            await ws.send_json(tick("sol_usd", 100.0, START_MS))
+            await ws.send_json(tick("btc_usd", 42000.5, START_MS))
+            await ws.close()
+        else:
+            await ws.send_json(tick("eth_usd", 2300.25, START_MS + 1000))
+            async for _ in ws:
+                pass
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/ws", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+
+    queue: asyncio.Queue[PriceData] = asyncio.Queue(maxsize=10)
+    client = DeribitStreamClient(
+        queue, ["BTC_USD", "ETH_USD"], url=f"http://{host}:{port}/ws"
+    )
+    task = asyncio.create_task(client.run())
+    try:
+        ticks = [
+            await asyncio.wait_for(queue.get(), timeout=5),
+            await asyncio.wait_for(queue.get(), timeout=5),
+        ]
+        # Клиент не упал на битых кадрах и продолжает работу
+        assert not task.done()
+    finally:
+        client.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await runner.cleanup()
+
+    return connections, ticks, queue.qsize()
+
+
+def test_stream_client_subscribes_parses_ticks_and_reconnects(monkeypatch):
+    monkeypatch.setattr(
+        settings.deribit, "DERIBIT_WS_RECONNECT_MIN_DELAY", 0.05
+    )
+
+    connections, ticks, left = asyncio.run(run_scenario())
+
+    assert len(connections) == 2
+    for received in connections:
+        assert received[0]["method"] == "public/set_heartbeat"
+        assert received[1]["method"] == "public/subscribe"
+        assert sorted(received[1]["params"]["channels"]) == [
+            "deribit_price_index.btc_usd",
+            "deribit_price_index.eth_usd",
+        ]
+    # Ответ на heartbeat test_request
+    assert connections[0][2]["method"] == "public/test"
+
+    assert ticks == [
+        PriceData(ticker="BTC_USD", price=42000.5, timestamp=1_704_067_200),
+        PriceData(ticker="ETH_USD", price=2300.25, timestamp=1_704_067_201),
+    ]
+    # Тик неподписанного тикера и битые кадры отброшены
+    assert left == 0
@@ -0,0 +1,65 @@
+"""
+MetricsMiddleware: метка route — шаблон маршрута вложенного роутера
+"""
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from metrics import HTTP_REQUEST_DURATION
+from middleware import MetricsMiddleware
+
+
+def build_app() -> FastAPI:
+    router = APIRouter(prefix="/v1/items")
+
+    @router.get("/{item_id}")
+    async def get_item(item_id: str) -> dict:
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def observed(method: str, status: str) -> dict[str, float]:
+    """Число наблюдений гистограммы длительности по маршрутам."""
+    counts = {}
+    for metric in HTTP_REQUEST_DURATION.collect():
+        for sample in metric.samples:
+            if (
+                sample.name.endswith("_count")
+                and sample.labels["method"] == method
+                and sample.labels["status"] == status
+            ):
+                counts[sample.labels["route"]] = sample.value
+    return counts
+
+
+def test_route_label_is_template():
+    client = TestClient(build_app())
+    before = observed("GET", "200")
+
+    assert client.get("/api/v1/items/a").status_code == 200
+    assert client.get("/api/v1/items/b").status_code == 200
+
+    # Один ряд на шаблон, а не на путь. Префикс include_router
+    # в scope["route"] зависит от версии FastAPI.
+    added = {
+        route: count - before.get(route, 0.0)
+        for route, count in observed("GET", "200").items()
+        if count != before.get(route, 0.0)
+    }
+    assert len(added) == 1
+    route, count = added.popitem()
+    assert route.endswith("/v1/items/{item_id}")
+    assert count == 2
+
+
+def test_unmatched_route():
+    client = TestClient(build_app())
+    before = observed("GET", "404").get("<unmatched>", 0.0)
+
+    assert client.get("/missing").status_code == 404
+
+    assert observed("GET", "404")["<unmatched>"] == before + 1
@@ -0,0 +1,140 @@
+"""
+LatestPriceCache.get_or_load: single-flight загрузка и отмена
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from schemas import PriceRecordResponse
+from services.latest_price_cache import LatestPriceCache
+
+
+def record(timestamp: int = 1_704_067_200) -> PriceRecordResponse:
+    return PriceRecordResponse(
+        ticker="BTC_USD",
+        id=uuid.uuid4(),
+        price=Decimal("42000"),
+        timestamp=timestamp,
+        created_at=datetime.now(timezone.utc)
+    )
+
+
+class Loader:
+    """Загрузка, ждущая release; считает вызовы."""
+
+    def __init__(self, result: PriceRecordResponse | None) -> None:
+        self.result = result
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> PriceRecordResponse | None:
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        return self.result
+
+
+def test_concurrent_waiters_share_one_load():
+    async def scenario():
+        cache = LatestPriceCache(ttl=60)
+        expected = record()
+        loader = Loader(expected)
+
+        tasks = [
+            asyncio.create_task(cache.get_or_load("BTC_USD", loader))
+            for _ in range(5)
+        ]
+        await loader.started.wait()
+        loader.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert loader.calls == 1
+        assert all(result is expected for result in results)
+        assert cache.get("BTC_USD") is expected
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_loader_does_not_cancel_waiters():
+    async def scenario():
+        cache = LatestPriceCache(ttl=60)
+        leader_loader = Loader(record())
+        expected = record()
+        waiter_loader = Loader(expected)
+        waiter_loader.release.set()
+
+        leader = asyncio.create_task(
+            cache.get_or_load("BTC_USD", leader_loader)
+        )
+        await leader_loader.started.wait()
+        waiter = asyncio.create_task(
+            cache.get_or_load("BTC_USD", waiter_loader)
+        )
+        await asyncio.sleep(0)
+
+        # Клиент загружающего запроса отключился
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        # Ожидающий повторил загрузку сам
+        assert await waiter is expected
+        assert waiter_loader.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_loader():
+    async def scenario():
+        cache = LatestPriceCache(ttl=60)
+        expected = record()
+        loader = Loader(expected)
+
+        leader = asyncio.create_task(cache.get_or_load("BTC_USD", loader))
+        await loader.started.wait()
+        waiter = asyncio.create_task(cache.get_or_load("BTC_USD", loader))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        loader.release.set()
+        assert await leader is expected
+        assert loader.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_loader_error_reaches_waiters():
+    async def scenario():
+        cache = LatestPriceCache(ttl=60)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def failing_loader():
+            started.set()
+            await release.wait()
+            raise ConnectionError("database is unavailable")
+
+        leader = asyncio.create_task(
+            cache.get_or_load("BTC_USD", failing_loader)
+        )
+        await started.wait()
+        waiter = asyncio.create_task(
+            cache.get_or_load("BTC_USD", failing_loader)
+        )
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(leader, waiter, return_exceptions=True)
+        assert all(isinstance(r, ConnectionError) for r in results)
+        # Следующий запрос загружает заново
+        assert "BTC_USD" not in cache._inflight
+
+    asyncio.run(scenario())
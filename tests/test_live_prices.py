@@ -0,0 +1,84 @@
+"""
+PriceBroadcaster: битые сообщения и непредвиденные ошибки
+не останавливают рассылку
+"""
+
+import asyncio
+
+import orjson
+
+from services import live_prices
+from services.live_prices import PriceBroadcaster
+
+
+class FakePubSub:
+    """Канал pub/sub: выдаёт сообщения соединения, затем ошибку или ждёт."""
+
+    def __init__(self, messages: list, error: Exception | None) -> None:
+        self._messages = messages
+        self._error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def subscribe(self, channel: str) -> None:
+        return None
+
+    async def listen(self):
+        for data in self._messages:
+            yield {"type": "message", "data": data}
+        if self._error is not None:
+            raise self._error
+        await asyncio.Event().wait()
+
+
+class FakeRedis:
+    """Redis.from_url: каждое соединение — следующий сценарий."""
+
+    connections: list[tuple[list, Exception | None]] = []
+
+    @classmethod
+    def from_url(cls, url: str) -> "FakeRedis":
+        return cls()
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(*self.connections.pop(0))
+
+    async def aclose(self) -> None:
+        return None
+
+
+def message(ticker) -> bytes:
+    return orjson.dumps({"ticker": ticker, "price": "42000"})
+
+
+def test_broadcaster_survives_bad_messages_and_errors(monkeypatch):
+    FakeRedis.connections = [
+        (
+            [b"not json", b"[1]", message({"nested": True}),
+             message("BTC_USD")],
+            RuntimeError("unexpected payload handling error")
+        ),
+        ([message("BTC_USD")], None),
+    ]
+    monkeypatch.setattr(live_prices, "Redis", FakeRedis)
+    broadcaster = PriceBroadcaster(
+        url="redis://fake", channel="prices", buffer_size=10,
+        reconnect_delay=0
+    )
+
+    async def scenario() -> list[bytes]:
+        async with broadcaster.subscribe(frozenset({"BTC_USD"})) as sub:
+            received = [
+                await asyncio.wait_for(sub.get(), 1) for _ in range(2)
+            ]
+        await broadcaster.close()
+        return received
+
+    received = asyncio.run(scenario())
+
+    assert received == [message("BTC_USD"), message("BTC_USD")]
+    assert not FakeRedis.connections
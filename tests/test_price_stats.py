@@ -0,0 +1,87 @@
+"""
+compute_price_stats: сводка и скользящие значения на краевых рядах
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from services.price_stats import SECONDS_PER_YEAR, compute_price_stats
+
+
+def series(timestamps, prices):
+    return (
+        np.asarray(timestamps, dtype=np.int64),
+        np.asarray(prices, dtype=np.float64),
+    )
+
+
+def test_empty_series():
+    assert compute_price_stats(*series([], []), window=3) == {
+        "count": 0, "summary": None, "points": []
+    }
+
+
+def test_flat_series():
+    stats = compute_price_stats(
+        *series(range(0, 600, 60), [100.0] * 10), window=3
+    )
+    summary = stats["summary"]
+
+    assert stats["count"] == 10
+    assert summary["total_return"] == 0.0
+    assert summary["mean_log_return"] == 0.0
+    assert summary["volatility"] == 0.0
+    assert summary["max_drawdown"] == 0.0
+    assert summary["twap"] == 100.0
+    # Первые window - 1 точек без скользящих значений
+    averages = [point["moving_average"] for point in stats["points"]]
+    assert all(math.isnan(v) for v in averages[:2])
+    assert averages[2:] == [100.0] * 8
+
+
+def test_two_points():
+    stats = compute_price_stats(*series([0, 60], [100.0, 110.0]), window=5)
+    summary = stats["summary"]
+
+    assert summary["total_return"] == pytest.approx(0.1)
+    assert summary["mean_log_return"] == pytest.approx(math.log(1.1))
+    # Для стандартного отклонения одной доходности мало
+    assert summary["volatility"] is None
+    # Первая цена действовала весь интервал
+    assert summary["twap"] == 100.0
+    assert summary["max_drawdown"] == 0.0
+
+
+def test_monotonic_drop_drawdown():
+    stats = compute_price_stats(
+        *series([0, 60, 120, 180], [100.0, 90.0, 80.0, 50.0]), window=2
+    )
+    summary = stats["summary"]
+
+    assert summary["max_drawdown"] == pytest.approx(-0.5)
+    assert summary["drawdown_peak_timestamp"] == 0
+    assert summary["drawdown_trough_timestamp"] == 180
+
+
+def test_annualization_uses_median_step():
+    prices = [100.0, 101.0, 99.0, 102.0]
+    stats = compute_price_stats(*series([0, 60, 120, 180], prices), window=2)
+
+    returns = np.diff(np.log(prices))
+    expected = returns.std(ddof=1) * math.sqrt(SECONDS_PER_YEAR / 60)
+    assert stats["summary"]["volatility"] == pytest.approx(expected)
+
+
+def test_zero_intervals():
+    # Все точки с одним timestamp: шаг 0, аннуализация не определена
+    stats = compute_price_stats(
+        *series([60] * 4, [100.0, 101.0, 99.0, 102.0]), window=2
+    )
+    summary = stats["summary"]
+
+    assert math.isnan(summary["volatility"])
+    assert all(math.isnan(point["volatility"]) for point in stats["points"])
+    # TWAP без длительностей — простое среднее
+    assert summary["twap"] == pytest.approx(100.5)
@@ -0,0 +1,147 @@
+"""
+PriceStreamWriter: повторы записи, буфер незаписанных тиков,
+ошибки обновления кэшей, дозапись очереди при остановке
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from clients import PriceData
+from services import price_stream_writer
+from services.price_stream_writer import PriceStreamWriter
+
+
+class FakePrices:
+    """Репозиторий цен: первые failures вызовов падают."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls: list[list[dict]] = []
+
+    async def save_many(self, rows):
+        self.calls.append(list(rows))
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("database is unavailable")
+        return [(row["ticker"], row["timestamp"]) for row in rows]
+
+
+class FakeService:
+    """Сервис цен с обновлением кэшей, которое может падать."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.refreshed: list = []
+
+    async def refresh_caches(self, records) -> None:
+        self.refreshed.append(records)
+        if self.fail:
+            raise RuntimeError("redis is unavailable")
+
+
+def build_writer(monkeypatch, prices, service, **kwargs):
+    """Писатель с подменённой сессией и UnitOfWork."""
+
+    @asynccontextmanager
+    async def session_factory():
+        yield None
+
+    class FakeUnitOfWork:
+        def __init__(self, session) -> None:
+            self.prices = prices
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info) -> None:
+            return None
+
+    monkeypatch.setattr(price_stream_writer, "UnitOfWork", FakeUnitOfWork)
+    queue: asyncio.Queue[PriceData] = asyncio.Queue(maxsize=100)
+    writer = PriceStreamWriter(
+        queue=queue,
+        session_factory=session_factory,  # type: ignore[arg-type]
+        batch_size=10,
+        flush_interval=0.01,
+        price_service=service,
+        retry_delay=0,
+        **kwargs
+    )
+    return queue, writer
+
+
+def tick(timestamp: int, price: float = 42000.0) -> PriceData:
+    return PriceData(ticker="BTC_USD", price=price, timestamp=timestamp)
+
+
+def test_write_is_retried(monkeypatch):
+    prices, service = FakePrices(failures=2), FakeService()
+    _, writer = build_writer(monkeypatch, prices, service, max_retries=3)
+
+    asyncio.run(writer._flush([tick(1), tick(2)]))
+
+    assert len(prices.calls) == 3
+    assert service.refreshed == [[("BTC_USD", 1), ("BTC_USD", 2)]]
+    assert not writer._pending
+
+
+def test_failed_batch_is_written_with_next_one(monkeypatch):
+    prices, service = FakePrices(failures=2), FakeService()
+    _, writer = build_writer(monkeypatch, prices, service, max_retries=1)
+
+    async def scenario() -> None:
+        await writer._flush([tick(1), tick(2, 1.0)])
+        assert len(writer._pending) == 2
+        assert not service.refreshed
+        # Повтор тика схлопывается до последней цены
+        await writer._flush([tick(2, 2.0), tick(3)])
+
+    asyncio.run(scenario())
+
+    last = prices.calls[-1]
+    assert [row["timestamp"] for row in last] == [1, 2, 3]
+    assert last[1]["price"] == 2.0
+    assert not writer._pending
+
+
+def test_pending_buffer_is_bounded(monkeypatch):
+    prices, service = FakePrices(failures=10), FakeService()
+    _, writer = build_writer(
+        monkeypatch, prices, service, max_retries=0, max_pending=3
+    )
+
+    asyncio.run(writer._flush([tick(ts) for ts in range(1, 6)]))
+
+    # Вытесняются самые старые
+    assert sorted(key[1] for key in writer._pending) == [3, 4, 5]
+
+
+def test_cache_refresh_error_keeps_write(monkeypatch):
+    prices, service = FakePrices(), FakeService(fail=True)
+    _, writer = build_writer(monkeypatch, prices, service)
+
+    asyncio.run(writer._flush([tick(1)]))
+
+    assert len(prices.calls) == 1
+    assert len(service.refreshed) == 1
+    assert not writer._pending
+
+
+def test_cancel_drains_queue(monkeypatch):
+    prices, service = FakePrices(), FakeService()
+    queue, writer = build_writer(monkeypatch, prices, service)
+
+    async def scenario() -> None:
+        task = asyncio.create_task(writer.run())
+        await queue.put(tick(1))
+        await asyncio.sleep(0.05)
+        # Писатель ждёт следующий тик; поступившее перед отменой
+        # дописывается без ожидания пачки
+        for ts in (2, 3):
+            queue.put_nowait(tick(ts))
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+    written = [row["timestamp"] for call in prices.calls for row in call]
+    assert written == [1, 2, 3]
@@ -0,0 +1,18 @@
+"""
+Импорт точек входа и сборка сервисов без внешних подключений
+"""
+
+from services import PriceService
+
+
+def test_celery_app_imports():
+    from celery_app import celery_app
+
+    schedule = celery_app.conf.beat_schedule
+    assert schedule["sync-instruments"]["schedule"] > 0
+
+
+def test_price_service_builds():
+    service = PriceService()
+
+    assert service._instrument_registry._ttl > 0
@@ -0,0 +1,21 @@
+"""
+Списки тикеров /latest/batch и /live: ошибки — 422, а не 500
+"""
+
+import pytest
+
+from schemas.requests import MAX_BATCH_TICKERS
+
+TOO_MANY = ",".join(f"T{i}_USD" for i in range(MAX_BATCH_TICKERS + 1))
+
+
+@pytest.mark.parametrize("path", [
+    "/v1/prices/latest/batch",
+    "/v1/prices/live",
+])
+@pytest.mark.parametrize("tickers", [",,", " , ", TOO_MANY])
+def test_invalid_ticker_list_is_422(client, path, tickers):
+    response = client.get(path, params={"tickers": tickers})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "tickers"]